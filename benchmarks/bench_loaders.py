@@ -0,0 +1,97 @@
+"""
+Benchmark cases for the data loaders and writers.
+
+Synthetic files of every supported format are generated in a directory once per size. Loader
+cases read the whole file, writer cases write the records through the stream terminals.
+Formats whose optional backend is not installed are skipped.
+"""
+import csv as _csv
+import gzip
+import importlib.util
+import json as _json
+import os
+import random
+
+from pystreamapi import Stream
+from pystreamapi.loaders import cached, csv, json, jsonl, toml, xml, yaml
+
+FIELDS = ["id", "name", "value", "active"]
+
+# Loader name -> (file name, backend module or None, loader function)
+LOADERS = {
+    "csv": ("data.csv", None, csv),
+    "csv_gzip": ("data.csv.gz", None, csv),
+    "json": ("data.json", "ijson", json),
+    "jsonl": ("data.jsonl", None, jsonl),
+    "xml": ("data.xml", "defusedxml", xml),
+    "yaml": ("data.yaml", "yaml", yaml),
+    "toml": ("data.toml", "tomlkit", toml),
+}
+
+
+def generate_rows(size, seed=42):
+    """Records with an int, a string, a float and a bool, the same for every run"""
+    rng = random.Random(seed)
+    return [{"id": i, "name": f"name-{rng.randrange(size)}", "value": round(rng.random() * 1000, 3),
+             "active": rng.random() < 0.5} for i in range(size)]
+
+
+def write_files(rows, directory):
+    """Write the rows in all formats to the directory"""
+    def path(name):
+        return os.path.join(directory, name)
+
+    with open(path("data.csv"), "w", encoding="utf-8", newline="") as file:
+        writer = _csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(path("data.csv"), "rb") as src, gzip.open(path("data.csv.gz"), "wb") as dst:
+        dst.write(src.read())
+    with open(path("data.json"), "w", encoding="utf-8") as file:
+        _json.dump(rows, file)
+    with open(path("data.jsonl"), "w", encoding="utf-8") as file:
+        file.writelines(_json.dumps(row) + "\n" for row in rows)
+    with open(path("data.xml"), "w", encoding="utf-8") as file:
+        file.write("<root>")
+        file.writelines("<item>" + "".join(f"<{k}>{v}</{k}>" for k, v in row.items()) + "</item>"
+                        for row in rows)
+        file.write("</root>")
+    with open(path("data.yaml"), "w", encoding="utf-8") as file:
+        file.writelines(f"- id: {row['id']}\n  name: {row['name']}\n  value: {row['value']}\n"
+                        f"  active: {str(row['active']).lower()}\n" for row in rows)
+    with open(path("data.toml"), "w", encoding="utf-8") as file:
+        file.writelines(f"[[item]]\nid = {row['id']}\nname = \"{row['name']}\"\n"
+                        f"value = {row['value']}\nactive = {str(row['active']).lower()}\n"
+                        for row in rows)
+
+
+def _consume(iterator):
+    for _ in iterator:
+        pass
+
+
+def cases(sizes, directory):
+    """Yield the (name, setup, run) benchmark cases for every loader, writer and size"""
+    for size in sizes:
+        size_directory = os.path.join(directory, str(size))
+        os.makedirs(size_directory, exist_ok=True)
+        write_files(generate_rows(size), size_directory)
+
+        for name, (file_name, backend, loader) in LOADERS.items():
+            if backend is not None and importlib.util.find_spec(backend) is None:
+                continue
+            path = os.path.join(size_directory, file_name)
+            yield (f"loaders/{name}/{size}", lambda p=path: p,
+                   lambda p, load=loader: _consume(load(p)))
+
+        csv_path = os.path.join(size_directory, "data.csv")
+        cache_dir = os.path.join(size_directory, "cache")
+        _consume(cached(csv, csv_path, cache_dir=cache_dir))
+        yield (f"loaders/cached_csv/{size}", lambda p=csv_path: p,
+               lambda p, c=cache_dir: _consume(cached(csv, p, cache_dir=c)))
+
+        records = list(csv(csv_path))
+        for writer in ("to_csv", "to_jsonl", "to_xml"):
+            out = os.path.join(size_directory, f"out.{writer[3:]}")
+            yield (f"writers/{writer}/{size}", lambda r=records: Stream.of(r),
+                   lambda s, w=writer, o=out: getattr(s, w)(o))
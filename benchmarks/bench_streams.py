@@ -0,0 +1,116 @@
+"""
+Benchmark cases for the intermediate and terminal operations of all stream implementations.
+
+Every case is a (name, setup, run) tuple. setup builds a fresh stream outside of the timed
+section and run applies the operation to it. Intermediate operations are followed by to_list()
+so that the lazy pipeline is executed.
+"""
+import random
+
+from pystreamapi import ErrorLevel
+from pystreamapi._streams.__parallel_stream import ParallelStream
+from pystreamapi._streams.__sequential_stream import SequentialStream
+from pystreamapi._streams.numeric.__parallel_numeric_stream import ParallelNumericStream
+from pystreamapi._streams.numeric.__sequential_numeric_stream import SequentialNumericStream
+
+STREAMS = [SequentialStream, ParallelStream, SequentialNumericStream, ParallelNumericStream]
+
+
+def _double(x):
+    return x * 2
+
+
+def _is_even(x):
+    return x % 2 == 0
+
+
+def _noop(_):
+    return None
+
+
+def intermediate_operations(size):
+    """Operations returning a stream, keyed by name"""
+    half = size // 2
+    return {
+        "concat": lambda s: s.concat(SequentialStream(range(size))),
+        "distinct": lambda s: s.distinct(),
+        "drop_while": lambda s: s.drop_while(lambda x: x < half),
+        "error_level": lambda s: s.error_level(ErrorLevel.IGNORE).map(_double),
+        "filter": lambda s: s.filter(_is_even),
+        "flat_map": lambda s: s.flat_map(lambda x: SequentialStream([x, x])),
+        "group_by": lambda s: s.group_by(lambda x: x % 10),
+        "limit": lambda s: s.limit(half),
+        "map": lambda s: s.map(_double),
+        "map_concurrent": lambda s: s.map_concurrent(_double, max_workers=4),
+        "map_to_float": lambda s: s.map_to_float(),
+        "map_to_int": lambda s: s.map_to_int(),
+        "map_to_str": lambda s: s.map_to_str(),
+        "numeric": lambda s: s.numeric(),
+        "parallel": lambda s: s.parallel().map(_double),
+        "peek": lambda s: s.peek(_noop),
+        "reversed": lambda s: s.reversed(),
+        "sequential": lambda s: s.sequential().map(_double),
+        "skip": lambda s: s.skip(half),
+        "sorted": lambda s: s.sorted(),
+        "take_while": lambda s: s.take_while(lambda x: x < half),
+    }
+
+
+def terminal_operations():
+    """Operations consuming a stream, keyed by name"""
+    return {
+        "all_match": lambda s: s.all_match(lambda x: x >= 0),
+        "any_match": lambda s: s.any_match(lambda x: x < 0),
+        "count": lambda s: s.count(),
+        "find_any": lambda s: s.find_any(),
+        "find_first": lambda s: s.find_first(),
+        "for_each": lambda s: s.for_each(_noop),
+        "max": lambda s: s.max(),
+        "min": lambda s: s.min(),
+        "none_match": lambda s: s.none_match(lambda x: x < 0),
+        "reduce": lambda s: s.reduce(lambda x, y: x + y),
+        "to_dict": lambda s: s.to_dict(lambda x: x % 10),
+        "to_list": lambda s: s.to_list(),
+        "to_set": lambda s: s.to_set(),
+        "to_tuple": lambda s: s.to_tuple(),
+    }
+
+
+def numeric_operations():
+    """Terminal operations of numeric streams, keyed by name"""
+    return {
+        "first_quartile": lambda s: s.first_quartile(),
+        "interquartile_range": lambda s: s.interquartile_range(),
+        "mean": lambda s: s.mean(),
+        "median": lambda s: s.median(),
+        "mode": lambda s: s.mode(),
+        "range": lambda s: s.range(),
+        "sum": lambda s: s.sum(),
+        "third_quartile": lambda s: s.third_quartile(),
+    }
+
+
+def _then_to_list(operation):
+    return lambda stream: operation(stream).to_list()
+
+
+def generate_data(size, seed=42):
+    """Integers in random order with duplicates, the same for every run"""
+    rng = random.Random(seed)
+    return [rng.randrange(size) for _ in range(size)]
+
+
+def cases(sizes):
+    """Yield the (name, setup, run) benchmark cases for every stream type and size"""
+    for size in sizes:
+        data = generate_data(size)
+        operations = {**{name: _then_to_list(op)
+                         for name, op in intermediate_operations(size).items()},
+                      **terminal_operations()}
+        for stream_type in STREAMS:
+            stream_operations = dict(operations)
+            if stream_type in (SequentialNumericStream, ParallelNumericStream):
+                stream_operations.update(numeric_operations())
+            for name, run in sorted(stream_operations.items()):
+                yield (f"streams/{stream_type.__name__}/{name}/{size}",
+                       lambda t=stream_type, d=data: t(list(d)), run)
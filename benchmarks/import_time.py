@@ -0,0 +1,63 @@
+"""
+Import time benchmark for pystreamapi.
+
+Measures the time of importing pystreamapi modules in fresh interpreters and reports which
+optional backends (joblib and the loader libraries) were imported along the way.
+
+Usage: python benchmarks/import_time.py [--repeat N] [--max-ms MS] [module ...]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = ["pystreamapi", "pystreamapi.loaders", "pystreamapi.conditions"]
+BACKENDS = ["joblib", "ijson", "defusedxml", "yaml", "tomlkit", "asyncio"]
+
+_MEASURE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "backends": [m for m in {backends!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module, repeat=10):
+    """Import the module in repeat fresh interpreters and return the times and loaded backends"""
+    times, backends = [], set()
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _MEASURE.format(module=module, backends=BACKENDS)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output)
+        times.append(result["ms"])
+        backends.update(result["backends"])
+    return {"median_ms": statistics.median(times), "min_ms": min(times),
+            "backends": sorted(backends)}
+
+
+def main(argv=None):
+    """Run the benchmark. Return 1 if a module takes longer than --max-ms to import"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="fail if the median import time of a module exceeds this")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules:
+        result = measure(module, args.repeat)
+        backends = ", ".join(result["backends"]) or "none"
+        print(f"{module:<30} median {result['median_ms']:8.2f} ms   "
+              f"min {result['min_ms']:8.2f} ms   backends: {backends}")
+        if args.max_ms is not None and result["median_ms"] > args.max_ms:
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
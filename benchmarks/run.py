@@ -0,0 +1,147 @@
+"""
+Benchmark suite for pystreamapi.
+
+Times every stream operation on all stream implementations, every loader and writer on
+synthetic files and the import time of the package. The results are written to a JSON file,
+which can be passed back with --compare to report regressions against it.
+
+Usage: python benchmarks/run.py [--sizes N ...] [--repeat N] [--only PREFIX ...]
+                                [--output FILE] [--compare BASELINE] [--threshold RATIO]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import bench_loaders
+import bench_streams
+import import_time
+
+import pystreamapi
+from pystreamapi._parallel.parallelizer import FREE_THREADED
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def measure(setup, run, repeat):
+    """Time run(setup()) repeat times, excluding the setup"""
+    times = []
+    for _ in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        run(argument)
+        times.append(time.perf_counter() - start)
+    return {"median_ms": statistics.median(times) * 1000, "min_ms": min(times) * 1000,
+            "repeat": repeat}
+
+
+def run_suite(sizes, repeat, only=None, progress=None):
+    """Run all benchmark cases whose name starts with one of the prefixes in only"""
+    def selected(name):
+        return not only or any(name.startswith(prefix) for prefix in only)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for cases in (bench_streams.cases(sizes), bench_loaders.cases(sizes, directory)):
+            for name, setup, run in cases:
+                if selected(name):
+                    results[name] = measure(setup, run, repeat)
+                    if progress:
+                        progress(name, results[name])
+    for module in import_time.DEFAULT_MODULES:
+        name = f"import/{module}"
+        if selected(name):
+            result = import_time.measure(module, repeat)
+            results[name] = {"median_ms": result["median_ms"], "min_ms": result["min_ms"],
+                             "repeat": repeat}
+            if progress:
+                progress(name, results[name])
+    return results
+
+
+def metadata():
+    """Describe the environment the benchmarks ran in"""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "free_threaded": FREE_THREADED,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "pystreamapi": getattr(pystreamapi, "__version__", None),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare the minimum times, which are the least noisy, with the baseline. Return
+    (rows, regressions), where a row is (name, baseline ms, current ms, ratio) and regressions
+    are the rows slower than threshold.
+    """
+    rows = []
+    for name, result in results.items():
+        if name in baseline:
+            before = baseline[name]["min_ms"]
+            ratio = result["min_ms"] / before if before else float("inf")
+            rows.append((name, before, result["min_ms"], ratio))
+    regressions = [row for row in rows if row[3] > 1 + threshold]
+    return rows, regressions
+
+
+def print_comparison(rows, threshold):
+    """Print the comparison as a table, with rich if it is installed"""
+    try:
+        # pylint: disable=import-outside-toplevel
+        from rich.console import Console
+        from rich.table import Table
+    except ImportError:
+        for name, before, after, ratio in rows:
+            flag = "  REGRESSION" if ratio > 1 + threshold else ""
+            print(f"{name:<60} {before:10.2f} ms {after:10.2f} ms {ratio:7.2f}x{flag}")
+        return
+    table = Table("benchmark", "baseline", "current", "change")
+    for name, before, after, ratio in rows:
+        style = "red" if ratio > 1 + threshold else "green" if ratio < 1 - threshold else None
+        table.add_row(name, f"{before:.2f} ms", f"{after:.2f} ms", f"{ratio:.2f}x", style=style)
+    Console().print(table)
+
+
+def main(argv=None):
+    """Run the benchmarks. Return 1 if --compare found a regression"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", metavar="PREFIX",
+                        help="run only the benchmarks whose name starts with a prefix, "
+                             "e.g. streams/ParallelStream or loaders/csv")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="results file of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="slowdown ratio above which a benchmark counts as a regression")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.repeat, args.only, progress=lambda name, result: print(
+        f"{name:<60} median {result['median_ms']:10.3f} ms   min {result['min_ms']:10.3f} ms",
+        file=sys.stderr))
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({"metadata": metadata(), "results": results}, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        rows, regressions = compare(results, baseline, args.threshold)
+        print_comparison(rows, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,26 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from pystreamapi.__stream import Stream
+from pystreamapi._cache.result_cache import ResultCache
 from pystreamapi._streams.error.__levels import ErrorLevel
 
+if TYPE_CHECKING:
+    # Defined here for type checkers and linters only, see __getattr__
+    from pystreamapi.__pipeline import Pipeline
+
 __version__ = "1.4.1"
-__all__ = ["Stream", "ErrorLevel"]
+__all__ = ["Stream", "Pipeline", "ErrorLevel", "ResultCache"]
+
+
+def __getattr__(name):
+    """Import Pipeline when it is accessed for the first time"""
+    if name != "Pipeline":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    pipeline = getattr(import_module("pystreamapi.__pipeline"), name)
+    globals()[name] = pipeline
+    return pipeline
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,298 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import defaultdict
+from functools import cmp_to_key
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from pystreamapi._cache.lru import CachedFunction
+from pystreamapi._itertools.tools import bounded_map, distinct, dropwhile, peek
+from pystreamapi._parallel.executors import default_thread_workers, get_thread_pool
+from pystreamapi._streams.__base_stream import BaseStream
+from pystreamapi._streams.__sequential_stream import SequentialStream
+from pystreamapi._streams.error.__error import ErrorHandler, _sentinel
+from pystreamapi._streams.error.__levels import ErrorLevel
+from pystreamapi._streams.numeric.__sequential_numeric_stream import SequentialNumericStream
+
+K = TypeVar('K')
+_V = TypeVar('_V')
+
+_Stage = Callable[[Iterable], Iterable]
+
+
+class Pipeline(Generic[K]):
+    """
+    A reusable sequence of intermediate operations without a source. Pipelines are built with
+    the same fluent API as streams, but every operation returns a new pipeline, so a pipeline
+    never changes once built.
+
+    On first use, a pipeline is compiled into a chain of iterator stages: operations at the
+    RAISE error level run on the built-in map, filter and itertools iterators, and adjacent
+    limit, skip and distinct operations are merged. Applying the compiled pipeline to a source
+    only chains these iterators, so it can be applied to many sources, also concurrently from
+    several threads.
+
+    The operations behave like those of a sequential stream. As in a stream, the last error
+    level applies to all operations of the pipeline.
+    """
+
+    def __init__(self):
+        self.__operations: Tuple[Tuple[str, tuple], ...] = ()
+        self.__compiled = None
+        self.__lock = threading.Lock()
+
+    def __add(self, name: str, *args) -> Pipeline:
+        pipeline = Pipeline()
+        # pylint: disable=unused-private-member
+        pipeline.__operations = self.__operations + ((name, args),)
+        return pipeline
+
+    def distinct(self) -> Pipeline[K]:
+        """Returns a pipeline that removes duplicate elements."""
+        return self.__add("distinct")
+
+    def drop_while(self, predicate: Callable[[K], bool]) -> Pipeline[K]:
+        """Returns a pipeline that drops the longest prefix of elements matching the predicate."""
+        return self.__add("drop_while", predicate)
+
+    def error_level(self, level: ErrorLevel, *exceptions) -> Pipeline[K]:
+        """
+        Sets the error level of the pipeline. If an exception is raised by an operation, the
+        error level determines what to do with the exception. The last error level applies to
+        all operations.
+        :param level: Error level from ErrorLevel
+        :param exceptions: Exceptions to ignore. If not provided, all exceptions will be ignored
+        """
+        return self.__add("error_level", level, exceptions)
+
+    def filter(self, predicate: Callable[[K], bool]) -> Pipeline[K]:
+        """Returns a pipeline that keeps the elements matching the predicate."""
+        return self.__add("filter", predicate)
+
+    def flat_map(self, mapper: Callable[[K], Iterable[_V]]) -> Pipeline[_V]:
+        """Returns a pipeline that replaces each element with the elements of mapper(element)."""
+        return self.__add("flat_map", mapper)
+
+    def group_by(self, key_mapper: Callable[[K], Any]) -> Pipeline[Tuple[Any, list]]:
+        """Returns a pipeline that groups the elements into (key, elements) tuples."""
+        return self.__add("group_by", key_mapper)
+
+    def limit(self, max_size: int) -> Pipeline[K]:
+        """Returns a pipeline that keeps at most the first max_size elements."""
+        return self.__add("limit", max_size)
+
+    def map(self, mapper: Callable[[K], _V]) -> Pipeline[_V]:
+        """Returns a pipeline that applies the mapper to each element."""
+        return self.__add("map", mapper)
+
+    def map_cached(self, mapper: Callable[[K], _V], maxsize: int = 1024,
+                   key: Callable[[K], Any] = None) -> Pipeline[_V]:
+        """
+        Returns a pipeline that applies the mapper to each element, like BaseStream.map_cached.
+        The cache is shared by all sources the pipeline is applied to.
+        """
+        return self.__add("map_cached", mapper, maxsize, key)
+
+    def map_concurrent(self, mapper: Callable[[K], _V], max_workers: int = None,
+                       ordered=True) -> Pipeline[_V]:
+        """
+        Returns a pipeline that applies the mapper to the elements on the shared thread pool,
+        like BaseStream.map_concurrent.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("There must be at least one worker")
+        return self.__add("map_concurrent", mapper, max_workers, ordered)
+
+    def map_to_float(self) -> Pipeline[float]:
+        """Returns a pipeline that converts the elements to floats."""
+        return self.__add("map_to_float")
+
+    def map_to_int(self) -> Pipeline[int]:
+        """Returns a pipeline that converts the elements to integers."""
+        return self.__add("map_to_int")
+
+    def map_to_str(self) -> Pipeline[str]:
+        """Returns a pipeline that converts the elements to strings."""
+        return self.__add("map_to_str")
+
+    def peek(self, action: Callable[[K], Any]) -> Pipeline[K]:
+        """Returns a pipeline that performs the action on each element as it passes."""
+        return self.__add("peek", action)
+
+    def reversed(self) -> Pipeline[K]:
+        """Returns a pipeline that reverses the order of the elements."""
+        return self.__add("reversed")
+
+    def skip(self, n: int) -> Pipeline[K]:
+        """Returns a pipeline that discards the first n elements."""
+        if n < 0:
+            raise ValueError("The number of elements to skip must not be negative")
+        return self.__add("skip", n)
+
+    def sorted(self, comparator: Callable[[K, K], int] = None) -> Pipeline[K]:
+        """Returns a pipeline that sorts the elements, by the comparator if given."""
+        return self.__add("sorted", comparator)
+
+    def take_while(self, predicate: Callable[[K], bool]) -> Pipeline[K]:
+        """Returns a pipeline that keeps the longest prefix of elements matching the predicate."""
+        return self.__add("take_while", predicate)
+
+    def apply(self, source: Iterable) -> Iterator[K]:
+        """Returns a lazy iterator over the results of the pipeline applied to the source."""
+        iterable = source
+        for stage in self.compile()[0]:
+            iterable = stage(iterable)
+        return iter(iterable)
+
+    __call__ = apply
+
+    def stream(self, source: Iterable) -> BaseStream[K]:
+        """
+        Returns a sequential stream over the results of the pipeline applied to the source, for
+        using any terminal operation. It is a numeric stream after map_to_int or map_to_float.
+        """
+        numeric = self.compile()[1]
+        return (SequentialNumericStream if numeric else SequentialStream)(self.apply(source))
+
+    def to_list(self, source: Iterable) -> list:
+        """Applies the pipeline to the source and accumulates the results into a List."""
+        return list(self.apply(source))
+
+    def compile(self) -> Tuple[Tuple[_Stage, ...], bool]:
+        """
+        Compiles the pipeline into its iterator stages, once. Returns the stages and whether
+        the pipeline produces numbers.
+        """
+        if self.__compiled is None:
+            with self.__lock:
+                if self.__compiled is None:
+                    self.__compiled = _compile(_optimize(self.__operations))
+        return self.__compiled
+
+    def __repr__(self):
+        return f"Pipeline({' -> '.join(name for name, _ in self.__operations)})"
+
+
+def _optimize(operations: Tuple[Tuple[str, tuple], ...]) -> list:
+    """Merges adjacent limit, skip and distinct operations and drops skip(0)."""
+    optimized = []
+    for name, args in operations:
+        previous = optimized[-1] if optimized else (None, ())
+        if name == "skip" and args[0] == 0:
+            continue
+        if name == previous[0] == "limit":
+            optimized[-1] = ("limit", (min(previous[1][0], args[0]),))
+        elif name == previous[0] == "skip":
+            optimized[-1] = ("skip", (previous[1][0] + args[0],))
+        elif name == previous[0] == "distinct":
+            continue
+        else:
+            optimized.append((name, args))
+    return optimized
+
+
+def _compile(operations: list) -> Tuple[Tuple[_Stage, ...], bool]:
+    """Translates the operations into functions creating the iterator of each stage."""
+    handler = _handler([args for name, args in operations if name == "error_level"])
+    numeric = False
+    stages = []
+    for name, args in operations:
+        if name == "error_level":
+            continue
+        if name in ("map_to_int", "map_to_float", "map_to_str"):
+            numeric = name != "map_to_str"
+            name, args = "map", ({"map_to_int": int, "map_to_float": float,
+                                  "map_to_str": str}[name],)
+        elif name == "map_cached":
+            numeric = False
+            name, args = "map", (CachedFunction(*args),)
+        elif name in ("map", "flat_map", "group_by", "map_concurrent"):
+            numeric = False
+        stages.append(_stage(name, args, handler))
+    return tuple(stages), numeric
+
+
+def _handler(error_levels: list) -> Optional[ErrorHandler]:
+    """Creates the error handler of the last error level, or None at the RAISE level."""
+    if not error_levels or error_levels[-1][0] == ErrorLevel.RAISE:
+        return None
+    level, exceptions = error_levels[-1]
+    handler = ErrorHandler()
+    handler._error_level(level, *exceptions)
+    return handler
+
+
+def _stage(name: str, args: tuple, handler: ErrorHandler) -> _Stage:
+    """Creates the stage function for one operation. handler is None at the RAISE level."""
+    # pylint: disable=too-many-return-statements,too-many-branches
+    if name == "map":
+        mapper = args[0]
+        if handler is None:
+            return lambda source: map(mapper, source)
+        return lambda source: handler._itr(source, mapper=mapper)
+    if name == "filter":
+        predicate = args[0]
+        if handler is None:
+            return lambda source: filter(predicate, source)
+        return lambda source: handler._itr(source, condition=predicate)
+    if name == "flat_map":
+        mapper = args[0]
+        if handler is None:
+            return lambda source: itertools.chain.from_iterable(map(mapper, source))
+        return lambda source: itertools.chain.from_iterable(handler._itr(source, mapper=mapper))
+    if name == "peek":
+        action = args[0]
+        if handler is None:
+            return lambda source: peek(source, action)
+        return lambda source: peek(source, lambda item: handler._one(mapper=action, item=item))
+    if name == "drop_while":
+        predicate = args[0]
+        if handler is None:
+            return lambda source: itertools.dropwhile(predicate, source)
+        return lambda source: dropwhile(predicate, source, handler)
+    if name == "take_while":
+        return lambda source: itertools.takewhile(args[0], source)
+    if name == "limit":
+        return lambda source: itertools.islice(source, max(args[0], 0))
+    if name == "skip":
+        return lambda source: itertools.islice(source, args[0], None)
+    if name == "distinct":
+        return distinct
+    if name == "sorted":
+        key = cmp_to_key(args[0]) if args[0] is not None else None
+        return lambda source: _deferred(lambda: sorted(source, key=key))
+    if name == "reversed":
+        return lambda source: _deferred(lambda: reversed(list(source)))
+    if name == "group_by":
+        return lambda source: _deferred(lambda: _group(source, args[0], handler).items())
+    return _concurrent_stage(*args, handler)
+
+
+def _concurrent_stage(mapper, max_workers, ordered, handler: ErrorHandler) -> _Stage:
+    """Creates the stage function of map_concurrent."""
+    workers = max_workers or default_thread_workers()
+    function = mapper if handler is None else \
+        lambda item: handler._one(mapper=mapper, item=item)
+
+    def stage(source):
+        results = bounded_map(get_thread_pool(workers), function, source, 2 * workers, ordered)
+        return (result for result in results if result is not _sentinel)
+
+    return stage
+
+
+def _deferred(materialize: Callable[[], Iterable]):
+    """Generator that materializes the iterable only when the first element is requested."""
+    yield from materialize()
+
+
+def _group(source: Iterable, key_mapper: Callable, handler: ErrorHandler) -> dict:
+    """Groups the elements of the source by their key."""
+    groups = defaultdict(list)
+    for item in source:
+        key = key_mapper(item) if handler is None else handler._one(mapper=key_mapper, item=item)
+        if key is not _sentinel:
+            groups[key].append(item)
+    return groups
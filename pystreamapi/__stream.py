@@ -1,6 +1,7 @@
 import itertools
 from collections.abc import Sized
-from typing import Iterable, TypeVar, Callable, Optional, overload, Union, Generator
+from typing import Iterable, TypeVar, Callable, Optional, overload, Union, Generator, \
+    AsyncIterable, TYPE_CHECKING
 
 from pystreamapi.__iterate import iterate
 from pystreamapi._streams.__base_stream import BaseStream
@@ -9,6 +10,9 @@ from pystreamapi._streams.__sequential_stream import SequentialStream
 from pystreamapi._streams.numeric.__numeric_base_stream import NumericBaseStream
 from pystreamapi._streams.numeric.__sequential_numeric_stream import SequentialNumericStream
 
+if TYPE_CHECKING:
+    from pystreamapi._streams.__async_stream import AsyncStream
+
 _K = TypeVar('_K')
 
 
@@ -89,6 +93,18 @@ class Stream:
         """
         return SequentialStream(source)
 
+    @staticmethod
+    def async_of(source: Union[Iterable[_K], AsyncIterable[_K]]) -> 'AsyncStream[_K]':
+        """
+        Create an asynchronous stream from a sync or async iterable. Its operations accept
+        coroutine functions and its terminal operations have to be awaited.
+
+        :param source:
+        """
+        # pylint: disable=import-outside-toplevel
+        from pystreamapi._streams.__async_stream import AsyncStream
+        return AsyncStream(source)
+
     @staticmethod
     def concat(*streams: "BaseStream[_K]"):
         """
@@ -1,4 +1,6 @@
 # pylint: disable=protected-access
+from typing import Tuple
+
 from pystreamapi._streams.__base_stream import BaseStream
 from pystreamapi._streams.__parallel_stream import ParallelStream
 from pystreamapi._streams.__sequential_stream import SequentialStream
@@ -42,6 +44,23 @@ class StreamConverter:
         stream._set_implementation_explicit()
         return stream
 
+    @staticmethod
+    def explain_implementation(stream: BaseStream) -> Tuple[str, str]:
+        """
+        Returns the name of the implementation choose_implementation will pick for the stream
+        and the reason for it, without converting the stream.
+        """
+        name = type(stream).__name__
+        if stream._implementation_explicit:
+            return name, "chosen explicitly with parallel() or sequential()"
+        if isinstance(stream, ParallelStream):
+            return name, "created as a parallel stream"
+        if stream._is_parallelism_recommended():
+            parallel = (ParallelNumericStream if isinstance(stream, NumericBaseStream)
+                        else ParallelStream)
+            return parallel.__name__, f"parallelism recommended: {stream._parallelism_reason()}"
+        return name, f"parallelism not recommended: {stream._parallelism_reason()}"
+
     @staticmethod
     def choose_implementation(stream: BaseStream) -> BaseStream:
         """
@@ -0,0 +1,143 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+_missing = object()
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory used by a value in bytes: its own size plus the size of the elements of
+    collections, one level deep.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+class LRUCache:  # pylint: disable=too-many-instance-attributes
+    """
+    Thread-safe cache evicting the least recently used entries. Besides the number of entries,
+    the cache can be bounded by the age of the entries (ttl in seconds) and their total size in
+    bytes as estimated by sizeof.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None, sizeof: Callable[[Any], int] = estimate_size):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.__sizeof = sizeof
+        self.__bytes = 0
+        # key -> (value, expiry time, size)
+        self.__entries: OrderedDict[Hashable, Tuple[Any, float, int]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable, default=None):
+        """Get the value of the key and mark it as recently used. Counts a hit or a miss."""
+        with self.__lock:
+            entry = self.__entries.get(key, _missing)
+            if entry is not _missing and entry[1] <= time.monotonic():
+                self.__remove(key)
+                entry = _missing
+            if entry is _missing:
+                self.misses += 1
+                return default
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Store the value and evict the least recently used entries beyond the bounds. Values
+        larger than max_bytes are not stored.
+        """
+        if self.maxsize == 0:
+            return
+        size = self._entry_size(key, value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+            self.__entries[key] = (value, expiry, size)
+            self.__bytes += size
+            while (self.maxsize is not None and len(self.__entries) > self.maxsize) or \
+                    (self.max_bytes is not None and self.__bytes > self.max_bytes):
+                self.__remove(next(iter(self.__entries)))
+
+    def clear(self):
+        """Remove all entries and reset the statistics"""
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+            self.hits = self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the lookups that found a value, 0.0 before the first lookup"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated total size of the values if the cache has a memory bound, otherwise 0"""
+        return self.__bytes
+
+    def _entry_size(self, key: Hashable, value: Any) -> int:  # pylint: disable=unused-argument
+        """Estimated size of an entry in bytes"""
+        return self.__sizeof(value)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key: Hashable):
+        with self.__lock:
+            entry = self.__entries.get(key, _missing)
+            return entry is not _missing and entry[1] > time.monotonic()
+
+    def __remove(self, key: Hashable):
+        """Remove an entry. The lock must be held."""
+        self.__bytes -= self.__entries.pop(key)[2]
+
+    def __getstate__(self):
+        # Locks cannot be pickled, e.g. when joblib sends a stream to worker processes
+        state = self.__dict__.copy()
+        del state["_LRUCache__lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+
+class CachedFunction:
+    """
+    Function of one argument memoized in an LRUCache. The cache key is the argument or
+    key(argument). Concurrent calls with the same uncached key may all call the function.
+    """
+
+    def __init__(self, function: Callable[[Any], Any], maxsize: Optional[int] = 1024,
+                 key: Callable[[Any], Hashable] = None):
+        self.function = function
+        self.key = key
+        self.cache = LRUCache(maxsize)
+        self.__name__ = getattr(function, "__name__", type(function).__name__)
+
+    def __call__(self, item):
+        key = self.key(item) if self.key is not None else item
+        value = self.cache.get(key, _missing)
+        if value is _missing:
+            value = self.function(item)
+            self.cache.put(key, value)
+        return value
@@ -0,0 +1,109 @@
+import copy
+import weakref
+from typing import Any, Hashable, Iterable, Optional
+
+from pystreamapi._cache.lru import LRUCache, estimate_size
+from pystreamapi._lazy.process import Process
+
+
+class _Identity:
+    """
+    Key part comparing a value by identity. Values supporting weak references are referenced
+    weakly, so a cached key does not keep them alive. Once such a value is collected, the key no
+    longer equals any other key, so a new object reusing its id cannot match it. Other values
+    are referenced strongly.
+    """
+
+    __slots__ = ("__id", "__ref", "__value")
+
+    def __init__(self, value: Any):
+        self.__id = id(value)
+        try:
+            self.__ref, self.__value = weakref.ref(value), None
+        except TypeError:
+            self.__ref, self.__value = None, value
+
+    @property
+    def value(self) -> Any:
+        """The value, or None once a weakly referenced value was collected"""
+        return self.__ref() if self.__ref is not None else self.__value
+
+    @property
+    def is_weak(self) -> bool:
+        """Whether the value is referenced weakly"""
+        return self.__ref is not None
+
+    def __reduce__(self):
+        # Weak references cannot be pickled. A copy of the value never equals the original.
+        return _Identity, (self.value,)
+
+    def __hash__(self):
+        return self.__id
+
+    def __eq__(self, other):
+        if not isinstance(other, _Identity) or hash(other) != self.__id:
+            return False
+        value = self.value
+        return value is not None and other.value is value
+
+
+def _freeze(value: Any) -> Hashable:
+    """Make a value usable in a key. Unhashable values are compared by identity."""
+    if isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(value)
+    return value
+
+
+def _strong_references(key: Hashable):
+    """Yield the values the key references strongly"""
+    if isinstance(key, tuple):
+        for part in key:
+            yield from _strong_references(part)
+    elif isinstance(key, _Identity) and not key.is_weak:
+        yield key.value
+
+
+class ResultCache(LRUCache):
+    """
+    Cache for the results of terminal operations, see BaseStream.cache(). Results are keyed by
+    the pipeline (its operations and the arguments of the terminal operation, callables by
+    identity) and by the source: its identity, an explicit key and/or the version of the source.
+    Entries are evicted by least recent use, age (ttl in seconds) and their estimated total size
+    (max_bytes). Sources and arguments the keys keep alive count towards the size.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        super().__init__(maxsize, ttl, max_bytes)
+
+    @staticmethod
+    def make_key(source: Iterable, processes: Iterable[Process], terminal: str, args: tuple,
+                 kwargs: dict, key: Hashable = None, version: Hashable = None) -> Hashable:
+        """
+        Get the cache key of a terminal operation. Without a key and a version, the source is
+        compared by identity, so changes to a mutable source are not detected.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        pipeline = (tuple(_freeze(process.fingerprint()) for process in processes),
+                    _freeze(args), _freeze(tuple(sorted(kwargs.items()))))
+        if key is None and version is None:
+            source_part = _Identity(source)
+        else:
+            source_part = ("key", _freeze(key), "version", _freeze(version))
+        return terminal, pipeline, source_part
+
+    def _entry_size(self, key: Hashable, value: Any) -> int:
+        return super()._entry_size(key, value) + \
+            sum(estimate_size(part) for part in _strong_references(key))
+
+    @staticmethod
+    def copy_result(result: Any) -> Any:
+        """Copy results deeply, so that changing a returned result does not change the cache"""
+        return copy.deepcopy(result)
+
+
+shared_cache = ResultCache()
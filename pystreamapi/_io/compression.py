@@ -0,0 +1,82 @@
+import contextlib
+import importlib
+import io
+import os
+
+COMPRESSIONS = ('gzip', 'bz2', 'lzma', 'zstd')
+
+_EXTENSIONS = {
+    '.gz': 'gzip', '.gzip': 'gzip', '.bz2': 'bz2', '.xz': 'lzma', '.lzma': 'lzma',
+    '.zst': 'zstd', '.zstd': 'zstd',
+}
+
+_MAGIC_NUMBERS = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'lzma'),
+    (b'\x5d\x00\x00', 'lzma'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+
+
+def compression_from_extension(file_path: str):
+    """Get the compression of a file from its extension or None if it is not a known one"""
+    return _EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+
+
+def detect_compression(file_path: str):
+    """
+    Detect the compression of a file from its extension or, if the extension is unknown, from its
+    magic bytes. Returns 'gzip', 'bz2', 'lzma', 'zstd' or None if it is not compressed.
+    """
+    compression = compression_from_extension(file_path)
+    if compression is not None:
+        return compression
+    # skipcq: PTC-W6004
+    with open(file_path, mode='rb') as file:
+        header = file.read(6)
+    return next(
+        (compression for magic, compression in _MAGIC_NUMBERS if header[:len(magic)] == magic),
+        None
+    )
+
+
+def open_text(file_path: str, mode='r', encoding='utf-8', newline=None, compression=None):
+    """
+    Open a file in text mode ('r', 'w' or 'a'), compressed with the given compression (one of
+    COMPRESSIONS) or uncompressed if it is None. Compressed files are (de)compressed on the fly
+    and files made of several concatenated members are read to the end.
+    """
+    if compression is None:
+        # pylint: disable=consider-using-with
+        return open(file_path, mode=mode, encoding=encoding, newline=newline)
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression {compression!r}, use one of {COMPRESSIONS}")
+    if compression == 'zstd':
+        return _open_zstd(file_path, mode, encoding, newline)
+    module = importlib.import_module(compression)
+    return module.open(file_path, mode=f'{mode}t', encoding=encoding, newline=newline)
+
+
+def _open_zstd(file_path, mode, encoding, newline):
+    """Open a zstd compressed file in text mode with compression.zstd or zstandard"""
+    # pylint: disable=import-outside-toplevel
+    with contextlib.suppress(ImportError):
+        from compression import zstd
+        return zstd.open(file_path, mode=f'{mode}t', encoding=encoding, newline=newline)
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError(
+            "Please install the zstd extra dependency to use zstd compressed files."
+        ) from exc
+    # pylint: disable=consider-using-with
+    if mode == 'r':
+        stream = zstandard.ZstdDecompressor().stream_reader(
+            open(file_path, mode='rb'), read_across_frames=True, closefd=True
+        )
+    else:
+        stream = zstandard.ZstdCompressor().stream_writer(
+            open(file_path, mode=f'{mode}b'), closefd=True
+        )
+    return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
@@ -0,0 +1,100 @@
+import asyncio
+from collections import deque
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Union
+
+
+def async_iter(source: Union[Iterable, AsyncIterable]) -> AsyncIterator:
+    """Get an async iterator over a sync or async iterable."""
+    if hasattr(source, '__aiter__'):
+        return aiter(source)
+    return _iterate(source)
+
+
+async def _iterate(iterable: Iterable):
+    """Async generator wrapper around a sync iterable."""
+    for item in iterable:
+        yield item
+
+
+async def concurrent_map(function: Callable[..., Awaitable], iterable: AsyncIterable,
+                         max_concurrency: int, ordered=True):
+    """
+    Async generator wrapper that applies a coroutine function to every item of the iterable.
+    Up to max_concurrency calls run concurrently and the iterable is consumed only as fast as
+    results are taken. If ordered, the results are yielded in the order of the iterable,
+    otherwise as soon as they are available.
+    """
+    if max_concurrency < 1:
+        raise ValueError("The concurrency must be at least one")
+    pending = deque() if ordered else set()
+    try:
+        async for item in iterable:
+            if ordered:
+                pending.append(asyncio.ensure_future(function(item)))
+                if len(pending) >= max_concurrency:
+                    yield await pending.popleft()
+            else:
+                pending.add(asyncio.ensure_future(function(item)))
+                if len(pending) >= max_concurrency:
+                    done, pending = await asyncio.wait(pending,
+                                                       return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+        while pending:
+            if ordered:
+                yield await pending.popleft()
+            else:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def flat_map(iterable: AsyncIterable):
+    """Async generator wrapper that flattens iterables and async iterables."""
+    async for items in iterable:
+        async for item in async_iter(items):
+            yield item
+
+
+async def peek(iterable: AsyncIterable, action: Callable[..., Awaitable]):
+    """
+    Async generator wrapper that awaits a coroutine function for every item of the iterable and
+    yields the item unchanged.
+    """
+    async for item in iterable:
+        await action(item)
+        yield item
+
+
+async def distinct(iterable: AsyncIterable):
+    """Async generator wrapper that returns unique elements from the iterable."""
+    seen = set()
+    async for item in iterable:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+
+async def limit(iterable: AsyncIterable, max_nr: int):
+    """Async generator wrapper that returns the first n elements of the iterable."""
+    if max_nr <= 0:
+        return
+    count = 0
+    async for item in iterable:
+        yield item
+        count += 1
+        if count >= max_nr:
+            break
+
+
+async def skip(iterable: AsyncIterable, n: int):
+    """Async generator wrapper that skips the first n elements of the iterable."""
+    count = 0
+    async for item in iterable:
+        if count >= n:
+            yield item
+        count += 1
@@ -0,0 +1,117 @@
+import pickle
+import threading
+import weakref
+from collections import deque
+from typing import Iterable, Iterator, List, Tuple
+
+_exhausted = object()
+
+
+class SpillingTee:  # pylint: disable=too-many-instance-attributes
+    """
+    Splits an iterable into n iterators reading it in a single pass. Elements are buffered once
+    for all iterators until the slowest one has read them. At most buffer_size elements are kept
+    in memory; older elements that are still needed are pickled to a temporary file in
+    spill_dir and read back from there. The iterators can be consumed from different threads.
+    The spill file is closed once all iterators are exhausted or closed, or when the tee is
+    garbage collected.
+    """
+
+    def __init__(self, iterable: Iterable, n: int = 2, buffer_size: int = 10_000,
+                 spill_dir: str = None):
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self.__source = iter(iterable)
+        self.__buffer_size = buffer_size
+        self.__spill_dir = spill_dir
+        self.__positions = [0] * n
+        # Elements with index memory_start and above are in memory, elements with index
+        # spill_start up to memory_start are in the spill file at the offsets
+        self.__memory = deque()
+        self.__memory_start = 0
+        self.__spill_file = None
+        self.__close_spill_file = None
+        self.__spill_start = 0
+        self.__spill_offsets: List[int] = []
+        self.__lock = threading.Lock()
+        self.__iterators = tuple(self.__consume(i) for i in range(n))
+
+    @property
+    def iterators(self) -> Tuple[Iterator, ...]:
+        """The iterators over the elements of the iterable"""
+        return self.__iterators
+
+    @property
+    def spilled(self) -> int:
+        """Number of elements currently in the spill file"""
+        return len(self.__spill_offsets)
+
+    def __consume(self, consumer: int):
+        """Generator yielding the elements for one consumer"""
+        try:
+            while True:
+                with self.__lock:
+                    item = self.__next(consumer)
+                if item is _exhausted:
+                    return
+                yield item
+        finally:
+            with self.__lock:
+                # A closed or finished consumer no longer holds back the buffer
+                self.__positions[consumer] = float("inf")
+                self.__release()
+
+    def __next(self, consumer: int):
+        """Get the next element for the consumer. The lock must be held."""
+        position = self.__positions[consumer]
+        end = self.__memory_start + len(self.__memory)
+        if position == end:
+            item = next(self.__source, _exhausted)
+            if item is _exhausted:
+                return item
+            self.__append(item)
+        elif position < self.__memory_start:
+            item = self.__read_spilled(position)
+        else:
+            item = self.__memory[position - self.__memory_start]
+        self.__positions[consumer] = position + 1
+        self.__release()
+        return item
+
+    def __append(self, item):
+        """Buffer a new element and move the oldest ones to the spill file if necessary"""
+        self.__memory.append(item)
+        while len(self.__memory) > self.__buffer_size:
+            self.__spill(self.__memory.popleft())
+            self.__memory_start += 1
+
+    def __spill(self, item):
+        """Append the element with index memory_start to the spill file"""
+        if self.__spill_file is None:
+            import tempfile  # pylint: disable=import-outside-toplevel
+            self.__spill_file = tempfile.TemporaryFile(dir=self.__spill_dir)
+            # Iterators that are never started or are abandoned do not release the buffer
+            self.__close_spill_file = weakref.finalize(self, self.__spill_file.close)
+            self.__spill_start = self.__memory_start
+            self.__spill_offsets = []
+        self.__spill_file.seek(0, 2)
+        self.__spill_offsets.append(self.__spill_file.tell())
+        pickle.dump(item, self.__spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def __read_spilled(self, position: int):
+        """Read the element at the position from the spill file"""
+        self.__spill_file.seek(self.__spill_offsets[position - self.__spill_start])
+        return pickle.load(self.__spill_file)
+
+    def __release(self):
+        """Drop the buffered elements all consumers have read"""
+        slowest = min(self.__positions)
+        while self.__memory and self.__memory_start < slowest:
+            self.__memory.popleft()
+            self.__memory_start += 1
+        if self.__spill_file is not None and slowest >= self.__memory_start:
+            self.__close_spill_file()
+            self.__spill_file = None
+            self.__spill_offsets = []
@@ -1,8 +1,14 @@
 # pylint: disable=protected-access
-from typing import Iterable, Optional
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Optional, TYPE_CHECKING
 
 from pystreamapi._streams.error.__error import ErrorHandler, _sentinel
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 
 def dropwhile(predicate, iterable, handler: Optional[ErrorHandler] = None):
     """
@@ -87,3 +93,53 @@ def flat_map(iterable: Iterable):
     """Generator wrapper that flattens the Stream iterable."""
     for stream in iterable:
         yield from stream.to_list()
+
+
+def batched(iterable: Iterable, size: int):
+    """Generator wrapper that groups the items of the iterable into lists of the given size."""
+    if size < 1:
+        raise ValueError("The batch size must be at least one")
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def bounded_map(executor: Executor, function, iterable: Iterable, max_in_flight: int,
+                ordered=True):
+    """
+    Generator wrapper that applies a function to every item of the iterable on an executor.
+    At most max_in_flight calls are pending at any time, so the iterable is consumed only as
+    fast as results are taken. If ordered, results are yielded in the order of the iterable,
+    otherwise as soon as they are completed.
+    """
+    if max_in_flight < 1:
+        raise ValueError("There must be at least one task in flight")
+    # Imported here to keep concurrent.futures out of the import of pystreamapi
+    from concurrent.futures import FIRST_COMPLETED, wait  # pylint: disable=import-outside-toplevel
+    pending = deque() if ordered else set()
+    try:
+        for item in iterable:
+            future = executor.submit(function, item)
+            if ordered:
+                pending.append(future)
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            else:
+                pending.add(future)
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from (future.result() for future in done)
+        while pending:
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+    finally:
+        for future in pending:
+            future.cancel()
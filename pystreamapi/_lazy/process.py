@@ -4,23 +4,53 @@ from typing import Callable
 class Process:
     """Represents a Callable with arguments to pass in. Used with the Queue"""
 
-    def __init__(self, work: Callable, arg=None):
+    def __init__(self, work: Callable, arg=None, name: str = None):
         """
         The class representing a function to be executed lazy.
 
         :param work: the function or executable (normally with object)
         :param arg: the argument to be passed to the function
+        :param name: the name of the operation. Defaults to the name of work without the
+            leading underscores and name mangling
         """
         self.__work = work
         self.__arg = arg
+        self.name = name or work.__name__.rsplit("__", 1)[-1].lstrip("_")
 
-    def exec(self):
-        """Run the callable in the process"""
-        if self.__arg is not None:
-            self.__work(self.__arg)
+    def exec(self, wrap: Callable[[Callable], Callable] = None):
+        """
+        Run the callable in the process. If wrap is given, the callables in the argument are
+        replaced with wrap(callable) for this run only, e.g. to time them.
+        """
+        arg = self.__arg if wrap is None else self.__wrapped(wrap)
+        if arg is not None:
+            self.__work(arg)
         else:
             self.__work()
 
+    def describe(self) -> str:
+        """Describe the process as its name and arguments, e.g. filter(is_even)"""
+        def describe_arg(arg):
+            if callable(arg):
+                return getattr(arg, "__name__", type(arg).__name__)
+            text = repr(arg)
+            return text if len(text) <= 40 else text[:37] + "..."
+
+        args = self.__arg if isinstance(self.__arg, tuple) else (self.__arg,)
+        return f"{self.name}({', '.join(describe_arg(arg) for arg in args if arg is not None)})"
+
+    def fingerprint(self) -> tuple:
+        """Identify the operation by its name and argument, e.g. to compare pipelines"""
+        return self.name, self.__arg
+
     def has_name(self, name):
         """Check if process is method of name"""
         return self.__work.__name__ == name.__name__
+
+    def __wrapped(self, wrap: Callable[[Callable], Callable]):
+        """Get the argument with its callables replaced with wrap(callable)"""
+        if callable(self.__arg):
+            return wrap(self.__arg)
+        if isinstance(self.__arg, tuple):
+            return tuple(wrap(arg) if callable(arg) else arg for arg in self.__arg)
+        return self.__arg
@@ -0,0 +1,257 @@
+import threading
+import time
+from collections.abc import Sized
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional
+
+from pystreamapi._cache.lru import CachedFunction, LRUCache
+from pystreamapi._lazy.process import Process
+from pystreamapi.hooks.__hook import observe_stage
+
+
+class StageStatistics:  # pylint: disable=too-many-instance-attributes
+    """
+    Execution statistics of one stage of a profiled pipeline. Times are in seconds and exclude
+    the time spent in the stages before. Element counts of lazy stages only include the elements
+    that were actually pulled through the stage. Stages memoizing their callable, such as
+    map_cached, also report the cache hits and misses.
+    """
+
+    def __init__(self, name: str, upstream: "StageStatistics" = None):
+        self.name = name
+        self.upstream = upstream
+        self.passthrough = False
+        self.count: Optional[int] = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.callable_time = 0.0
+        self.calls = 0
+        self.peak_size: Optional[int] = None
+        self.cache: Optional[LRUCache] = None
+
+    @property
+    def elements_out(self) -> Optional[int]:
+        """Number of elements that came out of the stage"""
+        if self.passthrough:
+            return self.elements_in
+        return self.count
+
+    @property
+    def elements_in(self) -> Optional[int]:
+        """Number of elements that went into the stage"""
+        return self.upstream.elements_out if self.upstream is not None else None
+
+    @property
+    def cache_hits(self) -> Optional[int]:
+        """Number of calls answered from the cache, None if the stage has no cache"""
+        return self.cache.hits if self.cache is not None else None
+
+    @property
+    def cache_misses(self) -> Optional[int]:
+        """Number of calls not answered from the cache, None if the stage has no cache"""
+        return self.cache.misses if self.cache is not None else None
+
+    @property
+    def cache_hit_rate(self) -> Optional[float]:
+        """Share of the calls answered from the cache, None if the stage has no cache"""
+        return self.cache.hit_rate if self.cache is not None else None
+
+    @property
+    def overhead_time(self) -> float:
+        """Wall time of the stage that was not spent in user callables"""
+        return max(0.0, self.wall_time - self.callable_time)
+
+    def to_dict(self) -> dict:
+        """Get the statistics as a dictionary"""
+        return {
+            "name": self.name,
+            "elements_in": self.elements_in,
+            "elements_out": self.elements_out,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "callable_time": self.callable_time,
+            "overhead_time": self.overhead_time,
+            "calls": self.calls,
+            "peak_size": self.peak_size,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": self.cache_hit_rate,
+        }
+
+
+class PipelineStatistics:
+    """
+    Execution statistics of a profiled pipeline: one StageStatistics for the source, each
+    intermediate operation and the terminal operation, in pipeline order. str() renders them
+    as a table.
+    """
+
+    _COLUMNS = ["stage", "in", "out", "wall ms", "cpu ms", "callable ms", "overhead ms",
+                "calls", "peak size"]
+
+    def __init__(self):
+        self.stages: List[StageStatistics] = []
+
+    @property
+    def wall_time(self) -> float:
+        """Total wall time of the pipeline"""
+        return sum(stage.wall_time for stage in self.stages)
+
+    @property
+    def cpu_time(self) -> float:
+        """Total CPU time of the pipeline"""
+        return sum(stage.cpu_time for stage in self.stages)
+
+    def slowest(self) -> Optional[StageStatistics]:
+        """Get the stage with the highest wall time"""
+        return max(self.stages, key=lambda stage: stage.wall_time, default=None)
+
+    def to_dict(self) -> dict:
+        """Get the statistics as a dictionary"""
+        return {"wall_time": self.wall_time, "cpu_time": self.cpu_time,
+                "stages": [stage.to_dict() for stage in self.stages]}
+
+    def __str__(self):
+        def cell(value):
+            if value is None:
+                return "-"
+            return f"{value * 1000:.3f}" if isinstance(value, float) else str(value)
+
+        rows = [self._COLUMNS] + [
+            [stage.name, cell(stage.elements_in), cell(stage.elements_out),
+             cell(stage.wall_time), cell(stage.cpu_time), cell(stage.callable_time),
+             cell(stage.overhead_time), cell(stage.calls), cell(stage.peak_size)]
+            for stage in self.stages
+        ] + [["total", "", "", cell(self.wall_time), cell(self.cpu_time), "", "", "", ""]]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(self._COLUMNS))]
+        lines = ["  ".join(value.ljust(width) if i == 0 else value.rjust(width)
+                           for i, (value, width) in enumerate(zip(row, widths)))
+                 for row in rows]
+        lines.insert(1, "-" * len(lines[0]))
+        lines += [f"{stage.name}: {stage.cache_hit_rate:.1%} cache hits "
+                  f"({stage.cache_hits} hits, {stage.cache_misses} misses)"
+                  for stage in self.stages if stage.cache is not None]
+        return "\n".join(lines)
+
+
+class _TimedCallable:
+    """Wrapper around a user callable that adds its run time to the statistics of a stage"""
+
+    def __init__(self, function: Callable, stage: StageStatistics):
+        self.function = function
+        self.stage = stage
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.function(*args, **kwargs)
+        finally:
+            self.stage.callable_time += time.perf_counter() - start
+            self.stage.calls += 1
+
+
+class Profiler:
+    """
+    Records the statistics of a pipeline while it runs. Each process of the queue becomes a
+    stage. Lazy sources are wrapped in probes measuring the time spent pulling elements through
+    a stage, and the time of nested stages is subtracted so that every stage reports its own
+    time only. Callables run in worker processes are not recorded.
+    """
+
+    def __init__(self):
+        self.statistics = PipelineStatistics()
+        self.__local = threading.local()
+
+    def __getstate__(self):
+        # Thread-local state cannot be pickled, e.g. when joblib sends the stream to worker
+        # processes. Nothing is recorded there anyway.
+        return {"statistics": self.statistics}
+
+    def __setstate__(self, state):
+        self.statistics = state["statistics"]
+        self.__local = threading.local()
+
+    def execute(self, stream, processes: List[Process]):
+        """Run the processes on the stream and record a stage for the source and each of them"""
+        stage = self.__add_stage("source")
+        stream._source = self.__observe(stage, stream._source)
+        for process in processes:
+            stage = self.__add_stage(process.name)
+            wrap = partial(self.__instrument, stage)
+            source = stream._source
+            self.__timed(stage, lambda p=process, w=wrap:
+                         observe_stage(stream, p.name, lambda: p.exec(w)))
+            if stream._source is source:
+                # The process did not touch the elements, e.g. error_level
+                stage.passthrough = True
+            else:
+                stream._source = self.__observe(stage, stream._source)
+
+    def terminal(self, name: str, function: Callable, args: tuple, kwargs: dict) -> Any:
+        """Run the terminal operation with its callable arguments timed and record its stage"""
+        stage = self.__add_stage(name)
+        stage.count = None
+        args = tuple(_TimedCallable(arg, stage) if callable(arg) else arg for arg in args)
+        kwargs = {key: _TimedCallable(value, stage) if callable(value) else value
+                  for key, value in kwargs.items()}
+        return self.__timed(stage, lambda: function(*args, **kwargs))
+
+    @staticmethod
+    def __instrument(stage: StageStatistics, function: Callable) -> Callable:
+        """Time the callable of a stage and record the cache of memoized callables"""
+        if isinstance(function, CachedFunction):
+            stage.cache = function.cache
+        return _TimedCallable(function, stage)
+
+    def __add_stage(self, name: str) -> StageStatistics:
+        upstream = self.statistics.stages[-1] if self.statistics.stages else None
+        stage = StageStatistics(name, upstream)
+        self.statistics.stages.append(stage)
+        return stage
+
+    def __observe(self, stage: StageStatistics, source: Iterable) -> Iterable:
+        """
+        Record the size of materialized sources or wrap lazy ones in a probe. Sized sources
+        are not wrapped so that operations relying on len() and slicing keep working.
+        """
+        if isinstance(source, Sized):
+            stage.count = len(source)
+            stage.peak_size = max(stage.peak_size or 0, len(source))
+            return source
+        return self.__probe(stage, iter(source))
+
+    def __probe(self, stage: StageStatistics, iterator):
+        """Generator counting the elements and timing each pull through a stage"""
+        pull = iterator.__next__
+        while True:
+            try:
+                item = self.__timed(stage, pull)
+            except StopIteration:
+                return
+            stage.count += 1
+            yield item
+
+    def __timed(self, stage: StageStatistics, function: Callable) -> Any:
+        """
+        Call the function and add its wall and CPU time to the stage, excluding the time of the
+        stages called from it. The time is also added to the calling stage, if any.
+        """
+        running = self.__running()
+        running.append([0.0, 0.0])
+        start, start_cpu = time.perf_counter(), time.process_time()
+        try:
+            return function()
+        finally:
+            wall, cpu = time.perf_counter() - start, time.process_time() - start_cpu
+            nested_wall, nested_cpu = running.pop()
+            stage.wall_time += wall - nested_wall
+            stage.cpu_time += cpu - nested_cpu
+            if running:
+                running[-1][0] += wall
+                running[-1][1] += cpu
+
+    def __running(self) -> List[List[float]]:
+        """Stack of the [nested wall, nested CPU] times of the stages running in this thread"""
+        if not hasattr(self.__local, "running"):
+            self.__local.running = []
+        return self.__local.running
@@ -1,6 +1,7 @@
 from typing import List
 
 from pystreamapi._lazy.process import Process
+from pystreamapi.hooks.__hook import observe_stage
 
 
 class ProcessQueue:
@@ -16,10 +17,13 @@ class ProcessQueue:
         """
         self.__queue.append(proc)
 
-    def execute_all(self):
-        """Run all processes from the queue"""
+    def execute_all(self, stream=None):
+        """
+        Run all processes from the queue
+        :param stream: The stream the processes belong to, passed to the registered hooks
+        """
         for proc in self.__queue:
-            proc.exec()
+            observe_stage(stream, proc.name, proc.exec)
 
     def get_queue(self) -> List[Process]:
         """Get a list of the processes"""
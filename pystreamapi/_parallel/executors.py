@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+_lock = threading.Lock()
+_thread_pools: dict = {}
+
+
+def default_thread_workers() -> int:
+    """Get the default number of threads for I/O-bound work, the same as ThreadPoolExecutor's"""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def get_thread_pool(max_workers: int = None) -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool with max_workers threads. The pool is created on first use and
+    reused by all streams afterward, so no threads are started per stream.
+    """
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ThreadPoolExecutor
+    max_workers = max_workers or default_thread_workers()
+    if max_workers < 1:
+        raise ValueError("There must be at least one worker")
+    with _lock:
+        pool = _thread_pools.get(max_workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=max_workers,
+                                      thread_name_prefix=f"pystreamapi-{max_workers}")
+            _thread_pools[max_workers] = pool
+        return pool
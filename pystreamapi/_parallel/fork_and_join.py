@@ -2,12 +2,12 @@
 import os
 from typing import Callable, Any, Optional
 
-from joblib import delayed
-
 from pystreamapi._itertools.tools import reduce
-from pystreamapi._parallel.parallelizer import Parallel
+from pystreamapi._parallel.parallelizer import Parallel, delayed
 from pystreamapi._streams.error.__error import ErrorHandler
 from pystreamapi._streams.error.__levels import ErrorLevel
+from pystreamapi.collectors.__collector import Collector
+from pystreamapi.hooks.__hook import HOOKS, emit
 
 
 class Parallelizer:
@@ -39,6 +39,7 @@ class Parallelizer:
     def filter(self, function):
         """Parallel filter function"""
         parts = self.fork()
+        self.__dispatched("filter", parts)
         if self.__handler is not None and self.__handler._get_error_level() != ErrorLevel.RAISE:
             result = self.__run_job_in_parallel(parts, self._filter_ignore_errors, function)
         else:
@@ -59,11 +60,44 @@ class Parallelizer:
         if len(self.__src) < 2:
             return self.__src
         parts = self.fork(min_nr_items=2)
+        self.__dispatched("reduce", parts)
         result = self.__run_job_in_parallel(
             parts, lambda x, y: reduce(function=x, sequence=y, handler=self.__handler), function
         )
         return reduce(function, result, handler=self.__handler)
 
+    def collect(self, collector: Collector):
+        """
+        Parallel collect: every part is accumulated into a private state of its worker thread,
+        then the states are merged in a tree
+        """
+        parts = self.fork()
+        self.__dispatched("collect", parts)
+        # Threads keep the elements in the results identical to those of the source
+        states = self.__run_job_in_parallel(
+            parts, lambda x, y: x.accumulate(y, self.__handler), collector, prefer="threads"
+        )
+        if not states:
+            return collector.finisher(collector.supplier())
+        return collector.finisher(self.__merge(collector.combiner, states))
+
+    @staticmethod
+    def __merge(combiner, states: list):
+        """
+        Merge adjacent states pairwise, level by level, until one is left. The merges of a
+        level run in parallel and the order of the states is kept.
+        """
+        while len(states) > 1:
+            pairs = [states[i:i + 2] for i in range(0, len(states) - 1, 2)]
+            odd = [states[-1]] if len(states) % 2 else []
+            if len(pairs) > 1:
+                states = Parallel(n_jobs=-1, prefer="threads")(
+                    delayed(combiner)(left, right) for left, right in pairs
+                ) + odd
+            else:
+                states = [combiner(*pairs[0])] + odd
+        return states[0]
+
     def fork(self, min_nr_items=1):
         """
         Split the source list into multiple sublists.
@@ -94,8 +128,14 @@ class Parallelizer:
             return round(len(self.__src) / min_nr_items)
         return os.cpu_count() - 2 if os.cpu_count() > 2 else os.cpu_count()
 
-    def __run_job_in_parallel(self, src, operation, op_function):
+    def __dispatched(self, operation: str, parts: list):
+        """Notify the registered hooks about the chunks dispatched to the workers"""
+        if HOOKS:
+            emit("chunks_dispatched", self.__handler, operation, len(parts),
+                 sum(len(part) for part in parts))
+
+    def __run_job_in_parallel(self, src, operation, op_function, prefer="processes"):
         """Run the operation in parallel"""
-        return Parallel(n_jobs=-1, prefer="processes", handler=self.__handler)(
+        return Parallel(n_jobs=-1, prefer=prefer, handler=self.__handler)(
             delayed(operation)(op_function, part) for part in src
         )
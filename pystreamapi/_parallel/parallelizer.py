@@ -1,11 +1,46 @@
-from joblib import Parallel as _JoblibParallel  # pylint: disable=unused-import
+import os
+import sys
+import threading
 
+from pystreamapi._itertools.tools import batched
+from pystreamapi._parallel.executors import get_thread_pool
 from pystreamapi._streams.error.__error import ErrorHandler
 from pystreamapi._streams.error.__levels import ErrorLevel
 
+# On free-threaded builds (e.g. CPython 3.13t) threads run Python code in parallel, so parallel
+# jobs run on a shared thread pool without pickling instead of being dispatched to joblib.
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+_CHUNKS_PER_WORKER = 4
+_worker_state = threading.local()
+
+
+def delayed(function):
+    """
+    Capture a function and its arguments as a (function, args, kwargs) task, in the same way as
+    joblib.delayed, but without importing joblib
+    """
+    def delayed_function(*args, **kwargs):
+        """Return the task for calling the function with the given arguments"""
+        return function, args, kwargs
+
+    return delayed_function
+
+
+def _run_tasks(tasks):
+    """Run a chunk of (function, args, kwargs) tasks on a worker of the thread backend"""
+    _worker_state.active = True
+    try:
+        return [function(*args, **kwargs) for function, args, kwargs in tasks]
+    finally:
+        _worker_state.active = False
+
 
 class Parallel:
-    """Wrapper for joblib.Parallel supporting error handling"""
+    """
+    Wrapper for joblib.Parallel supporting error handling. On free-threaded interpreters the
+    tasks run on the shared thread pool instead.
+    """
 
     def __init__(self, n_jobs=-1, prefer="processes", handler: ErrorHandler = None):
         self.n_jobs = n_jobs
@@ -13,8 +48,35 @@ class Parallel:
         self.handler = handler
 
     def __call__(self, iterable):
-        """Call joblib.Parallel with error handling"""
-        res = _JoblibParallel(n_jobs=self.n_jobs, prefer=self.prefer)(iterable)
+        """Call joblib.Parallel with error handling. joblib is imported on first use."""
+        if FREE_THREADED:
+            res = self.__run_in_threads(list(iterable))
+        else:
+            # pylint: disable=import-outside-toplevel
+            from joblib import Parallel as _JoblibParallel
+
+            res = _JoblibParallel(n_jobs=self.n_jobs, prefer=self.prefer)(iterable)
         if self.handler and self.handler._get_error_level() != ErrorLevel.RAISE:
             return ErrorHandler._remove_sentinel(res)
         return res
+
+    def __run_in_threads(self, tasks):
+        """
+        Run the tasks in chunks on the shared thread pool. Jobs started from a worker run
+        inline, so that nested parallel streams cannot exhaust the pool and deadlock.
+        """
+        workers = self.__number_of_workers()
+        if workers == 1 or len(tasks) < 2 or getattr(_worker_state, "active", False):
+            return [function(*args, **kwargs) for function, args, kwargs in tasks]
+        chunk_size = max(1, len(tasks) // (workers * _CHUNKS_PER_WORKER))
+        chunks = get_thread_pool(workers).map(_run_tasks, batched(tasks, chunk_size))
+        return [result for chunk in chunks for result in chunk]
+
+    def __number_of_workers(self):
+        """Translate n_jobs like joblib does: negative values count back from the CPU count"""
+        cpus = os.cpu_count() or 1
+        if self.n_jobs is None:
+            return 1
+        if self.n_jobs < 0:
+            return max(1, cpus + 1 + self.n_jobs)
+        return max(1, self.n_jobs)
@@ -0,0 +1,267 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import functools
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, TypeVar, Union
+
+from pystreamapi.__optional import Optional
+from pystreamapi._itertools import async_tools
+from pystreamapi._lazy.process import Process
+from pystreamapi._lazy.queue import ProcessQueue
+from pystreamapi._streams.__base_stream import _operation
+from pystreamapi._streams.error.__error import ErrorHandler, _sentinel
+from pystreamapi._streams.error.__levels import ErrorLevel
+
+K = TypeVar('K')
+_V = TypeVar('_V')
+_identity_missing = object()
+
+
+def terminal(func):
+    """
+    Decorator to execute all the processes in the queue before awaiting the decorated coroutine
+    function. To be applied to terminal operations of async streams.
+    """
+    @functools.wraps(func)
+    @_operation
+    async def wrapper(*args, **kwargs):
+        self: AsyncStream = args[0]
+        self._queue.execute_all(self)
+        self._close()
+        return await func(*args, **kwargs)
+
+    return wrapper
+
+
+class AsyncStream(AsyncIterable[K], ErrorHandler):
+    """
+    A stream over a sync or async iterable for asyncio applications. Mappers, predicates and
+    actions can be plain functions or coroutine functions. map, filter and for_each can run up
+    to max_concurrency coroutines at once, with the results in the order of the source (ordered)
+    or in the order they complete. Terminal operations are coroutines that have to be awaited.
+    """
+
+    def __init__(self, source: Union[Iterable[K], AsyncIterable[K]]):
+        self._source = async_tools.async_iter(source)
+        self._queue = ProcessQueue()
+        self._open = True
+
+    def _close(self):
+        """Close the stream."""
+        self._open = False
+
+    def _verify_open(self):
+        """Verify if stream is open. If not, raise an exception."""
+        if not self._open:
+            raise RuntimeError("The stream has been closed")
+
+    def __aiter__(self) -> AsyncIterator[K]:
+        self._verify_open()
+        self._queue.execute_all(self)
+        self._close()
+        return self._source
+
+    @_operation
+    def error_level(self, level: ErrorLevel, *exceptions) -> AsyncStream[K]:
+        """
+        Sets the error level of the stream. If an exception is raised during the execution of the
+        stream, the error level determines what to do with the exception.
+        :param level: Error level from ErrorLevel
+        :param exceptions: Exceptions to ignore. If not provided, all exceptions will be ignored
+        :return: The stream itself
+        """
+        self._queue.append(Process(lambda args: self._error_level(args[0], *args[1]),
+                                   (level, exceptions), name="error_level"))
+        return self
+
+    @_operation
+    def distinct(self) -> AsyncStream[K]:
+        """Returns a stream consisting of the distinct elements of this stream."""
+        self._queue.append(Process(self.__distinct))
+        return self
+
+    def __distinct(self):
+        """Removes duplicate elements from the stream."""
+        self._source = async_tools.distinct(self._source)
+
+    @_operation
+    def filter(self, predicate: Callable[[K], Any], max_concurrency=1,
+               ordered=True) -> AsyncStream[K]:
+        """
+        Returns a stream consisting of the elements of this stream that match the given predicate.
+
+        :param predicate: Function or coroutine function
+        :param max_concurrency: Maximum number of predicates evaluated at once
+        :param ordered: If False, elements are emitted as soon as their predicate completes
+        """
+        self._queue.append(Process(self.__filter, (predicate, max_concurrency, ordered)))
+        return self
+
+    def __filter(self, args):
+        """Filters the stream with a bounded number of concurrent predicates."""
+        predicate, max_concurrency, ordered = args
+
+        async def check(item):
+            return item, await self._one_async(mapper=predicate, item=item)
+
+        results = async_tools.concurrent_map(check, self._source, max_concurrency, ordered)
+        self._source = (item async for item, keep in results
+                        if keep is not _sentinel and keep)
+
+    @_operation
+    def flat_map(self, mapper: Callable[[K], Union[Iterable[_V], AsyncIterable[_V]]]) \
+            -> AsyncStream[_V]:
+        """
+        Returns a stream consisting of the elements of the iterables (or async iterables and
+        streams) produced by applying the mapper to each element of this stream.
+
+        :param mapper: Function or coroutine function
+        """
+        self._queue.append(Process(self.__flat_map, mapper))
+        return self
+
+    def __flat_map(self, mapper):
+        """Maps the elements to iterables and flattens them."""
+        self.__map((mapper, 1, True))
+        self._source = async_tools.flat_map(self._source)
+
+    @_operation
+    def limit(self, max_size: int) -> AsyncStream[K]:
+        """
+        Returns a stream consisting of the elements of this stream, truncated to be no longer
+        than maxSize in length.
+
+        :param max_size:
+        """
+        self._queue.append(Process(self.__limit, max_size))
+        return self
+
+    def __limit(self, max_size: int):
+        """Limits the stream to the first n elements."""
+        self._source = async_tools.limit(self._source, max_size)
+
+    @_operation
+    def map(self, mapper: Callable[[K], _V], max_concurrency=1, ordered=True) -> AsyncStream[_V]:
+        """
+        Returns a stream consisting of the results of applying the given function to the elements
+        of this stream.
+
+        :param mapper: Function or coroutine function
+        :param max_concurrency: Maximum number of mappers running at once
+        :param ordered: If False, results are emitted as soon as they are available
+        """
+        self._queue.append(Process(self.__map, (mapper, max_concurrency, ordered)))
+        return self
+
+    def __map(self, args):
+        """Maps the stream with a bounded number of concurrent mappers."""
+        mapper, max_concurrency, ordered = args
+        results = async_tools.concurrent_map(
+            lambda item: self._one_async(mapper=mapper, item=item),
+            self._source, max_concurrency, ordered
+        )
+        self._source = (result async for result in results if result is not _sentinel)
+
+    @_operation
+    def peek(self, action: Callable) -> AsyncStream[K]:
+        """
+        Returns a stream consisting of the elements of this stream, additionally performing the
+        provided action on each element as elements are consumed from the resulting stream.
+
+        :param action: Function or coroutine function
+        """
+        self._queue.append(Process(self.__peek, action))
+        return self
+
+    def __peek(self, action: Callable):
+        """Performs the action on each element."""
+        self._source = async_tools.peek(
+            self._source, lambda item: self._one_async(mapper=action, item=item)
+        )
+
+    @_operation
+    def skip(self, n: int) -> AsyncStream[K]:
+        """
+        Returns a stream consisting of the remaining elements of this stream after discarding the
+        first n elements of the stream.
+
+        :param n:
+        """
+        self._queue.append(Process(self.__skip, n))
+        return self
+
+    def __skip(self, n: int):
+        """Skips the first n elements of the stream."""
+        self._source = async_tools.skip(self._source, n)
+
+    @terminal
+    async def count(self) -> int:
+        """Returns the count of elements in this stream."""
+        count = 0
+        async for _ in self._source:
+            count += 1
+        return count
+
+    @terminal
+    async def find_first(self) -> Optional:
+        """
+        Returns an Optional describing the first element of this stream, or an empty Optional if
+        the stream is empty.
+        """
+        async for item in self._source:
+            return Optional.of(item)
+        return Optional.empty()
+
+    @terminal
+    async def for_each(self, action: Callable, max_concurrency=1):
+        """
+        Performs an action for each element of this stream.
+
+        :param action: Function or coroutine function
+        :param max_concurrency: Maximum number of actions running at once
+        """
+        results = async_tools.concurrent_map(
+            lambda item: self._one_async(mapper=action, item=item),
+            self._source, max_concurrency, ordered=False
+        )
+        async for _ in results:
+            pass
+
+    @terminal
+    async def reduce(self, predicate: Callable[[K, K], K], identity=_identity_missing):
+        """
+        Performs a reduction on the elements of this stream, using the provided identity value
+        and an associative accumulation function, and returns the reduced value. Without
+        identity, an Optional is returned.
+
+        :param predicate: Function or coroutine function of two arguments
+        :param identity: Default value
+        """
+        value = identity
+        async for item in self._source:
+            if value is _identity_missing:
+                value = item
+                continue
+            new_value = await self._one_async(
+                mapper=lambda x, val=value: predicate(val, x), item=item
+            )
+            if new_value is not _sentinel:
+                value = new_value
+        if identity is not _identity_missing:
+            return value
+        return Optional.empty() if value is _identity_missing else Optional.of(value)
+
+    @terminal
+    async def to_list(self) -> list:
+        """Accumulates the elements of this stream into a List."""
+        return [item async for item in self._source]
+
+    @terminal
+    async def to_set(self) -> set:
+        """Accumulates the elements of this stream into a Set."""
+        return {item async for item in self._source}
+
+    @terminal
+    async def to_tuple(self) -> tuple:
+        """Accumulates the elements of this stream into a Tuple."""
+        return tuple([item async for item in self._source])
@@ -7,16 +7,24 @@ from abc import abstractmethod
 from builtins import reversed
 from collections.abc import Sized
 from functools import cmp_to_key
-from typing import Iterable, Callable, Any, TypeVar, Iterator, TYPE_CHECKING, Union
+from typing import Iterable, Callable, Any, TypeVar, Iterator, TYPE_CHECKING, Union, Hashable, \
+    Tuple
 
 from pystreamapi.__optional import Optional
-from pystreamapi._itertools.tools import dropwhile, distinct, limit
+from pystreamapi._cache.lru import CachedFunction
+from pystreamapi._cache.result_cache import ResultCache, shared_cache
+from pystreamapi._itertools.tee import SpillingTee
+from pystreamapi._itertools.tools import dropwhile, distinct, limit, bounded_map
 from pystreamapi._lazy.process import Process
 from pystreamapi._lazy.queue import ProcessQueue
-from pystreamapi._streams.error.__error import ErrorHandler
+from pystreamapi._streams.error.__error import ErrorHandler, _sentinel
+from pystreamapi.collectors.__collector import Collector
+from pystreamapi.collectors.__collectors import all_of
 from pystreamapi._streams.error.__levels import ErrorLevel
+from pystreamapi.hooks.__hook import observe_pipeline, observe_stage
 
 if TYPE_CHECKING:
+    from pystreamapi._lazy.profiler import PipelineStatistics
     from pystreamapi._streams.numeric.__numeric_base_stream import NumericBaseStream
     from pystreamapi._streams.__parallel_stream import ParallelStream
     from pystreamapi._streams.__sequential_stream import SequentialStream
@@ -24,6 +32,10 @@ if TYPE_CHECKING:
 K = TypeVar('K')
 _V = TypeVar('_V')
 _identity_missing = object()
+_cache_missing = object()
+# Terminal operations with side effects or lazy results, which cache() does not apply to
+_UNCACHED_TERMINALS = frozenset({"iter", "explain", "for_each", "tee", "to_csv", "to_jsonl",
+                                 "to_xml"})
 
 
 def _operation(func):
@@ -53,14 +65,13 @@ def terminal(func):
         self: BaseStream = args[0]
         self._verify_open()
         self = StreamConverter.choose_implementation(self)
-        self._queue.execute_all()
-        self._close()
-        return func(*args, **kwargs)
+        name = func.__name__.strip("_")
+        return observe_pipeline(self, name, lambda: self._run_terminal(name, func, args, kwargs))
 
     return wrapper
 
 
-class BaseStream(Iterable[K], ErrorHandler):
+class BaseStream(Iterable[K], ErrorHandler):  # pylint: disable=too-many-instance-attributes
     """
     A sequence of elements supporting sequential and parallel aggregate operations.
 
@@ -78,6 +89,9 @@ class BaseStream(Iterable[K], ErrorHandler):
         self._queue = ProcessQueue()
         self._open = True
         self._implementation_explicit = False
+        self._profiler = None
+        self._profile_report = None
+        self._cache_options = None
         self.__PARALLELISM_RECOMMENDATION_THRESHOLD = 3000
 
     def _close(self):
@@ -98,6 +112,50 @@ class BaseStream(Iterable[K], ErrorHandler):
                     return True
         return False
 
+    def _parallelism_reason(self) -> str:
+        """Explains the result of _is_parallelism_recommended."""
+        threshold = self.__PARALLELISM_RECOMMENDATION_THRESHOLD
+        if not isinstance(self._source, Sized):
+            return "the size of the source is unknown"
+        if not any(item.has_name(self._filter) for item in self._queue.get_queue()):
+            return "the pipeline has no filter"
+        if len(self._source) > threshold:
+            return f"filter on {len(self._source)} elements, more than {threshold}"
+        return f"filter on {len(self._source)} elements, not more than {threshold}"
+
+    def _run_terminal(self, name: str, func: Callable, args: tuple, kwargs: dict):
+        """
+        Run the processes in the queue, close the stream and run the terminal operation. If the
+        stream is cached, the result is looked up in and stored to the cache.
+        """
+        if self._cache_options is None or name in _UNCACHED_TERMINALS:
+            return self.__execute_terminal(name, func, args, kwargs)
+        cache, key, version = self._cache_options
+        cache_key = ResultCache.make_key(self._source, self._queue.get_queue(), name, args[1:],
+                                         kwargs, key, version)
+        result = cache.get(cache_key, _cache_missing)
+        if result is not _cache_missing:
+            self._close()
+            return ResultCache.copy_result(result)
+        result = self.__execute_terminal(name, func, args, kwargs)
+        cache.put(cache_key, ResultCache.copy_result(result))
+        return result
+
+    def __execute_terminal(self, name: str, func: Callable, args: tuple, kwargs: dict):
+        """Run the processes in the queue, close the stream and run the terminal operation."""
+        if self._profiler is None:
+            self._queue.execute_all(self)
+            self._close()
+            return observe_stage(self, name, lambda: func(*args, **kwargs))
+        self._profiler.execute(self, self._queue.get_queue())
+        self._close()
+        result = self._profiler.terminal(
+            name, lambda *a, **kw: observe_stage(self, name, lambda: func(*a, **kw)), args, kwargs
+        )
+        if self._profile_report is not None:
+            self._profile_report(self._profiler.statistics)
+        return result
+
     def _set_implementation_explicit(self):
         """
         Sets the implementation as explicit, meaning that the stream will not be converted to a
@@ -157,9 +215,49 @@ class BaseStream(Iterable[K], ErrorHandler):
         :param exceptions: Exceptions to ignore. If not provided, all exceptions will be ignored
         :return: The stream itself
         """
-        self._queue.append(Process(lambda: self._error_level(level, *exceptions)))
+        self._queue.append(Process(lambda args: self._error_level(args[0], *args[1]),
+                                   (level, exceptions), name="error_level"))
         return self
 
+    @_operation
+    def explain(self, analyze=False, file=None):
+        """
+        Prints the plan of the pipeline: the implementation that will run it, the reason for
+        choosing it and the planned stages. The stream is left open.
+
+        With analyze, the pipeline is run instead, discarding the elements, and every stage is
+        annotated with its actual element counts and timings. This closes the stream.
+
+        :param analyze: Run the pipeline and report the statistics of each stage
+        :param file: The file to print to. Defaults to sys.stdout
+        """
+        # pylint: disable=import-outside-toplevel
+        from pystreamapi.__stream_converter import StreamConverter
+        from pystreamapi._lazy.profiler import Profiler
+
+        implementation, reason = StreamConverter.explain_implementation(self)
+        lines = [f"Implementation: {implementation} ({reason})"]
+        if not analyze:
+            source = type(self._source).__name__
+            size = (f"{len(self._source)} elements" if isinstance(self._source, Sized)
+                    else "unknown size")
+            lines.append(f"Source: {source} of {size}")
+            lines.append("Stages:")
+            lines.extend(f"  {i}. {process.describe()}"
+                         for i, process in enumerate(self._queue.get_queue(), 1))
+        else:
+            if self._profiler is None:
+                self._profiler = Profiler()
+            self._explain()
+            lines.append(str(self._profiler.statistics))
+        print("\n".join(lines), file=file)
+
+    @terminal
+    def _explain(self):
+        """Runs the pipeline for explain(analyze=True), discarding the elements."""
+        for _ in self._source:
+            pass
+
     @_operation
     def filter(self, predicate: Callable[[K], bool]) -> 'BaseStream[K]':
         """
@@ -240,6 +338,54 @@ class BaseStream(Iterable[K], ErrorHandler):
     def _map(self, mapper: Callable[[K], _V]):
         """Implementation of map. Should be implemented by subclasses."""
 
+    @_operation
+    def map_cached(self, mapper: Callable[[K], _V], maxsize: int = 1024,
+                   key: Callable[[K], Hashable] = None) -> 'BaseStream[_V]':
+        """
+        Returns a stream consisting of the results of applying the given function to the elements
+        of this stream, calling it only once for equal elements. The results are kept in a
+        thread-safe LRU cache, so the mapper should be a pure function. Profiled streams report
+        the cache hits and misses in their statistics.
+
+        :param mapper:
+        :param maxsize: Maximum number of cached results, or None for no limit
+        :param key: Maps an element to its cache key. Defaults to the element itself, which
+            must then be hashable
+        """
+        self._queue.append(Process(self._map, CachedFunction(mapper, maxsize, key),
+                                   name="map_cached"))
+        return self
+
+    @_operation
+    def map_concurrent(self, mapper: Callable[[K], _V], max_workers: int = None,
+                       ordered=True) -> 'BaseStream[_V]':
+        """
+        Returns a stream consisting of the results of applying the given function to the elements
+        of this stream on a shared thread pool. Intended for I/O-bound mappers: up to max_workers
+        calls run at once, at most twice as many elements are in flight and the results are
+        produced lazily.
+
+        :param mapper:
+        :param max_workers: Number of threads. Defaults to min(32, CPU count + 4)
+        :param ordered: If False, results are emitted as soon as they are available
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("There must be at least one worker")
+        self._queue.append(Process(self.__map_concurrent, (mapper, max_workers, ordered),
+                                   name="map_concurrent"))
+        return self
+
+    def __map_concurrent(self, args):
+        """Maps the stream on a shared thread pool with a bounded number of pending calls."""
+        # pylint: disable=import-outside-toplevel
+        from pystreamapi._parallel.executors import default_thread_workers, get_thread_pool
+        mapper, max_workers, ordered = args
+        max_workers = max_workers or default_thread_workers()
+        results = bounded_map(get_thread_pool(max_workers),
+                              lambda item: self._one(mapper=mapper, item=item),
+                              self._source, 2 * max_workers, ordered)
+        self._source = (result for result in results if result is not _sentinel)
+
     @_operation
     def map_to_int(self) -> NumericBaseStream:
         """
@@ -305,6 +451,47 @@ class BaseStream(Iterable[K], ErrorHandler):
     def _peek(self, action: Callable):
         """Implementation of peek. Should be implemented by subclasses."""
 
+    @_operation
+    def profile(self, report: Callable[['PipelineStatistics'], Any] = None) -> 'BaseStream[K]':
+        """
+        Enables profiling of the whole pipeline. Once the terminal operation has run, the
+        statistics property holds the element counts, wall and CPU time, time in user callables
+        and materialized size of every stage.
+
+        :param report: Called with the statistics after the terminal operation, e.g. print
+        """
+        # pylint: disable=import-outside-toplevel
+        from pystreamapi._lazy.profiler import Profiler
+        self._profiler = Profiler()
+        self._profile_report = report
+        return self
+
+    @_operation
+    def cache(self, cache: ResultCache = None, key: Hashable = None,
+              version: Hashable = None) -> 'BaseStream[K]':
+        """
+        Caches the result of the terminal operation. Running the same pipeline on the same
+        source again returns the cached result without processing the source. The pipeline is
+        identified by its operations and the arguments of the operations and of the terminal
+        operation, with callables compared by identity. The source is compared by identity
+        unless a key or a version is given, so pass them for lazy sources, sources that are
+        created again for every stream or sources that change in place. for_each, writers and
+        iteration are not cached.
+
+        :param cache: A ResultCache bounding the number, age and size of the results. Defaults
+            to a shared cache of 128 results
+        :param key: Identifies the source instead of the source object, e.g. the name of a file
+        :param version: Identifies the version of the source, e.g. the modification time of a
+            file
+        """
+        self._cache_options = (cache if cache is not None else shared_cache, key, version)
+        return self
+
+    @property
+    def statistics(self) -> Union['PipelineStatistics', None]:
+        """The statistics of the pipeline if it is profiled, otherwise None"""
+        return self._profiler.statistics if self._profiler is not None else None
+
     @_operation
     def reversed(self) -> 'BaseStream[K]':
         """
@@ -406,7 +593,9 @@ class BaseStream(Iterable[K], ErrorHandler):
 
         :return: Number of elements in the stream
         """
-        return len(self._source)
+        if isinstance(self._source, Sized):
+            return len(self._source)
+        return sum(1 for _ in self._source)
 
     @abstractmethod
     @terminal
@@ -460,6 +649,25 @@ class BaseStream(Iterable[K], ErrorHandler):
             return Optional.of(max(self._source))
         return Optional.empty()
 
+    @terminal
+    def collect(self, *collectors: Collector) -> Any:
+        """
+        Performs mutable reductions of the elements of this stream with the collectors, e.g.
+        from pystreamapi.collectors, in a single pass. Returns the result of the collector, or a
+        tuple of the results of several collectors.
+
+        :param collectors: One or more collectors
+        """
+        if not collectors:
+            raise ValueError("At least one collector is required")
+        if len(collectors) == 1:
+            return self._collect(collectors[0])
+        return self._collect(all_of(*collectors))
+
+    @abstractmethod
+    def _collect(self, collector: Collector) -> Any:
+        """Implementation of collect. Should be implemented by subclasses."""
+
     @abstractmethod
     @terminal
     def reduce(self, predicate: Callable[[K, K], K], identity=_identity_missing,
@@ -473,6 +681,30 @@ class BaseStream(Iterable[K], ErrorHandler):
         :param identity: Default value
         """
 
+    @terminal
+    def tee(self, n: int = 2, buffer_size: int = 10_000,
+            spill_dir: str = None) -> Tuple['BaseStream[K]', ...]:
+        """
+        Returns n sequential streams over the elements of this stream, which read the source in
+        a single pass, e.g. to run several terminal operations on one lazy file. Elements are
+        buffered until all streams have read them. If the streams are consumed at different
+        speeds, e.g. one after the other, at most buffer_size elements are kept in memory and
+        older ones are pickled to a temporary file.
+
+        :param n: Number of streams
+        :param buffer_size: Maximum number of elements kept in memory
+        :param spill_dir: Directory of the temporary file. Defaults to the system default
+        """
+        # pylint: disable=import-outside-toplevel
+        from pystreamapi._streams.__sequential_stream import SequentialStream
+        from pystreamapi._streams.numeric.__numeric_base_stream import NumericBaseStream
+        from pystreamapi._streams.numeric.__sequential_numeric_stream import \
+            SequentialNumericStream
+        stream_type = SequentialNumericStream if isinstance(self, NumericBaseStream) \
+            else SequentialStream
+        tee = SpillingTee(self._source, n, buffer_size, spill_dir)
+        return tuple(stream_type(iterator) for iterator in tee.iterators)
+
     @terminal
     def to_list(self):
         """Accumulates the elements of this stream into a List."""
@@ -498,6 +730,55 @@ class BaseStream(Iterable[K], ErrorHandler):
         :param key_mapper:
         """
 
+    @terminal
+    def to_csv(self, path: str, delimiter=',', fields=None, header=True, encoding="utf-8",
+               compression=None) -> int:
+        """
+        Writes the elements of this stream to a CSV file while they are consumed and returns the
+        number of rows written. Namedtuples (e.g. from the loaders) and dicts are written by field.
+
+        :param path: The path of the CSV file
+        :param delimiter: The delimiter used in the CSV file
+        :param fields: The columns to write. Defaults to the fields of the first element
+        :param header: Set as False to not write a header row
+        :param encoding: The encoding of the CSV file
+        :param compression: 'gzip', 'bz2', 'lzma' or 'zstd'. Detected from the extension if None
+        """
+        # pylint: disable=import-outside-toplevel,too-many-arguments,too-many-positional-arguments
+        from pystreamapi import writers
+        return writers.csv(self._source, path, delimiter, fields, header, encoding, compression)
+
+    @terminal
+    def to_jsonl(self, path: str, encoding="utf-8", compression=None) -> int:
+        """
+        Writes the elements of this stream to a JSON Lines file while they are consumed and
+        returns the number of rows written. Namedtuples are written as objects.
+
+        :param path: The path of the JSON Lines file
+        :param encoding: The encoding of the JSON Lines file
+        :param compression: 'gzip', 'bz2', 'lzma' or 'zstd'. Detected from the extension if None
+        """
+        # pylint: disable=import-outside-toplevel
+        from pystreamapi import writers
+        return writers.jsonl(self._source, path, encoding, compression)
+
+    @terminal
+    def to_xml(self, path: str, root_tag='root', row_tag='item', encoding="utf-8",
+               compression=None) -> int:
+        """
+        Writes the elements of this stream to an XML file while they are consumed and returns the
+        number of rows written. The fields of namedtuples and dicts are written as child elements.
+
+        :param path: The path of the XML file
+        :param root_tag: The tag of the root element
+        :param row_tag: The tag of the element of each row
+        :param encoding: The encoding of the XML file
+        :param compression: 'gzip', 'bz2', 'lzma' or 'zstd'. Detected from the extension if None
+        """
+        # pylint: disable=import-outside-toplevel,too-many-arguments,too-many-positional-arguments
+        from pystreamapi import writers
+        return writers.xml(self._source, path, root_tag, row_tag, encoding, compression)
+
     def _to_numeric_stream(self) -> NumericBaseStream:
         """Converts a stream to a numeric stream using the stream converter"""
         # pylint: disable=import-outside-toplevel
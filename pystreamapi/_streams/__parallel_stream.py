@@ -2,13 +2,13 @@ from collections import defaultdict
 from functools import reduce as seq_reduce
 from typing import Callable, Any, Iterable
 
-from joblib import delayed
-
 import pystreamapi._streams.__base_stream as stream
 from pystreamapi.__optional import Optional
 from pystreamapi._parallel.fork_and_join import Parallelizer
-from pystreamapi._parallel.parallelizer import Parallel
+from pystreamapi._parallel.parallelizer import Parallel, delayed
 from pystreamapi._streams.__base_stream import terminal
+from pystreamapi.collectors.__collector import Collector
+from pystreamapi.collectors.__collectors import grouping_by
 
 _identity_missing = object()
 
@@ -28,6 +28,10 @@ class ParallelStream(stream.BaseStream):
         return all(Parallel(n_jobs=-1, prefer="threads", handler=self)
                    (delayed(self.__mapper(predicate))(element) for element in self._source))
 
+    def _collect(self, collector: Collector):
+        self._set_parallelizer_src()
+        return self._parallelizer.collect(collector)
+
     def _filter(self, predicate: Callable[[Any], bool]):
         self._set_parallelizer_src()
         self._source = self._parallelizer.filter(predicate)
@@ -47,16 +51,7 @@ class ParallelStream(stream.BaseStream):
         self._source = new_src
 
     def _group_to_dict(self, key_mapper: Callable[[Any], Any]):
-        groups = defaultdict(list)
-
-        def process_element(element):
-            key = key_mapper(element)
-            groups[key].append(element)
-
-        Parallel(n_jobs=-1, prefer="threads", handler=self)(
-            delayed(self.__mapper(process_element))(element) for element in self._source
-        )
-        return groups
+        return defaultdict(list, self._collect(grouping_by(key_mapper)))
 
     @terminal
     def for_each(self, action: Callable):
@@ -91,6 +86,9 @@ class ParallelStream(stream.BaseStream):
         return dict(self._group_to_dict(key_mapper))
 
     def _set_parallelizer_src(self):
+        # The source is split into parts, so lazy sources, e.g. of map_concurrent, are read first
+        if not isinstance(self._source, (list, tuple)):
+            self._source = list(self._source)
         self._parallelizer.set_source(self._source, self)
 
     def __mapper(self, mapper):
@@ -6,6 +6,7 @@ from pystreamapi.__optional import Optional
 from pystreamapi._itertools.tools import reduce, flat_map, peek
 from pystreamapi._streams.__base_stream import terminal
 from pystreamapi._streams.error.__error import _sentinel
+from pystreamapi.collectors.__collector import Collector
 
 _identity_missing = object()
 
@@ -17,6 +18,9 @@ class SequentialStream(stream.BaseStream):
     def all_match(self, predicate: Callable[[Any], bool]):
         return all(self._itr(self._source, mapper=predicate))
 
+    def _collect(self, collector: Collector):
+        return collector.collect(self._source, self)
+
     def _filter(self, predicate: Callable[[Any], bool]):
         self._source = self._itr(self._source, condition=predicate)
 
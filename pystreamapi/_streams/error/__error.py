@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import inspect
 import logging
 from typing import Iterable
 
 from pystreamapi._streams.error.__levels import ErrorLevel
 from pystreamapi._streams.error.__sentinel import Sentinel
+from pystreamapi.hooks.__hook import HOOKS, emit
 
 _sentinel = Sentinel()
 
@@ -19,6 +21,13 @@ def true_condition(_):
     return True
 
 
+async def _resolve(value):
+    """Await the value if it is awaitable, otherwise return it"""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
 class ErrorHandler:
     """Handle errors in stream operations"""
 
@@ -45,6 +54,8 @@ class ErrorHandler:
                 if condition(i):
                     yield mapper(i)
             except self.__exceptions_to_ignore as e:
+                if HOOKS:
+                    emit("error_handled", self, e, self.__error_level)
                 if self.__error_level == ErrorLevel.RAISE:
                     raise e
                 if self.__error_level == ErrorLevel.IGNORE:
@@ -65,6 +76,30 @@ class ErrorHandler:
             if condition(item):
                 return mapper(item)
         except self.__exceptions_to_ignore as e:
+            if HOOKS:
+                emit("error_handled", self, e, self.__error_level)
+            if self.__error_level == ErrorLevel.RAISE:
+                raise e
+            if self.__error_level == ErrorLevel.IGNORE:
+                return _sentinel
+            self.__log(e)
+        return _sentinel
+
+    async def _one_async(self, mapper=nothing, condition=true_condition, item=None):
+        """
+        Apply the mapper and condition to the item like _one. The mapper and the condition can
+        also be coroutine functions, whose results are awaited.
+        :param mapper: Method or coroutine function to apply to the item
+        :param condition: Condition to check before applying the mapper
+        :param item: Item to apply the mapper and condition
+        :return: The result of the mapper if the condition is True, otherwise return _sentinel
+        """
+        try:
+            if await _resolve(condition(item)):
+                return await _resolve(mapper(item))
+        except self.__exceptions_to_ignore as e:
+            if HOOKS:
+                emit("error_handled", self, e, self.__error_level)
             if self.__error_level == ErrorLevel.RAISE:
                 raise e
             if self.__error_level == ErrorLevel.IGNORE:
@@ -0,0 +1,65 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+from typing import Callable, Generic, Iterable, TypeVar, TYPE_CHECKING
+
+from pystreamapi._streams.error.__error import _sentinel
+from pystreamapi._streams.error.__levels import ErrorLevel
+
+if TYPE_CHECKING:
+    from pystreamapi._streams.error.__error import ErrorHandler
+
+T = TypeVar('T')
+A = TypeVar('A')
+R = TypeVar('R')
+
+
+def _identity(state):
+    return state
+
+
+class Collector(Generic[T, A, R]):
+    """
+    A mutable reduction of the elements of a stream into a result, see BaseStream.collect().
+
+    A collector consists of four functions: supplier() creates an empty state,
+    accumulator(state, element) adds an element to a state and returns the state,
+    combiner(state, other) merges two states into one and returns it, and finisher(state)
+    turns a state into the result. Sequential streams accumulate all elements into a single
+    state. Parallel streams accumulate chunks of the elements into separate states and combine
+    them, so the same collector works for both.
+    """
+
+    def __init__(self, supplier: Callable[[], A], accumulator: Callable[[A, T], A],
+                 combiner: Callable[[A, A], A], finisher: Callable[[A], R] = None):
+        self.supplier = supplier
+        self.accumulator = accumulator
+        self.combiner = combiner
+        self.finisher = finisher or _identity
+
+    def accumulate(self, iterable: Iterable[T], handler: ErrorHandler = None) -> A:
+        """
+        Accumulate the elements into a new state. Elements the accumulator fails on are handled
+        by the error handler, if given.
+        """
+        state = self.supplier()
+        if handler is None or handler._get_error_level() == ErrorLevel.RAISE:
+            accumulator = self.accumulator
+            for element in iterable:
+                state = accumulator(state, element)
+            return state
+        for element in iterable:
+            state = self._accumulate_handled(state, element, handler)
+        return state
+
+    def _accumulate_handled(self, state: A, element: T, handler: ErrorHandler) -> A:
+        """
+        Add an element to a state. If the accumulator fails, the error is handled by the error
+        handler and the state is returned unchanged.
+        """
+        result = handler._one(mapper=lambda e: self.accumulator(state, e), item=element)
+        return state if result is _sentinel else result
+
+    def collect(self, iterable: Iterable[T], handler: ErrorHandler = None) -> R:
+        """Accumulate the elements and return the result"""
+        return self.finisher(self.accumulate(iterable, handler))
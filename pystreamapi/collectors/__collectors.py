@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import heapq
+import operator
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from pystreamapi.__optional import Optional
+from pystreamapi.collectors.__collector import Collector
+
+_missing = object()
+
+
+def _append(state: list, element) -> list:
+    state.append(element)
+    return state
+
+
+def _extend(state: list, other: list) -> list:
+    state.extend(other)
+    return state
+
+
+def _add(state: set, element) -> set:
+    state.add(element)
+    return state
+
+
+def _update(state: set, other: set) -> set:
+    state.update(other)
+    return state
+
+
+def to_list() -> Collector[Any, list, list]:
+    """Collects the elements into a list"""
+    return Collector(list, _append, _extend)
+
+
+def to_set() -> Collector[Any, set, set]:
+    """Collects the elements into a set"""
+    return Collector(set, _add, _update)
+
+
+def counting() -> Collector[Any, int, int]:
+    """Counts the elements"""
+    return Collector(int, lambda state, _: state + 1, operator.add)
+
+
+def summing(mapper: Callable[[Any], Any] = None) -> Collector[Any, Any, Any]:
+    """Sums the elements or the results of the mapper"""
+    if mapper is None:
+        return Collector(int, operator.add, operator.add)
+    return Collector(int, lambda state, element: state + mapper(element), operator.add)
+
+
+def averaging(mapper: Callable[[Any], Any] = None) -> Collector[Any, Tuple[Any, int], Any]:
+    """Averages the elements or the results of the mapper. The result is None without elements."""
+    mapper = mapper or (lambda element: element)
+    return Collector(
+        lambda: (0, 0),
+        lambda state, element: (state[0] + mapper(element), state[1] + 1),
+        lambda state, other: (state[0] + other[0], state[1] + other[1]),
+        lambda state: state[0] / state[1] if state[1] > 0 else None
+    )
+
+
+def min_by(key: Callable[[Any], Any] = None) -> Collector[Any, Any, Optional]:
+    """Finds the smallest element, compared by key if given, as an Optional"""
+    return _extreme(key, operator.lt)
+
+
+def max_by(key: Callable[[Any], Any] = None) -> Collector[Any, Any, Optional]:
+    """Finds the largest element, compared by key if given, as an Optional"""
+    return _extreme(key, operator.gt)
+
+
+def _extreme(key: Callable[[Any], Any], better: Callable[[Any, Any], bool]) -> Collector:
+    """Collector keeping the first element no other element is better than"""
+    key = key or (lambda element: element)
+
+    def choose(state, element):
+        if state is _missing or better(key(element), key(state)):
+            return element
+        return state
+
+    return Collector(
+        lambda: _missing,
+        choose,
+        lambda state, other: state if other is _missing else choose(state, other),
+        lambda state: Optional.empty() if state is _missing else Optional.of(state)
+    )
+
+
+def joining(delimiter: str = "", prefix: str = "", suffix: str = "") -> Collector[Any, list, str]:
+    """Joins the string representations of the elements"""
+    return Collector(
+        list,
+        lambda state, element: _append(state, str(element)),
+        _extend,
+        lambda state: prefix + delimiter.join(state) + suffix
+    )
+
+
+def top_k(k: int, key: Callable[[Any], Any] = None) -> Collector[Any, list, list]:
+    """
+    Finds the k largest elements, compared by key if given, in descending order. Of equal
+    elements, the ones encountered first are kept.
+    """
+    if k < 0:
+        raise ValueError("k must not be negative")
+    key = key or (lambda element: element)
+
+    def push(state, entry):
+        heap, counter = state
+        # Ties are broken by the encounter order, so the elements are never compared
+        entry = (entry[0], -counter, entry[2])
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif k > 0:
+            heapq.heappushpop(heap, entry)
+        return heap, counter + 1
+
+    return Collector(
+        lambda: ([], 0),
+        lambda state, element: push(state, (key(element), None, element)),
+        lambda state, other: _merge_top(state, other, push),
+        lambda state: [element for _, _, element in sorted(state[0], reverse=True)]
+    )
+
+
+def _merge_top(state, other, push):
+    """Push the entries of other into state, in the encounter order of other"""
+    for entry in sorted(other[0], key=lambda entry: -entry[1]):
+        state = push(state, entry)
+    return state
+
+
+def grouping_by(key_mapper: Callable[[Any], Hashable],
+                downstream: Collector = None) -> Collector[Any, dict, Dict[Hashable, Any]]:
+    """
+    Groups the elements by the key and collects the elements of each group with the downstream
+    collector, into lists by default
+    """
+    downstream = downstream or to_list()
+    supplier, accumulator = downstream.supplier, downstream.accumulator
+
+    def accumulate(state: dict, element) -> dict:
+        key = key_mapper(element)
+        group = state.get(key, _missing)
+        state[key] = accumulator(supplier() if group is _missing else group, element)
+        return state
+
+    def combine(state: dict, other: dict) -> dict:
+        for key, group in other.items():
+            mine = state.get(key, _missing)
+            state[key] = group if mine is _missing else downstream.combiner(mine, group)
+        return state
+
+    def finish(state: dict) -> dict:
+        return {key: downstream.finisher(group) for key, group in state.items()}
+
+    return Collector(dict, accumulate, combine, finish)
+
+
+def partitioning_by(predicate: Callable[[Any], bool],
+                    downstream: Collector = None) -> Collector[Any, list, Dict[bool, Any]]:
+    """
+    Partitions the elements into those matching the predicate (True) and the others (False)
+    and collects each partition with the downstream collector, into lists by default
+    """
+    downstream = downstream or to_list()
+
+    def accumulate(state: list, element) -> list:
+        index = 1 if predicate(element) else 0
+        state[index] = downstream.accumulator(state[index], element)
+        return state
+
+    return Collector(
+        lambda: [downstream.supplier(), downstream.supplier()],
+        accumulate,
+        lambda state, other: [downstream.combiner(state[0], other[0]),
+                              downstream.combiner(state[1], other[1])],
+        lambda state: {False: downstream.finisher(state[0]), True: downstream.finisher(state[1])}
+    )
+
+
+def mapping(mapper: Callable[[Any], Any], downstream: Collector) -> Collector:
+    """Applies the mapper to each element before passing it to the downstream collector"""
+    accumulator = downstream.accumulator
+    return Collector(downstream.supplier,
+                     lambda state, element: accumulator(state, mapper(element)),
+                     downstream.combiner, downstream.finisher)
+
+
+def filtering(predicate: Callable[[Any], bool], downstream: Collector) -> Collector:
+    """Passes only the elements matching the predicate to the downstream collector"""
+    accumulator = downstream.accumulator
+    return Collector(downstream.supplier,
+                     lambda state, element: accumulator(state, element)
+                     if predicate(element) else state,
+                     downstream.combiner, downstream.finisher)
+
+
+def collecting_and_then(downstream: Collector, finisher: Callable[[Any], Any]) -> Collector:
+    """Applies the finisher to the result of the downstream collector"""
+    return Collector(downstream.supplier, downstream.accumulator, downstream.combiner,
+                     lambda state: finisher(downstream.finisher(state)))
+
+
+class _AllOf(Collector[Any, list, Tuple]):
+    """Collector running several collectors in one pass, see all_of()"""
+
+    def __init__(self, collectors: Tuple[Collector, ...]):
+        super().__init__(
+            lambda: [collector.supplier() for collector in collectors],
+            lambda states, element: [collector.accumulator(state, element)
+                                     for collector, state in zip(collectors, states)],
+            lambda states, others: [collector.combiner(state, other)
+                                    for collector, state, other in zip(collectors, states, others)],
+            lambda states: tuple(collector.finisher(state)
+                                 for collector, state in zip(collectors, states))
+        )
+        self.__collectors = collectors
+
+    def _accumulate_handled(self, state: list, element, handler) -> list:
+        # The errors of every collector are handled on their own, so that each collector only
+        # skips the elements it fails on itself
+        # pylint: disable=protected-access
+        return [collector._accumulate_handled(collector_state, element, handler)
+                for collector, collector_state in zip(self.__collectors, state)]
+
+
+def all_of(*collectors: Collector) -> Collector[Any, list, Tuple]:
+    """
+    Runs several collectors in one pass over the elements. The result is a tuple with the
+    results of the collectors, which are the same as if each collector was run on its own. With
+    an error handler, an element is only skipped by the collectors that fail on it.
+    """
+    return _AllOf(collectors)
@@ -0,0 +1,8 @@
+from pystreamapi.collectors.__collector import Collector
+from pystreamapi.collectors.__collectors import all_of, averaging, collecting_and_then, counting, \
+    filtering, grouping_by, joining, mapping, max_by, min_by, partitioning_by, summing, top_k, \
+    to_list, to_set
+
+__all__ = ['Collector', 'all_of', 'averaging', 'collecting_and_then', 'counting', 'filtering',
+           'grouping_by', 'joining', 'mapping', 'max_by', 'min_by', 'partitioning_by', 'summing',
+           'top_k', 'to_list', 'to_set']
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pystreamapi._streams.error.__levels import ErrorLevel
+
+# Registered hooks. The list is only modified in place, so that modules importing it see all
+# changes, and an empty list costs a single truth test at each instrumentation point.
+HOOKS: List[Hook] = []
+
+
+class Hook:
+    """
+    Base class for instrumentation hooks. Override the events of interest and register the hook
+    with register(). Hooks are called synchronously in the thread running the stream, so they
+    should return quickly. Exceptions raised by a hook are logged and otherwise ignored.
+    """
+
+    def pipeline_started(self, stream, terminal: str):
+        """Called when a terminal operation starts running the pipeline of the stream"""
+
+    def pipeline_finished(self, stream, terminal: str, exception: Optional[BaseException]):
+        """Called when the terminal operation has returned or raised the exception"""
+
+    def stage_started(self, stream, stage: str):
+        """Called before an operation of the pipeline, including the terminal one, runs"""
+
+    def stage_finished(self, stream, stage: str, exception: Optional[BaseException]):
+        """
+        Called after an operation has run or raised the exception. Lazy operations only set up
+        their step here; their elements are processed while the terminal operation runs.
+        """
+
+    def chunks_dispatched(self, stream, operation: str, chunks: int, elements: int):
+        """Called when a parallel stream splits the elements into chunks for its workers"""
+
+    def error_handled(self, stream, exception: Exception, level: ErrorLevel):
+        """Called when the error handler of a stream catches an exception"""
+
+
+def register(hook: Hook) -> Hook:
+    """Register the hook for all streams. Registering a hook twice has no effect."""
+    if hook not in HOOKS:
+        HOOKS.append(hook)
+    return hook
+
+
+def unregister(hook: Hook):
+    """Remove a registered hook"""
+    if hook in HOOKS:
+        HOOKS.remove(hook)
+
+
+def emit(event: str, *args):
+    """Call the event method of all registered hooks"""
+    for hook in list(HOOKS):
+        try:
+            getattr(hook, event)(*args)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logging.warning("Hook %r failed on %s: %s", hook, event, e)
+
+
+def observe(started: str, finished: str, stream, name: str, function: Callable[[], Any]) -> Any:
+    """Call function, emitting the started and finished events around it if hooks are registered"""
+    if not HOOKS:
+        return function()
+    emit(started, stream, name)
+    try:
+        result = function()
+    except BaseException as e:
+        emit(finished, stream, name, e)
+        raise
+    emit(finished, stream, name, None)
+    return result
+
+
+def observe_stage(stream, name: str, function: Callable[[], Any]) -> Any:
+    """Run function as the stage name of the stream"""
+    return observe("stage_started", "stage_finished", stream, name, function)
+
+
+def observe_pipeline(stream, terminal: str, function: Callable[[], Any]) -> Any:
+    """Run function as the pipeline of the stream ending in the terminal operation"""
+    return observe("pipeline_started", "pipeline_finished", stream, terminal, function)
@@ -0,0 +1,27 @@
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+from pystreamapi.hooks.__hook import Hook, register, unregister
+
+if TYPE_CHECKING:
+    # Defined here for type checkers and linters only, see __getattr__
+    from pystreamapi.hooks.__opentelemetry import OpenTelemetryHook
+
+__all__ = ['Hook', 'register', 'unregister']
+
+if find_spec('opentelemetry') is not None:
+    __all__.append('OpenTelemetryHook')
+
+
+def __getattr__(name):
+    """Import the OpenTelemetry hook and its backend when it is accessed for the first time"""
+    if name != 'OpenTelemetryHook':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    hook = getattr(import_module('pystreamapi.hooks.__opentelemetry'), name)
+    globals()[name] = hook
+    return hook
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
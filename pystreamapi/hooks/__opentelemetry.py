@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from pystreamapi.hooks.__hook import Hook
+
+try:
+    from opentelemetry import context, metrics, trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError as exc:
+    raise ImportError(
+        "Please install the opentelemetry extra dependency to use the OpenTelemetry hook."
+    ) from exc
+
+_SCOPE = "pystreamapi"
+
+
+class OpenTelemetryHook(Hook):
+    """
+    Hook emitting OpenTelemetry spans and metrics. Each terminal operation creates a span with
+    a child span per operation of the pipeline. Handled errors and chunk dispatches of parallel
+    streams are added as span events and counted in the metrics pystreamapi.errors,
+    pystreamapi.chunks and pystreamapi.chunk.elements. The global tracer and meter providers are
+    used unless others are given.
+    """
+
+    def __init__(self, tracer_provider=None, meter_provider=None):
+        # pylint: disable=import-outside-toplevel
+        from pystreamapi import __version__
+
+        self.__tracer = trace.get_tracer(_SCOPE, __version__, tracer_provider)
+        meter = metrics.get_meter(_SCOPE, __version__, meter_provider)
+        self.__pipelines = meter.create_counter(
+            "pystreamapi.pipelines", description="Terminal operations run")
+        self.__errors = meter.create_counter(
+            "pystreamapi.errors", description="Exceptions caught by the error handler")
+        self.__chunks = meter.create_counter(
+            "pystreamapi.chunks", description="Chunks dispatched to parallel workers")
+        self.__chunk_elements = meter.create_counter(
+            "pystreamapi.chunk.elements", description="Elements dispatched to parallel workers")
+        self.__local = threading.local()
+
+    def pipeline_started(self, stream, terminal: str):
+        self.__start(f"pystreamapi.{terminal}", stream, terminal)
+
+    def pipeline_finished(self, stream, terminal: str, exception: Optional[BaseException]):
+        self.__pipelines.add(1, {"pystreamapi.terminal": terminal,
+                                 "pystreamapi.stream": type(stream).__name__})
+        self.__finish(exception)
+
+    def stage_started(self, stream, stage: str):
+        self.__start(f"pystreamapi.stage.{stage}", stream, stage)
+
+    def stage_finished(self, stream, stage: str, exception: Optional[BaseException]):
+        self.__finish(exception)
+
+    def chunks_dispatched(self, stream, operation: str, chunks: int, elements: int):
+        attributes = {"pystreamapi.operation": operation}
+        self.__chunks.add(chunks, attributes)
+        self.__chunk_elements.add(elements, attributes)
+        trace.get_current_span().add_event("pystreamapi.chunks_dispatched", {
+            **attributes, "pystreamapi.chunks": chunks, "pystreamapi.elements": elements})
+
+    def error_handled(self, stream, exception: Exception, level):
+        attributes = {"pystreamapi.error_level": level.name,
+                      "exception.type": type(exception).__qualname__}
+        self.__errors.add(1, attributes)
+        trace.get_current_span().add_event("pystreamapi.error_handled", {
+            **attributes, "exception.message": str(exception)})
+
+    def __start(self, name: str, stream, operation: str):
+        span = self.__tracer.start_span(name, attributes={
+            "pystreamapi.stream": type(stream).__name__, "pystreamapi.operation": operation})
+        token = context.attach(trace.set_span_in_context(span))
+        self.__spans().append((span, token))
+
+    def __finish(self, exception: Optional[BaseException]):
+        span, token = self.__spans().pop()
+        if exception is not None:
+            span.record_exception(exception)
+            span.set_status(Status(StatusCode.ERROR, str(exception)))
+        context.detach(token)
+        span.end()
+
+    def __spans(self) -> list:
+        """Stack of the open spans and their context tokens in this thread"""
+        if not hasattr(self.__local, "spans"):
+            self.__local.spans = []
+        return self.__local.spans
@@ -0,0 +1,193 @@
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import time
+from itertools import groupby, islice, repeat
+from typing import Any, Callable, Iterator
+
+from pystreamapi.loaders.__loader_utils import LoaderUtils
+
+_MAGIC = b'PYSTREAMAPI-CACHE'
+_FORMAT_VERSION = 1
+_FRAME_LENGTH = struct.Struct('<Q')
+_ROW_GROUP_SIZE = 4096
+# Cache files that were not used for this many seconds are removed when a cache file is written
+_MAX_UNUSED_AGE = 30 * 24 * 60 * 60
+
+
+def cached(loader: Callable[..., Iterator[Any]], src: str, cache_dir: str = None,
+           **options) -> Iterator[Any]:
+    """
+    Loads data with a loader and caches the loaded records in a binary columnar file. As long as
+    the source files (path, modification time and size) and the options are unchanged, later
+    calls read the records from the cache file instead of parsing the source again.
+
+    Args:
+        loader (Callable): The loader, e.g. csv or json.
+        src (str): The path to a file, a directory or a glob pattern (see the loader).
+        cache_dir (str): The directory of the cache files. Defaults to ~/.cache/pystreamapi.
+        The cache files are pickles, so only use a directory that other users cannot write to.
+        Cache files that were not used for 30 days are removed whenever a cache file is written
+        to the directory.
+        **options: Keyword arguments for the loader. They are part of the cache key, so they
+        must not contain callables (e.g. predicates in where).
+
+    Yields:
+        namedtuple: The records of the loader.
+    """
+    if options.get('read_from_src'):
+        raise ValueError("Only data loaded from files can be cached.")
+    sources = tuple(__get_source_version(path) for path in LoaderUtils.resolve_paths(src))
+    cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.cache', 'pystreamapi')
+    cache_path = os.path.join(cache_dir, f"{__get_cache_key(loader, sources, options)}.cache")
+    if __read_sources(cache_path) == sources:
+        __touch(cache_path)
+        return __read_cache(cache_path)
+    return __write_cache(cache_path, sources, iter(loader(src, **options)))
+
+
+def __get_source_version(path):
+    """Get the absolute path, modification time and size of a source file"""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def __get_cache_key(loader, sources, options):
+    """Get the name of the cache file from the loader, the source paths and the options"""
+    for name, value in options.items():
+        values = value.values() if isinstance(value, dict) else (value,)
+        if any(callable(v) for v in values):
+            raise ValueError(f"The option {name!r} contains a callable and cannot be cached.")
+    key = (
+        _FORMAT_VERSION,
+        f"{loader.__module__}.{loader.__qualname__}",
+        tuple(path for path, _, _ in sources),
+        sorted(options.items()),
+    )
+    return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+
+
+def __read_sources(cache_path):
+    """
+    Read the source versions from the header of a cache file. None if it cannot be read, e.g.
+    because it is corrupt or was written by another program or version.
+    """
+    try:
+        with open(cache_path, 'rb') as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                return None
+            (length,) = _FRAME_LENGTH.unpack(file.read(_FRAME_LENGTH.size))
+            header = pickle.loads(file.read(length))
+        if header.get('version') != _FORMAT_VERSION:
+            return None
+        return header.get('sources')
+    except (OSError, EOFError, struct.error, pickle.UnpicklingError, ValueError, TypeError,
+            AttributeError, ImportError):
+        return None
+
+
+def __touch(cache_path):
+    """Mark a cache file as used, so that it is not removed as unused"""
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+
+
+def __remove_unused_caches(directory):
+    """Remove the cache files and leftover temporary files that were not used for a long time"""
+    unused_since = time.time() - _MAX_UNUSED_AGE
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.name.endswith(('.cache', '.tmp')) and entry.stat().st_mtime < unused_since:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def __read_cache(cache_path):
+    """Read the records from a memory mapped cache file one row group at a time"""
+    with open(cache_path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        offset = len(_MAGIC)
+        offset += _FRAME_LENGTH.size + _FRAME_LENGTH.unpack_from(data, offset)[0]
+        while offset < len(data):
+            (length,) = _FRAME_LENGTH.unpack_from(data, offset)
+            offset += _FRAME_LENGTH.size
+            with memoryview(data)[offset:offset + length] as frame:
+                segments = pickle.loads(frame)
+            offset += length
+            for segment in segments:
+                yield from __decode_segment(*segment)
+
+
+def __write_cache(cache_path, sources, items):
+    """
+    Yield the loaded records and write them to a cache file. The file is written to a temporary
+    file first and only replaces the cache file once all records were loaded.
+    """
+    directory = os.path.dirname(cache_path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(_MAGIC)
+            __write_frame(file, {'version': _FORMAT_VERSION, 'sources': sources})
+            while rows := list(islice(items, _ROW_GROUP_SIZE)):
+                __write_frame(file, __encode_row_group(rows))
+                yield from rows
+        os.replace(temp_path, cache_path)
+        __remove_unused_caches(directory)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def __write_frame(file, value):
+    """Write a pickled value prefixed by its length"""
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    file.write(_FRAME_LENGTH.pack(len(data)))
+    file.write(data)
+
+
+def __encode_row_group(rows):
+    """
+    Split a row group into runs of rows of the same namedtuple type and store each run by
+    column. Values that are not namedtuples are stored as they are.
+    """
+    segments = []
+    for layout, run in groupby(rows, key=__get_layout):
+        run = list(run)
+        if layout is None:
+            segments.append((None, False, len(run), [LoaderUtils.to_portable(v) for v in run]))
+            continue
+        columns = [list(column) for column in zip(*run)]
+        nested = any(isinstance(value, (tuple, list)) for column in columns for value in column)
+        if nested:
+            columns = [[LoaderUtils.to_portable(value) for value in column] for column in columns]
+        segments.append((layout, nested, len(run), columns))
+    return segments
+
+
+def __decode_segment(layout, nested, count, columns):
+    """Rebuild the rows of a run stored by __encode_row_group"""
+    if layout is None:
+        return map(LoaderUtils.from_portable, columns)
+    rows = zip(*columns) if columns else repeat((), count)
+    if nested:
+        rows = (map(LoaderUtils.from_portable, row) for row in rows)
+    return map(LoaderUtils.namedtuple_type(*layout)._make, rows)
+
+
+def __get_layout(value):
+    """Get the name and fields of a namedtuple or None for other values"""
+    if isinstance(value, tuple) and hasattr(value, '_fields'):
+        return type(value).__name__, value._fields
+    return None
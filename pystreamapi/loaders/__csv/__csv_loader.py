@@ -1,5 +1,6 @@
 from collections import namedtuple
 from csv import reader
+from functools import partial
 from io import StringIO
 from typing import Any, Iterator
 
@@ -7,42 +8,57 @@ from pystreamapi.loaders.__loader_utils import LoaderUtils
 
 
 def csv(
-        src: str, read_from_src=False, cast_types=True, delimiter=',', encoding="utf-8"
+        src: str, read_from_src=False, cast_types=True, delimiter=',', encoding="utf-8", *,
+        fields=None, where=None, processes=1
 ) -> Iterator[Any]:
     """
     Lazily loads CSV data from either a path or a string and yields namedtuples.
 
     Args:
-        src (str): Either the path to a CSV file or a CSV string.
+        src (str): Either the path to a CSV file, a directory, a glob pattern matching CSV files
+        (e.g. 'logs/2026-*/part-*.csv') or a CSV string. The files are loaded one after another.
         read_from_src (bool): If True, src is treated as a CSV string.
-        If False, src is treated as a path to a CSV file.
+        If False, src is treated as a path to a CSV file, a directory or a glob pattern.
         cast_types (bool): Set as False to disable casting of values to int, bool or float.
         delimiter (str): The delimiter used in the CSV data.
         encoding (str): The encoding of the CSV file (only used when reading from file).
+        fields (Iterable[str]): Names of the columns to load. Only these columns are converted
+        and the namedtuples contain them in the given order. If None, all columns are loaded.
+        where (dict): Conditions on column values, e.g. {'age': greater_than(30)}. A condition is
+        a predicate or a value to compare for equality. The condition columns are checked before
+        the rest of the row is converted and rows that do not match are skipped.
+        processes (int): Number of worker processes used to load several files at once.
+            Each worker reads whole files into memory.
 
     Yields:
         namedtuple: Each row in the CSV as a namedtuple.
     """
+    # pylint: disable=too-many-arguments
+    fields = LoaderUtils.normalize_fields(fields)
+    predicates = LoaderUtils.normalize_predicates(where)
     if not read_from_src:
-        src = LoaderUtils.validate_path(src)
-        return __load_csv_from_file(src, cast_types, delimiter, encoding)
-    return __load_csv_from_string(src, cast_types, delimiter)
+        paths = LoaderUtils.resolve_paths(src)
+        load = partial(__load_csv_from_file, cast=cast_types, delimiter=delimiter,
+                       encoding=encoding, fields=fields, predicates=predicates)
+        return LoaderUtils.load_files(load, paths, processes)
+    return __load_csv_from_string(src, cast_types, delimiter, fields, predicates)
 
 
-def __load_csv_from_file(file_path, cast, delimiter, encoding):
+def __load_csv_from_file(file_path, *, cast, delimiter, encoding, fields, predicates):
     """Load a CSV file and convert it into a generator of namedtuples"""
+    # pylint: disable=too-many-arguments
     # skipcq: PTC-W6004
-    with open(file_path, mode='r', newline='', encoding=encoding) as csvfile:
-        yield from __process_csv(csvfile, cast, delimiter)
+    with LoaderUtils.open_file(file_path, encoding, newline='') as csvfile:
+        yield from __process_csv(csvfile, cast, delimiter, fields, predicates)
 
 
-def __load_csv_from_string(csv_string, cast, delimiter):
+def __load_csv_from_string(csv_string, cast, delimiter, fields, predicates):
     """Load a CSV from string and convert it into a generator of namedtuples"""
     with StringIO(csv_string) as csvfile:
-        yield from __process_csv(csvfile, cast, delimiter)
+        yield from __process_csv(csvfile, cast, delimiter, fields, predicates)
 
 
-def __process_csv(csvfile, cast, delimiter):
+def __process_csv(csvfile, cast, delimiter, fields, predicates):
     """Process CSV data and yield namedtuples"""
     csvreader = reader(csvfile, delimiter=delimiter)
 
@@ -51,12 +67,34 @@ def __process_csv(csvfile, cast, delimiter):
     if not header:
         return
 
-    Row = namedtuple('Row', list(header))
     mapper = LoaderUtils.try_cast if cast else lambda x: x
+    if predicates is not None:
+        # Rows are checked on the condition cells alone before the whole row is converted
+        checks = list(zip(__get_field_indices(header, [f for f, _ in predicates]),
+                          [predicate for _, predicate in predicates]))
+        csvreader = (row for row in csvreader
+                     if all(predicate(mapper(row[i])) for i, predicate in checks))
+
+    if fields is None:
+        Row = namedtuple('Row', list(header))
+        # Yield the data row by row, casting values to int or float if possible
+        for row in csvreader:
+            yield Row(*[mapper(value) for value in row])
+        return
 
-    # Yield the data row by row, casting values to int or float if possible
+    # Only the selected columns are picked from the row and converted
+    Row = namedtuple('Row', fields)
+    indices = __get_field_indices(header, fields)
     for row in csvreader:
-        yield Row(*[mapper(value) for value in row])
+        yield Row(*[mapper(row[i]) for i in indices])
+
+
+def __get_field_indices(header, fields):
+    """Get the column indices of the selected fields. Raise a ValueError for unknown fields"""
+    unknown = [field for field in fields if field not in header]
+    if unknown:
+        raise ValueError(f"The CSV data has no columns named {', '.join(unknown)}.")
+    return [header.index(field) for field in fields]
 
 
 def __get_csv_header(csvreader):
@@ -1,19 +1,45 @@
-from pystreamapi.loaders.__csv.__csv_loader import csv
-from pystreamapi.loaders.__json.__json_loader import json
-from pystreamapi.loaders.__toml.__toml_loader import toml
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
 
-__all__ = ['csv', 'json', 'toml']
-
-try:
+if TYPE_CHECKING:
+    # The loaders are defined here for type checkers and linters only
+    from pystreamapi.loaders.__cache.__cache_loader import cached
+    from pystreamapi.loaders.__csv.__csv_loader import csv
+    from pystreamapi.loaders.__json.__json_loader import json
+    from pystreamapi.loaders.__jsonl.__jsonl_loader import jsonl
+    from pystreamapi.loaders.__toml.__toml_loader import toml
     from pystreamapi.loaders.__xml.__xml_loader import xml
+    from pystreamapi.loaders.__yaml.__yaml_loader import yaml
 
-    __all__.append('xml')
-except ImportError:
-    ...
+# The loaders and their parser backends are imported on first access (see __getattr__)
+_LOADER_MODULES = {
+    'cached': 'pystreamapi.loaders.__cache.__cache_loader',
+    'csv': 'pystreamapi.loaders.__csv.__csv_loader',
+    'json': 'pystreamapi.loaders.__json.__json_loader',
+    'jsonl': 'pystreamapi.loaders.__jsonl.__jsonl_loader',
+    'toml': 'pystreamapi.loaders.__toml.__toml_loader',
+    'xml': 'pystreamapi.loaders.__xml.__xml_loader',
+    'yaml': 'pystreamapi.loaders.__yaml.__yaml_loader',
+}
 
-try:
-    from pystreamapi.loaders.__yaml.__yaml_loader import yaml
+__all__ = ['cached', 'csv', 'json', 'jsonl', 'toml']
+
+if find_spec('defusedxml') is not None:
+    __all__.append('xml')
 
+if find_spec('yaml') is not None:
     __all__.append('yaml')
-except ImportError:
-    ...
+
+
+def __getattr__(name):
+    """Import a loader when it is accessed for the first time"""
+    if name not in _LOADER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    loader = getattr(import_module(_LOADER_MODULES[name]), name)
+    globals()[name] = loader
+    return loader
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 import io
 from collections import namedtuple
+from functools import partial
 from typing import Any, Iterator
 
 try:
@@ -12,6 +13,7 @@ except ImportError as exc:
 from pystreamapi.loaders.__loader_utils import LoaderUtils
 
 _PEEK_SIZE = 4096
+_rejected = object()
 
 
 class _TextToBytesWrapper:
@@ -65,47 +67,60 @@ class _PeekableBytesReader:
         return result
 
 
-def json(src: str, read_from_src=False) -> Iterator[Any]:
+def json(src: str, read_from_src=False, *, fields=None, where=None, processes=1) -> Iterator[Any]:
     """
     Lazily loads JSON data from either a path or a string and yields namedtuples.
 
     Args:
-        src (str): Either the path to a JSON file or a JSON string.
+        src (str): Either the path to a JSON file, a directory, a glob pattern matching JSON
+        files or a JSON string. The files are loaded one after another.
         read_from_src (bool): If True, src is treated as a JSON string.
-        If False, src is treated as a path to a JSON file.
+        If False, src is treated as a path to a JSON file, a directory or a glob pattern.
+        fields (Iterable[str]): Names of the top-level keys to load. Values of all other keys
+        are skipped by the parser without being built. Missing keys are set to None.
+        If None, all keys are loaded.
+        where (dict): Conditions on top-level values, e.g. {'age': greater_than(30)}. A condition
+        is a predicate or a value to compare for equality. An object is skipped as soon as one
+        of its values does not match, before the rest of it is built. Objects missing a
+        condition key are skipped.
+        processes (int): Number of worker processes used to load several files at once.
+            Each worker reads whole files into memory.
 
     Yields:
         namedtuple: Each object in the JSON as a namedtuple.
     """
+    fields = LoaderUtils.normalize_fields(fields)
+    predicates = LoaderUtils.normalize_predicates(where)
     if read_from_src:
-        return __lazy_load_json_string(src)
-    path = LoaderUtils.validate_path(src)
-    return __lazy_load_json_file(path)
+        return __lazy_load_json_string(src, fields, predicates)
+    paths = LoaderUtils.resolve_paths(src)
+    load = partial(__lazy_load_json_file, fields=fields, predicates=predicates)
+    return LoaderUtils.load_files(load, paths, processes)
 
 
-def __lazy_load_json_file(file_path: str) -> Iterator[Any]:
+def __lazy_load_json_file(file_path: str, fields, predicates) -> Iterator[Any]:
     """Lazily read and parse a JSON file, yielding namedtuples incrementally."""
 
     def generator():
         """Yield namedtuples from the JSON file using a streaming parser."""
         # skipcq: PTC-W6004
-        with open(file_path, mode='r', encoding='utf-8') as jsonfile:
-            yield from __stream_json_items(jsonfile)
+        with LoaderUtils.open_file(file_path) as jsonfile:
+            yield from __stream_json_items(jsonfile, fields, predicates)
 
     return generator()
 
 
-def __lazy_load_json_string(json_string: str) -> Iterator[Any]:
+def __lazy_load_json_string(json_string: str, fields, predicates) -> Iterator[Any]:
     """Lazily parse a JSON string, yielding namedtuples incrementally."""
 
     def generator():
         """Yield namedtuples by streaming-parsing the JSON string."""
-        yield from __stream_json_items(io.StringIO(json_string))
+        yield from __stream_json_items(io.StringIO(json_string), fields, predicates)
 
     return generator()
 
 
-def __stream_json_items(handle) -> Iterator[Any]:
+def __stream_json_items(handle, fields=None, predicates=None) -> Iterator[Any]:
     """Stream JSON items from a text-mode file-like handle using ijson.
 
     Reads an initial chunk to detect whether the root value is an array or a
@@ -127,7 +142,9 @@ def __stream_json_items(handle) -> Iterator[Any]:
     first_char = stripped[0]
     reader = _PeekableBytesReader(initial_bytes, _TextToBytesWrapper(handle))
 
-    if first_char == '[':
+    if fields is not None or predicates is not None:
+        yield from __stream_projected_items(reader, fields, predicates)
+    elif first_char == '[':
         for item in ijson.items(reader, 'item', use_float=True):
             yield __dict_to_namedtuple(item)
     else:
@@ -136,6 +153,96 @@ def __stream_json_items(handle) -> Iterator[Any]:
             yield __dict_to_namedtuple(obj)
 
 
+def __stream_projected_items(reader, fields, predicates) -> Iterator[Any]:
+    """Stream JSON items from parser events, building only the values of the selected keys.
+
+    The root value may be an array of items or a single item. Items that are objects are
+    projected onto the selected keys and checked against the predicates while they are
+    parsed. Other items are built and yielded unchanged if there are no predicates.
+    """
+    events = iter(ijson.basic_parse(reader, use_float=True))
+    Item = namedtuple('Item', fields) if fields is not None else None
+    wanted = frozenset(fields) if fields is not None else None
+    predicates = dict(predicates or ())
+
+    def project(start_event, start_value):
+        """Project the item starting with the given event. Return _rejected on a mismatch."""
+        if start_event != 'start_map':
+            if predicates:
+                __skip_value(start_event, events)
+                return _rejected
+            return __dict_to_namedtuple(__build_value(start_event, start_value, events))
+        values = __project_map(events, wanted, predicates)
+        if values is _rejected or Item is None:
+            return values if values is _rejected else __dict_to_namedtuple(values)
+        return Item(*[__dict_to_namedtuple(values.get(field), field) for field in fields])
+
+    event, value = next(events, (None, None))
+    if event is None:
+        return
+    if event != 'start_array':
+        item = project(event, value)
+        if item is not None and item is not _rejected:
+            yield item
+        return
+    for event, value in events:
+        if event == 'end_array':
+            return
+        item = project(event, value)
+        if item is not _rejected:
+            yield item
+
+
+def __project_map(events, wanted, predicates):
+    """
+    Build the wanted keys (all keys if wanted is None) of the object whose start_map event was
+    just consumed. Return _rejected as soon as a value does not match its predicate.
+    """
+    values = {}
+    for event, key in events:
+        if event == 'end_map':
+            break
+        value_event, value = next(events)
+        if key in predicates:
+            values[key] = __build_value(value_event, value, events)
+            if not predicates[key](values[key]):
+                __skip_value('start_map', events)
+                return _rejected
+        elif wanted is None or key in wanted:
+            values[key] = __build_value(value_event, value, events)
+        else:
+            __skip_value(value_event, events)
+    if not predicates.keys() <= values.keys():
+        return _rejected
+    return values
+
+
+def __build_value(event, value, events):
+    """Build the value starting with the given event from the following parser events."""
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1 if event in ('start_map', 'start_array') else 0
+    while depth:
+        event, value = next(events)
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+    return builder.value
+
+
+def __skip_value(event, events):
+    """Consume the parser events of the value starting with the given event without building it"""
+    depth = 1 if event in ('start_map', 'start_array') else 0
+    while depth:
+        event, _ = next(events)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+
+
 def __dict_to_namedtuple(d, name='Item'):
     """Convert a dictionary (and any nested dicts/lists) to namedtuples recursively.
 
@@ -0,0 +1,144 @@
+# pylint: disable=protected-access
+import io
+import json as json_lib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Iterator
+
+from pystreamapi._itertools.tools import batched, bounded_map
+from pystreamapi._streams.error.__error import ErrorHandler, _sentinel
+from pystreamapi._streams.error.__levels import ErrorLevel
+from pystreamapi.loaders.__loader_utils import LoaderUtils
+
+
+def jsonl(src: str, read_from_src=False, *, error_level=ErrorLevel.RAISE, processes=1,
+          batch_size=1000, encoding="utf-8", fields=None, where=None) -> Iterator[Any]:
+    """
+    Lazily loads JSON Lines (NDJSON) data from either a path or a string and yields namedtuples.
+    The data is read line by line, so memory usage does not depend on the size of the input.
+
+    Args:
+        src (str): Either the path to a JSON Lines file, a directory, a glob pattern matching
+        JSON Lines files or a JSON Lines string. The files are loaded one after another.
+        read_from_src (bool): If True, src is treated as a JSON Lines string.
+        If False, src is treated as a path to a JSON Lines file, a directory or a glob pattern.
+        error_level (ErrorLevel): How malformed lines are handled. RAISE raises a ValueError,
+        IGNORE skips the line and WARN logs a warning and skips the line.
+        processes (int): Number of worker processes. A single file is decoded in batches of
+        lines by the workers, several files are loaded at once by them, each read into memory
+        as a whole. With 1 (default) everything is decoded in the current process.
+        batch_size (int): Number of lines sent to a worker process at once.
+        encoding (str): The encoding of the JSON Lines file (only used when reading from file).
+        fields (Iterable[str]): Names of the top-level keys to load. Only these values are
+        converted and missing keys are set to None. If None, all keys are loaded.
+        where (dict): Conditions on top-level values, e.g. {'level': 'ERROR'}. A condition is a
+        predicate or a value to compare for equality. Lines that do not match (or lack a
+        condition key) are skipped before they are converted to namedtuples.
+
+    Yields:
+        namedtuple: Each line of the input as a namedtuple.
+    """
+    # pylint: disable=too-many-arguments
+    if processes < 1:
+        raise ValueError("There must be at least one process")
+    fields = LoaderUtils.normalize_fields(fields)
+    predicates = LoaderUtils.normalize_predicates(where)
+    options = (error_level, processes, batch_size, fields, predicates)
+    if read_from_src:
+        return __lazy_load_jsonl(io.StringIO(src), *options)
+    paths = LoaderUtils.resolve_paths(src)
+    if len(paths) == 1:
+        return __lazy_load_jsonl_file(paths[0], encoding, options)
+    load = partial(__lazy_load_jsonl_file, encoding=encoding,
+                   options=(error_level, 1, batch_size, fields, predicates))
+    return LoaderUtils.load_files(load, paths, processes)
+
+
+def __lazy_load_jsonl_file(file_path, encoding, options):
+    """Lazily read a JSON Lines file line by line and yield namedtuples."""
+    # skipcq: PTC-W6004
+    with LoaderUtils.open_file(file_path, encoding) as jsonlfile:
+        yield from __lazy_load_jsonl(jsonlfile, *options)
+
+
+def __lazy_load_jsonl(handle, error_level, processes, batch_size, fields, predicates):
+    """Decode the lines of a text handle and yield namedtuples, skipping blank lines."""
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    handler = ErrorHandler()
+    handler._error_level(error_level, ValueError)
+    lines = ((number, line) for number, line in enumerate(handle, 1) if line.strip())
+    keys = __get_decoded_keys(fields, predicates)
+
+    if processes == 1:
+        decoded = (__decode_line(number, line, keys) for number, line in lines)
+        yield from __to_namedtuples(decoded, handler, fields, predicates)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for batch in bounded_map(executor, partial(__decode_batch, keys=keys),
+                                 batched(lines, batch_size), max_in_flight=2 * processes):
+            yield from __to_namedtuples(batch, handler, fields, predicates)
+
+
+def __get_decoded_keys(fields, predicates):
+    """Get the keys that have to be kept from a decoded line: the fields and predicate keys"""
+    if fields is None:
+        return None
+    return tuple(dict.fromkeys(fields + tuple(field for field, _ in predicates or ())))
+
+
+def __to_namedtuples(decoded, handler: ErrorHandler, fields, predicates):
+    """
+    Convert decoded lines that match the predicates to namedtuples.
+    Decoding errors are handled by the handler.
+    """
+    def convert(value):
+        """Raise the value if it is a decoding error, else convert it to a namedtuple."""
+        if isinstance(value, ValueError):
+            raise value
+        if predicates is not None and not __matches(value, predicates):
+            return _sentinel
+        if fields is not None and isinstance(value, dict):
+            value = {field: value.get(field) for field in fields}
+        return __dict_to_namedtuple(value)
+
+    for value in decoded:
+        item = handler._one(mapper=convert, item=value)
+        if item is not _sentinel:
+            yield item
+
+
+def __matches(value, predicates):
+    """Check whether a decoded line is an object with values matching the predicates"""
+    return isinstance(value, dict) and all(
+        field in value and predicate(value[field]) for field, predicate in predicates
+    )
+
+
+def __decode_batch(batch, keys=None):
+    """Decode a batch of numbered lines. Errors are returned instead of raised."""
+    return [__decode_line(number, line, keys) for number, line in batch]
+
+
+def __decode_line(number, line, keys=None):
+    """
+    Decode a single line and drop all keys not in keys (if given).
+    If it is malformed, a ValueError is returned instead of raised.
+    """
+    try:
+        value = json_lib.loads(line)
+    except ValueError as e:
+        return ValueError(f"Malformed JSON on line {number}: {e}")
+    if keys is not None and isinstance(value, dict):
+        return {key: value[key] for key in keys if key in value}
+    return value
+
+
+def __dict_to_namedtuple(d, name='Item'):
+    """Convert a dictionary (and any nested dicts/lists) to namedtuples recursively."""
+    if isinstance(d, dict):
+        Item = LoaderUtils.namedtuple_type(name, tuple(d.keys()))
+        return Item(*[__dict_to_namedtuple(v, k) for k, v in d.items()])
+    if isinstance(d, list):
+        return [__dict_to_namedtuple(item) for item in d]
+    return d
@@ -1,5 +1,14 @@
 import contextlib
+import glob
+import operator
 import os
+from collections import namedtuple
+from functools import lru_cache, partial
+
+from pystreamapi._io import compression
+
+# Picklable form of a namedtuple created by a loader, used to send records between processes
+_Record = namedtuple('_Record', ['name', 'fields', 'values'])
 
 
 class LoaderUtils:
@@ -14,6 +23,33 @@ class LoaderUtils:
         # Try to cast to bool
         return value.lower() == 'true' if value.lower() in ('true', 'false') else value
 
+    @staticmethod
+    def normalize_fields(fields):
+        """
+        Normalize a field projection to a tuple of field names. None means that all fields are
+        selected.
+        """
+        if fields is None:
+            return None
+        fields = (fields,) if isinstance(fields, str) else tuple(fields)
+        if not fields:
+            raise ValueError("At least one field must be selected.")
+        return fields
+
+    @staticmethod
+    def normalize_predicates(where):
+        """
+        Normalize field conditions to a tuple of (field, predicate) pairs. Conditions that are not
+        callable are compared to the field value for equality. None means that no conditions are
+        applied.
+        """
+        if not where:
+            return None
+        return tuple(
+            (field, condition if callable(condition) else partial(operator.eq, condition))
+            for field, condition in where.items()
+        )
+
     @staticmethod
     def validate_path(file_path: str):
         """Validate the path to the CSV file"""
@@ -22,3 +58,113 @@ class LoaderUtils:
         if not os.path.isfile(file_path):
             raise ValueError("The specified path is not a file.")
         return file_path
+
+    @staticmethod
+    def resolve_paths(src: str):
+        """
+        Resolve a source to a sorted list of file paths. The source can be a path to a file, a
+        directory (all files directly in it) or a glob pattern like 'logs/2026-*/part-*.csv'
+        (with '**' matching any number of directories). An existing file is never treated as a
+        pattern, even if its name contains '*', '?' or '['.
+        """
+        if glob.has_magic(src) and not os.path.isfile(src):
+            paths = sorted(path for path in glob.iglob(src, recursive=True)
+                           if os.path.isfile(path))
+            if not paths:
+                raise FileNotFoundError(f"No files match the pattern {src!r}.")
+            return paths
+        if os.path.isdir(src):
+            paths = sorted(entry.path for entry in os.scandir(src)
+                           if not entry.name.startswith('.') and os.path.isfile(entry.path))
+            if not paths:
+                raise ValueError("The specified directory does not contain any files.")
+            return paths
+        return [LoaderUtils.validate_path(src)]
+
+    @staticmethod
+    def load_files(load, paths, processes=1):
+        """
+        Lazily load several files with load (a function taking a path and returning an iterator)
+        and yield their items in the order of the paths. With more than one process, up to
+        processes files are loaded at once in worker processes. A worker reads a whole file into
+        memory before passing its items on, so loading in processes is not streaming: up to about
+        2 * processes files are held in memory at once.
+        """
+        if processes < 1:
+            raise ValueError("There must be at least one process")
+        processes = min(processes, len(paths))
+        if processes == 1:
+            return _load_files_sequentially(load, paths)
+        return _load_files_in_processes(load, paths, processes)
+
+    @staticmethod
+    def to_portable(value):
+        """
+        Convert the namedtuples in a loaded value to records that can be pickled (the namedtuple
+        types of the loaders are created at runtime and cannot be pickled)
+        """
+        if isinstance(value, tuple) and hasattr(value, '_fields'):
+            return _Record(type(value).__name__, value._fields,
+                           [LoaderUtils.to_portable(v) for v in value])
+        if isinstance(value, list):
+            return [LoaderUtils.to_portable(item) for item in value]
+        return value
+
+    @staticmethod
+    def from_portable(value):
+        """Convert records created by to_portable back to namedtuples"""
+        if isinstance(value, _Record):
+            cls = LoaderUtils.namedtuple_type(value.name, value.fields)
+            return cls(*[LoaderUtils.from_portable(v) for v in value.values])
+        if isinstance(value, list):
+            return [LoaderUtils.from_portable(item) for item in value]
+        return value
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def namedtuple_type(name, fields):
+        """Create a namedtuple type once per name and field combination"""
+        return namedtuple(name, fields)
+
+    @staticmethod
+    def detect_compression(file_path: str):
+        """
+        Detect the compression of a file from its extension or, if the extension is unknown, from
+        its magic bytes. Returns 'gzip', 'bz2', 'lzma', 'zstd' or None if it is not compressed.
+        """
+        return compression.detect_compression(file_path)
+
+    @staticmethod
+    def open_file(file_path: str, encoding='utf-8', newline=None):
+        """
+        Open a file for reading text. Compressed files (gzip, bz2, lzma/xz and zstd) are
+        decompressed on the fly, including files made of several concatenated members.
+        """
+        return compression.open_text(file_path, 'r', encoding, newline,
+                                     compression.detect_compression(file_path))
+
+
+def _load_files_sequentially(load, paths):
+    """Yield the items of the files one file after another"""
+    for path in paths:
+        yield from load(path)
+
+
+def _load_files_in_processes(load, paths, processes):
+    """Load the files in worker processes and yield their items in the order of the paths"""
+    # pylint: disable=import-outside-toplevel
+    from joblib import Parallel, delayed
+
+    results = Parallel(n_jobs=processes, return_as="generator", pre_dispatch="2*n_jobs")(
+        delayed(_load_portable_file)(load, path) for path in paths
+    )
+    for records in results:
+        yield from map(LoaderUtils.from_portable, records)
+
+
+def _load_portable_file(load, path):
+    """
+    Load all items of a file into a list and convert them to a picklable form. Results of worker
+    processes can only be returned as a whole.
+    """
+    return [LoaderUtils.to_portable(item) for item in load(path)]
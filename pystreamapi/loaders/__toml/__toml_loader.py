@@ -1,26 +1,34 @@
 from collections import namedtuple
 from typing import Any, Iterator
 
-import tomlkit
+try:
+    import tomllib
+except ImportError:  # Python < 3.11, tomlkit is used instead
+    tomllib = None
+
 from pystreamapi.loaders.__loader_utils import LoaderUtils
 
 
-def toml(src: str, read_from_src=False) -> Iterator[Any]:
+def toml(src: str, read_from_src=False, *, processes=1) -> Iterator[Any]:
     """
     Lazily loads TOML data from either a path or a string and yields namedtuples.
+    The data is parsed with the standard library tomllib (Python 3.11+) or else with tomlkit.
 
     Args:
-        src (str): Either the path to a TOML file or a TOML string.
+        src (str): Either the path to a TOML file, a directory, a glob pattern matching TOML
+        files or a TOML string.
         read_from_src (bool): If True, src is treated as a TOML string.
-        If False, src is treated as a path to a TOML file.
+        If False, src is treated as a path to a TOML file, a directory or a glob pattern.
+        processes (int): Number of worker processes used to load several files at once.
+            Each worker reads whole files into memory.
 
     Yields:
-        namedtuple: The TOML document as a namedtuple.
+        namedtuple: Each TOML document as a namedtuple.
     """
     if read_from_src:
         return __lazy_load_toml_string(src)
-    path = LoaderUtils.validate_path(src)
-    return __lazy_load_toml_file(path)
+    paths = LoaderUtils.resolve_paths(src)
+    return LoaderUtils.load_files(__lazy_load_toml_file, paths, processes)
 
 
 def __lazy_load_toml_file(file_path: str) -> Iterator[Any]:
@@ -29,12 +37,11 @@ def __lazy_load_toml_file(file_path: str) -> Iterator[Any]:
     def generator():
         """Generate a namedtuple from the TOML file contents."""
         # skipcq: PTC-W6004
-        with open(file_path, mode='r', encoding='utf-8') as tomlfile:
+        with LoaderUtils.open_file(file_path) as tomlfile:
             src = tomlfile.read()
             if not src.strip():
                 return
-            result = tomlkit.loads(src)
-            yield __dict_to_namedtuple(result)
+            yield __dict_to_namedtuple(__parse_toml(src))
 
     return generator()
 
@@ -46,12 +53,24 @@ def __lazy_load_toml_string(toml_string: str) -> Iterator[Any]:
         """Internal generator that yields a namedtuple by parsing the TOML string on demand."""
         if not toml_string.strip():
             return
-        result = tomlkit.loads(toml_string)
-        yield __dict_to_namedtuple(result)
+        yield __dict_to_namedtuple(__parse_toml(toml_string))
 
     return generator()
 
 
+def __parse_toml(src: str) -> dict:
+    """Parse a TOML string using tomllib if available, else tomlkit (imported on first use)"""
+    if tomllib is not None:
+        return tomllib.loads(src)
+    try:
+        import tomlkit  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "Please install the toml_loader extra dependency to use the toml loader."
+        ) from exc
+    return tomlkit.loads(src)
+
+
 def __dict_to_namedtuple(data, name='Item'):
     """Recursively convert a dictionary (or list) to namedtuples."""
     if isinstance(data, dict):
@@ -1,4 +1,5 @@
 import io
+from functools import lru_cache, partial
 from typing import Iterator, Any
 
 try:
@@ -7,12 +8,15 @@ except ImportError as exc:
     raise ImportError(
         "Please install the xml_loader extra dependency to use the xml loader."
     ) from exc
-from collections import namedtuple
 from pystreamapi.loaders.__loader_utils import LoaderUtils
 
+# Number of element shapes whose layout is kept while parsing a document
+_MAX_LAYOUTS = 1024
+
 
 def xml(src: str, read_from_src=False, retrieve_children=True, cast_types=True,
-        encoding="utf-8") -> Iterator[Any]:
+        encoding="utf-8", *, fields=None, where=None, record_path=None,
+        processes=1) -> Iterator[Any]:
     """
     Loads XML data from either a path or a string and converts it into a list of namedtuples.
     Warning: This method isn't safe against malicious XML trees. Parse only safe XML from sources
@@ -23,112 +27,196 @@ def xml(src: str, read_from_src=False, retrieve_children=True, cast_types=True,
         :param retrieve_children: If true, the children of the root element are used as stream
         elements.
         :param encoding: The encoding of the XML file.
-        :param src: Either the path to an XML file or an XML string.
+        :param src: Either the path to an XML file, a directory, a glob pattern matching XML files
+            or an XML string. The files are loaded one after another.
         :param read_from_src: If True, src is treated as an XML string. If False, src is treated as
-            a path to an XML file.
+            a path to an XML file, a directory or a glob pattern.
         :param cast_types: Set as False to disable casting of values to int, bool or float.
+        :param fields: Tags of the child elements to load from each element. Other children are
+            not parsed and missing ones are set to None. If None, all children are loaded.
+        :param where: Conditions on child element values, e.g. {'salary': greater_than(50000)}.
+            A condition is a predicate or a value to compare for equality. The condition
+            children are checked before the rest of the element is parsed and elements that do
+            not match (or lack a condition child) are skipped.
+        :param record_path: Path of the elements to use as stream elements, starting at the
+            root element, e.g. '/feed/entries/entry'. A '*' segment matches any tag and tags
+            match with or without their namespace. Overrides retrieve_children.
+        :param processes: Number of worker processes used to load several files at once.
+            Each worker reads whole files into memory.
     """
+    # pylint: disable=too-many-arguments
+    fields = LoaderUtils.normalize_fields(fields)
+    predicates = LoaderUtils.normalize_predicates(where)
+    if record_path is not None:
+        segments = __parse_record_path(record_path)
+    else:
+        segments = ('*', '*') if retrieve_children else ('*',)
     if read_from_src:
-        return _lazy_parse_xml_string(src, retrieve_children, cast_types)
+        return _lazy_parse_xml_string(src, segments, cast_types, fields, predicates)
+
+    paths = LoaderUtils.resolve_paths(src)
+    load = partial(_lazy_parse_xml_file, encoding=encoding, segments=segments,
+                   cast_types=cast_types, fields=fields, predicates=predicates)
+    return LoaderUtils.load_files(load, paths, processes)
+
 
-    path = LoaderUtils.validate_path(src)
-    return _lazy_parse_xml_file(path, encoding, retrieve_children, cast_types)
+def __parse_record_path(record_path: str):
+    """Split a record path into its segments"""
+    segments = tuple(record_path.strip('/').split('/'))
+    if not all(segments):
+        raise ValueError(f"Invalid record path: {record_path!r}")
+    return segments
 
 
-def _lazy_parse_xml_file(file_path: str, encoding: str,
-                         retrieve_children: bool, cast_types: bool) -> Iterator[Any]:
+def _lazy_parse_xml_file(file_path: str, *, encoding: str, segments, cast_types: bool,
+                         fields=None, predicates=None) -> Iterator[Any]:
     """
     Lazily parse an XML file using iterparse, yielding namedtuples
     without reading all at once.
     """
+    # pylint: disable=too-many-arguments
     def generator():
         """
         Generator that streams XML elements from the file and yields
         namedtuples lazily.
         """
         # skipcq: PTC-W6004
-        with open(file_path, mode='r', encoding=encoding) as xmlfile:
-            yield from _iterparse_xml(xmlfile, retrieve_children, cast_types)
+        with LoaderUtils.open_file(file_path, encoding) as xmlfile:
+            yield from _iterparse_xml(xmlfile, segments, cast_types, fields, predicates)
 
     return generator()
 
 
-def _lazy_parse_xml_string(xml_string: str, retrieve_children: bool,
-                           cast_types: bool) -> Iterator[Any]:
+def _lazy_parse_xml_string(xml_string: str, segments, cast_types: bool, fields=None,
+                           predicates=None) -> Iterator[Any]:
     """Lazily parse an XML string using iterparse, yielding namedtuples without a full DOM build."""
     def generator():
         """Generator that streams XML elements from a string source and yields namedtuples."""
-        yield from _iterparse_xml(io.StringIO(xml_string), retrieve_children, cast_types)
+        yield from _iterparse_xml(io.StringIO(xml_string), segments, cast_types, fields,
+                                  predicates)
 
     return generator()
 
 
-def _iterparse_xml(source: "IO[Any]", retrieve_children: bool, cast_types: bool) -> Iterator[Any]:
+def _iterparse_xml(source: "IO[Any]", segments, cast_types: bool, fields=None,
+                   predicates=None) -> Iterator[Any]:
     """Drive iterparse over *source* and yield namedtuples incrementally.
 
-    When *retrieve_children* is True each direct child of the root element is
-    converted and yielded as soon as its closing tag is encountered; the child
-    is then removed from the root so that memory is freed immediately.
+    Every element whose path from the root matches *segments* is converted and
+    yielded as soon as its closing tag is encountered. It is then cleared and
+    removed from its parent, as is every other element that is closed outside
+    of a record, so that memory is freed immediately whatever the depth of the
+    records.
 
-    When *retrieve_children* is False the entire document is consumed and the
-    root element is converted and yielded once.
+    If *fields* is given, only the children with these tags are parsed for each
+    yielded element. If *predicates* are given, elements whose children do not
+    match them are skipped before they are parsed.
     """
-    depth = 0
-    root = None
+    parser = _XmlElementParser(cast_types)
+    # Open elements and whether their path is a prefix of the record path
+    stack, on_path = [], []
+    record_depth = 0
     context = ElementTree.iterparse(source, events=('start', 'end'))
 
     for event, elem in context:
         if event == 'start':
-            depth += 1
-            if root is None:
-                root = elem
-        else:  # 'end'
-            depth -= 1
-            if retrieve_children:
-                if depth == 1:
-                    yield __parse_xml(elem, cast_types)
-                    elem.clear()
-                    root.remove(elem)
-            else:
-                if depth == 0:
-                    yield __parse_xml(root, cast_types)
-                    return
-
-
-def __parse_xml(element, cast_types: bool):
-    """Parse XML element and convert it into a namedtuple."""
-    if len(element) == 0:
-        return __parse_empty_element(element, cast_types)
-    if len(element) == 1:
-        return __parse_single_element(element, cast_types)
-    return __parse_multiple_elements(element, cast_types)
-
-
-def __parse_empty_element(element, cast_types: bool):
-    """Parse XML element without children and convert it into a namedtuple."""
-    return LoaderUtils.try_cast(element.text) if cast_types else element.text
-
-
-def __parse_single_element(element, cast_types: bool):
-    """Parse XML element with a single child and convert it into a namedtuple."""
-    sub_element = element[0]
-    sub_item = __parse_xml(sub_element, cast_types)
-    Item = namedtuple(element.tag, [sub_element.tag])
-    return Item(sub_item)
-
-
-def __parse_multiple_elements(element, cast_types: bool):
-    """Parse XML element with multiple children and convert it into a namedtuple."""
-    tag_dict = {}
-    for e in element:
-        if e.tag not in tag_dict:
-            tag_dict[e.tag] = []
-        tag_dict[e.tag].append(__parse_xml(e, cast_types))
-    filtered_dict = __filter_single_items(tag_dict)
-    Item = namedtuple(element.tag, filtered_dict.keys())
-    return Item(*filtered_dict.values())
-
-
-def __filter_single_items(tag_dict):
-    """Filter out single-item lists from a dictionary."""
-    return {key: value[0] if len(value) == 1 else value for key, value in tag_dict.items()}
+            depth = len(stack)
+            stack.append(elem)
+            if record_depth:
+                continue
+            matches = (depth < len(segments) and (depth == 0 or on_path[-1])
+                       and __tag_matches(segments[depth], elem.tag))
+            on_path.append(matches)
+            if matches and depth + 1 == len(segments):
+                record_depth = depth + 1
+            continue
+
+        # 'end'
+        depth = len(stack)
+        stack.pop()
+        if record_depth and depth > record_depth:
+            continue  # part of the current record
+        if record_depth:
+            record_depth = 0
+            if parser.matches(elem, predicates):
+                yield parser.parse(elem, fields)
+        on_path.pop()
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+
+def __tag_matches(segment: str, tag: str) -> bool:
+    """Check if a tag matches a record path segment, ignoring the namespace of the tag"""
+    return segment in ('*', tag) or (tag.startswith('{') and tag.rpartition('}')[2] == segment)
+
+
+class _XmlElementParser:
+    """
+    Converts XML elements into namedtuples.
+
+    The layout of every element shape (its tag and the tags of its children) is learned
+    once: the namedtuple class and the positions of the children of each field are kept in an
+    LRU cache of the most recent shapes, so repetitive records are filled directly without
+    creating classes or intermediate dicts.
+    """
+
+    def __init__(self, cast_types: bool):
+        self.__cast_types = cast_types
+        self.__layouts = lru_cache(maxsize=_MAX_LAYOUTS)(self.__create_layout)
+
+    def parse(self, element, fields=None):
+        """Parse XML element and convert it into a namedtuple."""
+        if len(element) == 0:
+            return self.__parse_empty_element(element)
+        if fields is not None:
+            return self.__parse_projected_element(element, fields)
+        Item, layout = self.__get_layout(element)
+        children = list(element)
+        return Item(*[
+            self.parse(children[positions]) if isinstance(positions, int)
+            else [self.parse(children[position]) for position in positions]
+            for positions in layout
+        ])
+
+    def matches(self, element, predicates) -> bool:
+        """Check the children of an XML element with the predicate tags against the predicates."""
+        if predicates is None:
+            return True
+        for tag, predicate in predicates:
+            values = [self.parse(e) for e in element if e.tag == tag]
+            if not values:
+                return False
+            if not predicate(values[0] if len(values) == 1 else values):
+                return False
+        return True
+
+    def __parse_empty_element(self, element):
+        """Parse XML element without children and convert it into a namedtuple."""
+        return LoaderUtils.try_cast(element.text) if self.__cast_types else element.text
+
+    def __parse_projected_element(self, element, fields):
+        """Parse only the children of an XML element with the selected tags into a namedtuple."""
+        tag_dict = {}
+        for e in element:
+            if e.tag in fields:
+                tag_dict.setdefault(e.tag, []).append(self.parse(e))
+        values = [tag_dict.get(field) for field in fields]
+        Item = LoaderUtils.namedtuple_type(element.tag, fields)
+        return Item(*[value[0] if value and len(value) == 1 else value for value in values])
+
+    def __get_layout(self, element):
+        """
+        Get the namedtuple class of an element and, for each of its fields, the position of the
+        child element or a tuple of positions if the tag occurs several times.
+        """
+        return self.__layouts(element.tag, tuple(child.tag for child in element))
+
+    @staticmethod
+    def __create_layout(tag, child_tags):
+        """Create the layout of an element with the tag and the child tags"""
+        positions = {}
+        for position, child_tag in enumerate(child_tags):
+            positions.setdefault(child_tag, []).append(position)
+        Item = LoaderUtils.namedtuple_type(tag, tuple(positions))
+        return Item, [p[0] if len(p) == 1 else tuple(p) for p in positions.values()]
@@ -1,49 +1,111 @@
+from collections import namedtuple
 from typing import Any, Iterator
 
 try:
     import yaml as yaml_lib
+    from yaml.composer import Composer
+    from yaml.constructor import SafeConstructor
+    from yaml.events import SequenceEndEvent, SequenceStartEvent, StreamEndEvent
+    from yaml.parser import Parser
+    from yaml.reader import Reader
+    from yaml.resolver import Resolver
+    from yaml.scanner import Scanner
 except ImportError as exc:
     raise ImportError(
         "Please install the yaml_loader extra dependency to use the yaml loader."
     ) from exc
-from collections import namedtuple
 
 from pystreamapi.loaders.__loader_utils import LoaderUtils
 
 
-def yaml(src: str, read_from_src=False) -> Iterator[Any]:
+class _PyParser(Reader, Scanner, Parser):
+    """Pure Python YAML event parser, used if libyaml is not available"""
+
+    def __init__(self, stream):
+        Reader.__init__(self, stream)
+        Scanner.__init__(self)
+        Parser.__init__(self)
+
+
+# yaml.cyaml is only imported by yaml if libyaml is available
+_Parser = yaml_lib.cyaml.CParser if yaml_lib.__with_libyaml__ else _PyParser
+
+
+# The parser, composer, constructor and resolver of PyYAML are mixins with several bases each
+class _StreamingSafeLoader(_Parser, Composer, SafeConstructor, Resolver):  # pylint: disable=too-many-ancestors
+    """
+    Safe YAML loader that can compose and construct single nodes of a document, so that the
+    items of a top-level sequence are built one at a time. Uses libyaml if available.
+    """
+
+    def __init__(self, stream):
+        _Parser.__init__(self, stream)
+        Composer.__init__(self)
+        SafeConstructor.__init__(self)
+        Resolver.__init__(self)
+
+
+def yaml(src: str, read_from_src=False, *, processes=1) -> Iterator[Any]:
     """
     Loads YAML data from either a path or a string and converts it into a list of namedtuples.
+    Items of top-level sequences are yielded as soon as they are parsed, so large sequences
+    are loaded in constant memory.
 
     Args:
-        src (str): Either the path to a YAML file or a YAML string.
+        src (str): Either the path to a YAML file, a directory, a glob pattern matching YAML
+            files or a YAML string. The files are loaded one after another.
         read_from_src (bool): If True, src is treated as a YAML string. If False, src is treated as
-            a path to a YAML file.
+            a path to a YAML file, a directory or a glob pattern.
+        processes (int): Number of worker processes used to load several files at once.
+            Each worker reads whole files into memory.
 
     Returns:
         list: A list of namedtuples, where each namedtuple represents an object in the YAML.
     """
     if read_from_src:
         return __load_yaml_string(src)
-    path = LoaderUtils.validate_path(src)
-    return __load_yaml_file(path)
+    paths = LoaderUtils.resolve_paths(src)
+    return LoaderUtils.load_files(__load_yaml_file, paths, processes)
 
 
 def __load_yaml_file(file_path):
     """Load a YAML file and convert it into a list of namedtuples"""
     # skipcq: PTC-W6004
-    with open(file_path, 'r', encoding='utf-8') as yamlfile:
+    with LoaderUtils.open_file(file_path) as yamlfile:
         # Supports both single and multiple documents
-        for document in yaml_lib.safe_load_all(yamlfile):
-            if document:
-                yield from __convert_to_namedtuples(document)
+        yield from __stream_yaml_items(yamlfile)
 
 
 def __load_yaml_string(yaml_string):
     """Load YAML data from a string and convert it into a list of namedtuples"""
-    for document in yaml_lib.safe_load_all(yaml_string):
-        if document:
-            yield from __convert_to_namedtuples(document)
+    yield from __stream_yaml_items(yaml_string)
+
+
+def __stream_yaml_items(stream):
+    """
+    Parse all documents of a YAML stream event by event. The items of a document that is a
+    sequence are composed, constructed and converted one at a time. Other documents are loaded
+    as a whole.
+    """
+    loader = _StreamingSafeLoader(stream)
+    try:
+        loader.get_event()  # StreamStartEvent
+        while not loader.check_event(StreamEndEvent):
+            loader.get_event()  # DocumentStartEvent
+            if loader.check_event(SequenceStartEvent):
+                loader.get_event()
+                while not loader.check_event(SequenceEndEvent):
+                    node = loader.compose_node(None, None)
+                    yield __convert_to_namedtuples(loader.construct_document(node))
+                loader.get_event()
+            else:
+                document = loader.construct_document(loader.compose_node(None, None))
+                if document:
+                    yield from __convert_to_namedtuples(document)
+            loader.get_event()  # DocumentEndEvent
+            loader.anchors = {}
+    finally:
+        loader.dispose()
 
 
 def __convert_to_namedtuples(data, name='Item'):
@@ -0,0 +1,64 @@
+from csv import writer as csv_writer
+from itertools import chain
+from typing import Any, Iterable
+
+from pystreamapi._itertools.tools import batched
+from pystreamapi.writers.__writer_utils import WriterUtils, _BATCH_SIZE
+
+_missing = object()
+
+
+def csv(rows: Iterable[Any], path: str, delimiter=',', fields=None, header=True,
+        encoding="utf-8", compression=None) -> int:
+    """
+    Writes rows to a CSV file. The rows are consumed one batch at a time, so they do not have to
+    fit into memory.
+
+    Args:
+        rows (Iterable): The rows to write. Namedtuples (e.g. from the loaders) and dicts are
+        written by field, other sequences as they are and other values as a single column.
+        path (str): The path of the CSV file.
+        delimiter (str): The delimiter used in the CSV file.
+        fields (Iterable[str]): The columns to write from namedtuples and dicts, in this order.
+        Missing fields are written as empty values. Defaults to the fields of the first row.
+        header (bool): Set as False to not write a header row with the fields.
+        encoding (str): The encoding of the CSV file.
+        compression (str): 'gzip', 'bz2', 'lzma' or 'zstd'. If None, the compression is
+        detected from the extension of the path (e.g. 'data.csv.gz').
+
+    Returns:
+        int: The number of rows written.
+    """
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    rows = iter(rows)
+    first = next(rows, _missing)
+    if fields is not None:
+        fields = (fields,) if isinstance(fields, str) else tuple(fields)
+    elif first is not _missing:
+        fields = WriterUtils.get_fields(first)
+
+    count = 0
+    with WriterUtils.open_file(path, encoding, '', compression) as csvfile:
+        writer = csv_writer(csvfile, delimiter=delimiter)
+        if header and fields:
+            writer.writerow(fields)
+        if first is _missing:
+            return count
+        for batch in batched(chain((first,), rows), _BATCH_SIZE):
+            writer.writerows(__to_values(row, fields) for row in batch)
+            count += len(batch)
+    return count
+
+
+def __to_values(row, fields):
+    """Get the values of a row in the order of the fields"""
+    if fields is not None:
+        if isinstance(row, dict):
+            return [row.get(field) for field in fields]
+        if isinstance(row, tuple) and hasattr(row, '_fields'):
+            if row._fields == fields:
+                return row
+            return [getattr(row, field, None) for field in fields]
+    if isinstance(row, (list, tuple)):
+        return row
+    return [row]
@@ -0,0 +1,5 @@
+from pystreamapi.writers.__csv.__csv_writer import csv
+from pystreamapi.writers.__jsonl.__jsonl_writer import jsonl
+from pystreamapi.writers.__xml.__xml_writer import xml
+
+__all__ = ['csv', 'jsonl', 'xml']
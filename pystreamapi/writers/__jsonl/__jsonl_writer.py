@@ -0,0 +1,27 @@
+import json as json_lib
+from typing import Any, Iterable
+
+from pystreamapi.writers.__writer_utils import WriterUtils
+
+
+def jsonl(rows: Iterable[Any], path: str, encoding="utf-8", compression=None) -> int:
+    """
+    Writes rows to a JSON Lines (NDJSON) file, one JSON value per line. The rows are consumed
+    one batch at a time, so they do not have to fit into memory.
+
+    Args:
+        rows (Iterable): The rows to write. Namedtuples (e.g. from the loaders) are written as
+        objects. Values that are not serializable to JSON (e.g. dates) are written as strings.
+        path (str): The path of the JSON Lines file.
+        encoding (str): The encoding of the JSON Lines file.
+        compression (str): 'gzip', 'bz2', 'lzma' or 'zstd'. If None, the compression is
+        detected from the extension of the path (e.g. 'data.jsonl.gz').
+
+    Returns:
+        int: The number of rows written.
+    """
+    encode = json_lib.JSONEncoder(ensure_ascii=False, default=str).encode
+    with WriterUtils.open_file(path, encoding, compression=compression) as jsonlfile:
+        return WriterUtils.write_lines(
+            jsonlfile, (f"{encode(WriterUtils.to_builtin(row))}\n" for row in rows)
+        )
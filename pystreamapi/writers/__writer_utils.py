@@ -0,0 +1,47 @@
+from pystreamapi._io import compression as compression_lib
+from pystreamapi._itertools.tools import batched
+
+_BATCH_SIZE = 1000
+
+
+class WriterUtils:
+    """Utility class for writers to open files and convert rows"""
+
+    @staticmethod
+    def open_file(file_path: str, encoding='utf-8', newline=None, compression=None):
+        """
+        Open a file for writing text. The data is compressed on the fly with the compression
+        ('gzip', 'bz2', 'lzma' or 'zstd'), which is detected from the extension if it is None.
+        """
+        if compression is None:
+            compression = compression_lib.compression_from_extension(file_path)
+        return compression_lib.open_text(file_path, 'w', encoding, newline, compression)
+
+    @staticmethod
+    def write_lines(file, lines) -> int:
+        """Write the lines to the file in batches and return the number of lines written"""
+        count = 0
+        for batch in batched(lines, _BATCH_SIZE):
+            file.write(''.join(batch))
+            count += len(batch)
+        return count
+
+    @staticmethod
+    def get_fields(row):
+        """Get the field names of a namedtuple or dict row or None for other rows"""
+        if isinstance(row, dict):
+            return tuple(row.keys())
+        if isinstance(row, tuple) and hasattr(row, '_fields'):
+            return row._fields
+        return None
+
+    @staticmethod
+    def to_builtin(value):
+        """Convert namedtuples (e.g. from the loaders) in a value to dicts, recursively"""
+        if isinstance(value, tuple) and hasattr(value, '_fields'):
+            return {field: WriterUtils.to_builtin(v) for field, v in zip(value._fields, value)}
+        if isinstance(value, dict):
+            return {key: WriterUtils.to_builtin(v) for key, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [WriterUtils.to_builtin(item) for item in value]
+        return value
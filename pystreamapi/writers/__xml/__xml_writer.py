@@ -0,0 +1,64 @@
+import re
+from functools import lru_cache
+from typing import Any, Iterable
+from xml.sax.saxutils import escape
+
+from pystreamapi.writers.__writer_utils import WriterUtils
+
+_TAG = re.compile(r'[^\W\d][\w.-]*')
+
+
+def xml(rows: Iterable[Any], path: str, root_tag='root', row_tag='item', encoding="utf-8",
+        compression=None) -> int:
+    """
+    Writes rows to an XML file as children of a root element. The rows are consumed one batch
+    at a time, so they do not have to fit into memory.
+
+    Returns:
+        The number of rows written.
+        :param rows: The rows to write. The fields of namedtuples (e.g. from the loaders) and
+            dicts are written as child elements, lists as repeated elements and other values as
+            text.
+        :param path: The path of the XML file.
+        :param root_tag: The tag of the root element.
+        :param row_tag: The tag of the element of each row.
+        :param encoding: The encoding of the XML file.
+        :param compression: 'gzip', 'bz2', 'lzma' or 'zstd'. If None, the compression is
+            detected from the extension of the path (e.g. 'data.xml.gz').
+        :raises ValueError: If a tag or a field name is not a valid XML tag, e.g. because it
+            contains spaces or starts with a digit.
+    """
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    __check_tag(root_tag)
+    __check_tag(row_tag)
+    with WriterUtils.open_file(path, encoding, compression=compression) as xmlfile:
+        xmlfile.write(f'<?xml version="1.0" encoding="{encoding}"?>\n<{root_tag}>\n')
+        count = WriterUtils.write_lines(
+            xmlfile, (f"{__to_element(row_tag, row)}\n" for row in rows)
+        )
+        xmlfile.write(f'</{root_tag}>\n')
+    return count
+
+
+def __to_element(tag, value):
+    """Convert a value to an XML element with the given tag"""
+    if isinstance(value, tuple) and hasattr(value, '_fields'):
+        value = dict(zip(value._fields, value))
+    if isinstance(value, dict):
+        children = ''.join(__to_element(__check_tag(key), child) for key, child in value.items())
+        return f'<{tag}>{children}</{tag}>'
+    if isinstance(value, (list, tuple)):
+        return ''.join(__to_element(tag, item) for item in value)
+    if value is None:
+        return f'<{tag}/>'
+    if isinstance(value, bool):
+        return f'<{tag}>{str(value).lower()}</{tag}>'
+    return f'<{tag}>{escape(str(value))}</{tag}>'
+
+
+@lru_cache(maxsize=1024)
+def __check_tag(tag):
+    """Return the tag if it is a valid XML tag or raise a ValueError"""
+    if not isinstance(tag, str) or not _TAG.fullmatch(tag):
+        raise ValueError(f"{tag!r} is not a valid XML tag")
+    return tag
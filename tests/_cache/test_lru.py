@@ -0,0 +1,149 @@
+import pickle
+import threading
+import unittest
+from unittest.mock import patch
+
+
+from pystreamapi._cache.lru import CachedFunction, LRUCache, estimate_size
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_get_and_put(self):
+        cache = LRUCache()
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("b", 2), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertAlmostEqual(cache.hit_rate, 1 / 3)
+
+    def test_hit_rate_without_lookups(self):
+        self.assertEqual(LRUCache().hit_rate, 0.0)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_put_replaces_value(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("a", 2)
+        self.assertEqual(cache.get("a"), 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_maxsize_zero_stores_nothing(self):
+        cache = LRUCache(maxsize=0)
+        cache.put("a", 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_unbounded(self):
+        cache = LRUCache(maxsize=None)
+        for i in range(1000):
+            cache.put(i, i)
+        self.assertEqual(len(cache), 1000)
+
+    def test_negative_maxsize(self):
+        self.assertRaises(ValueError, LRUCache, -1)
+
+    @patch("pystreamapi._cache.lru.time.monotonic")
+    def test_ttl(self, monotonic):
+        monotonic.return_value = 100.0
+        cache = LRUCache(ttl=10)
+        cache.put("a", 1)
+        monotonic.return_value = 109.5
+        self.assertEqual(cache.get("a"), 1)
+        monotonic.return_value = 110.0
+        self.assertNotIn("a", cache)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_max_bytes(self):
+        cache = LRUCache(max_bytes=100, sizeof=len)
+        cache.put("a", "x" * 40)
+        cache.put("b", "x" * 40)
+        cache.put("c", "x" * 40)
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.size_bytes, 80)
+        cache.put("d", "x" * 101)
+        self.assertNotIn("d", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_clear(self):
+        cache = LRUCache(max_bytes=100, sizeof=len)
+        cache.put("a", "xy")
+        cache.get("a")
+        cache.clear()
+        self.assertEqual((len(cache), cache.size_bytes, cache.hits, cache.misses), (0, 0, 0, 0))
+
+    def test_estimate_size(self):
+        self.assertGreater(estimate_size([1, "abc"]), estimate_size([]))
+        self.assertGreater(estimate_size({"a": "abc"}), estimate_size({}))
+        self.assertEqual(estimate_size(1), estimate_size(2))
+
+    def test_thread_safe(self):
+        cache = LRUCache(maxsize=50)
+
+        def work(offset):
+            for i in range(2000):
+                cache.put((offset, i % 100), i)
+                cache.get((offset, (i * 7) % 100))
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(cache), 50)
+        self.assertEqual(cache.hits + cache.misses, 8000)
+
+    def test_can_be_pickled(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        restored = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(restored.get("a"), 1)
+        restored.put("b", 2)
+        restored.put("c", 3)
+        self.assertEqual(len(restored), 2)
+
+
+class TestCachedFunction(unittest.TestCase):
+
+    def test_calls_function_once_per_key(self):
+        calls = []
+        function = CachedFunction(lambda x: calls.append(x) or x * 2)
+        self.assertEqual([function(x) for x in [1, 2, 1, 1]], [2, 4, 2, 2])
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual((function.cache.hits, function.cache.misses), (2, 2))
+
+    def test_key(self):
+        function = CachedFunction(len, key=lambda x: x[0])
+        self.assertEqual(function("ab"), 2)
+        self.assertEqual(function("abc"), 2)
+
+    def test_maxsize(self):
+        calls = []
+        function = CachedFunction(calls.append, maxsize=1)
+        for x in [1, 2, 1]:
+            function(x)
+        self.assertEqual(calls, [1, 2, 1])
+
+    def test_exceptions_are_not_cached(self):
+        function = CachedFunction(lambda x: 1 / x)
+        for _ in range(2):
+            self.assertRaises(ZeroDivisionError, function, 0)
+        self.assertEqual(len(function.cache), 0)
+
+    def test_name(self):
+        self.assertEqual(CachedFunction(str).__name__, "str")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,230 @@
+import gc
+import pickle
+import unittest
+import weakref
+
+from pystreamapi import ErrorLevel, ResultCache, Stream
+from pystreamapi._lazy.process import Process
+from pystreamapi._streams.__parallel_stream import ParallelStream
+from pystreamapi._streams.__sequential_stream import SequentialStream
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+def inverse(x):
+    return 1 / x
+
+
+def numbers():
+    yield from [1, 2, 3]
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ResultCache()
+        self.calls = 0
+
+    def even(self, x):
+        self.calls += 1
+        return is_even(x)
+
+    def test_repeated_pipeline_uses_cache(self):
+        source = list(range(10))
+        first = Stream.of(source).cache(self.cache).filter(self.even).to_list()
+        calls = self.calls
+        second = Stream.of(source).cache(self.cache).filter(self.even).to_list()
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, calls)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_cached_result_is_copied(self):
+        source = [1, 2]
+        first = Stream.of(source).cache(self.cache).to_list()
+        first.append(3)
+        second = Stream.of(source).cache(self.cache).to_list()
+        second.append(4)
+        self.assertEqual(Stream.of(source).cache(self.cache).to_list(), [1, 2])
+
+    def test_nested_cached_result_is_copied(self):
+        source = [1, 2, 3]
+        first = Stream.of(source).cache(self.cache).to_dict(is_even)
+        first[False].append(99)
+        second = Stream.of(source).cache(self.cache).to_dict(is_even)
+        second[True].append(99)
+        self.assertEqual(Stream.of(source).cache(self.cache).to_dict(is_even),
+                         {False: [1, 3], True: [2]})
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_stream_is_closed_on_hit(self):
+        source = [1]
+        Stream.of(source).cache(self.cache).count()
+        stream = Stream.of(source).cache(self.cache)
+        stream.count()
+        self.assertRaises(RuntimeError, stream.count)
+
+    def test_different_operations_are_not_shared(self):
+        source = [1, 2, 3]
+        self.assertEqual(Stream.of(source).cache(self.cache).filter(is_even).to_list(), [2])
+        self.assertEqual(Stream.of(source).cache(self.cache).map(str).to_list(),
+                         ["1", "2", "3"])
+        self.assertEqual(Stream.of(source).cache(self.cache).limit(1).to_list(), [1])
+        self.assertEqual(Stream.of(source).cache(self.cache).limit(2).to_list(), [1, 2])
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_different_terminals_are_not_shared(self):
+        source = [1, 2, 3]
+        self.assertEqual(Stream.of(source).cache(self.cache).to_tuple(), (1, 2, 3))
+        self.assertEqual(Stream.of(source).cache(self.cache).to_list(), [1, 2, 3])
+        self.assertEqual(Stream.of(source).cache(self.cache).reduce(max).get(), 3)
+        self.assertEqual(Stream.of(source).cache(self.cache).reduce(min).get(), 1)
+        self.assertEqual(Stream.of(source).cache(self.cache).reduce(min, 0), 1)
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_numeric_terminals(self):
+        source = [1, 2, 3]
+        self.assertEqual(Stream.of(source).cache(self.cache).sum(), 6)
+        self.assertEqual(Stream.of(source).cache(self.cache).sum(), 6)
+        self.assertEqual(Stream.of(source).cache(self.cache).mean(), 2)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_lambdas_are_compared_by_identity(self):
+        source = [1, 2, 3]
+        for _ in range(2):
+            Stream.of(source).cache(self.cache).map(lambda x: x * 2).to_list()
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_key_identifies_source(self):
+        for _ in range(2):
+            result = Stream.of([1, 2, 3]).cache(self.cache, key="numbers").filter(self.even) \
+                .to_list()
+        self.assertEqual(result, [2])
+        self.assertEqual(self.cache.hits, 1)
+        Stream.of([1, 2, 3]).cache(self.cache, key="other").filter(self.even).to_list()
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_key_includes_terminal_arguments(self):
+        source = [1, 2, 3, 4]
+        self.assertEqual(Stream.of(source).cache(self.cache, key="k")
+                         .reduce(lambda a, b: a + b, identity=0), 10)
+        self.assertEqual(Stream.of(source).cache(self.cache, key="k")
+                         .reduce(lambda a, b: a * b, identity=1), 24)
+        self.assertEqual(Stream.of(source).cache(self.cache, key="k").to_dict(is_even),
+                         {False: [1, 3], True: [2, 4]})
+        self.assertEqual(Stream.of(source).cache(self.cache, key="k").to_dict(str),
+                         {"1": [1], "2": [2], "3": [3], "4": [4]})
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_key_includes_error_level(self):
+        source = [1, 0, 3]
+        result = Stream.of(source).cache(self.cache).error_level(ErrorLevel.IGNORE) \
+            .map(inverse).to_list()
+        self.assertEqual(result, [1.0, 1 / 3])
+        with self.assertRaises(ZeroDivisionError):
+            Stream.of(source).cache(self.cache).error_level(ErrorLevel.RAISE).map(inverse).to_list()
+        with self.assertRaises(ZeroDivisionError):
+            Stream.of(source).cache(self.cache).error_level(ErrorLevel.IGNORE, ValueError) \
+                .map(inverse).to_list()
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_source_compared_by_identity(self):
+        Stream.of([1, 2]).cache(self.cache).to_list()
+        self.assertEqual(Stream.of([1, 2, 3]).cache(self.cache).to_list(), [1, 2, 3])
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_version(self):
+        def source():
+            yield from [1, 2, 3]
+
+        self.assertEqual(Stream.of(source()).cache(self.cache, version=1).to_list(), [1, 2, 3])
+        self.assertEqual(Stream.of(source()).cache(self.cache, version=1).to_list(), [1, 2, 3])
+        self.assertEqual(self.cache.hits, 1)
+        Stream.of(source()).cache(self.cache, version=2).to_list()
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_parallel_and_sequential_streams(self):
+        source = list(range(100))
+        result = ParallelStream(source).cache(self.cache).filter(is_even).to_list()
+        self.assertEqual(SequentialStream(source).cache(self.cache).filter(is_even).to_list(),
+                         result)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_for_each_is_not_cached(self):
+        source = [1, 2]
+        seen = []
+        Stream.of(source).cache(self.cache).for_each(seen.append)
+        Stream.of(source).cache(self.cache).for_each(seen.append)
+        self.assertEqual(seen, [1, 2, 1, 2])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_exceptions_are_not_cached(self):
+        source = [1, 0]
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                Stream.of(source).cache(self.cache).map(inverse).to_list()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_shared_cache(self):
+        source = (7, 8)
+        Stream.of(source).cache().to_list()
+        stream = Stream.of(source).cache()
+        self.assertEqual(stream.to_list(), [7, 8])
+
+    def test_key_of_unhashable_arguments(self):
+        source, mapping = [1], {"a": 1}
+        key = ResultCache.make_key(source, [Process(str, mapping)], "to_list", (), {})
+        self.assertEqual(key, ResultCache.make_key(source, [Process(str, mapping)], "to_list", (),
+                                                   {}))
+        self.assertNotEqual(key, ResultCache.make_key(source, [Process(str, {"a": 1})], "to_list",
+                                                      (), {}))
+        hash(key)
+
+    def test_weak_referenced_source_is_not_kept_alive(self):
+        source = numbers()
+        reference = weakref.ref(source)
+        self.assertEqual(Stream.of(source).cache(self.cache).to_list(), [1, 2, 3])
+        del source
+        gc.collect()
+        self.assertIsNone(reference())
+        self.assertEqual(len(self.cache), 1)
+
+    def test_dead_source_does_not_match(self):
+        key = ResultCache.make_key(numbers(), [], "to_list", (), {})
+        gc.collect()
+        self.assertNotEqual(key, ResultCache.make_key(numbers(), [], "to_list", (), {}))
+        self.assertEqual(key, key)
+
+    def test_max_bytes_counts_source(self):
+        cache = ResultCache(max_bytes=2000)
+        source = list(range(1000))
+        Stream.of(source).cache(cache).limit(1).to_tuple()
+        self.assertEqual(len(cache), 0)
+        Stream.of(numbers()).cache(cache).to_tuple()
+        self.assertEqual(len(cache), 1)
+
+    def test_pickle_keeps_entries_unmatched(self):
+        source = [1]
+        Stream.of(source).cache(self.cache).to_list()
+        copied = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(len(copied), 1)
+        Stream.of(source).cache(copied).to_list()
+        self.assertEqual(copied.hits, 0)
+
+    def test_ttl(self):
+        cache = ResultCache(ttl=0)
+        source = [1]
+        Stream.of(source).cache(cache).to_list()
+        Stream.of(source).cache(cache).to_list()
+        self.assertEqual(cache.hits, 0)
+
+    def test_max_bytes(self):
+        cache = ResultCache(max_bytes=10)
+        source = list(range(100))
+        Stream.of(source).cache(cache).to_list()
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# pylint: disable=protected-access
+import functools
+import unittest
+
+from pystreamapi.__optional import Optional
+from pystreamapi._streams.error.__error import ErrorHandler
+from pystreamapi._streams.error.__levels import ErrorLevel
+from pystreamapi.collectors import Collector, all_of, averaging, collecting_and_then, counting, \
+    filtering, grouping_by, joining, mapping, max_by, min_by, partitioning_by, summing, top_k, \
+    to_list, to_set
+
+
+def collect_in_parts(collector: Collector, items: list, size: int):
+    """Collect the items like a parallel stream: accumulate each part, then combine"""
+    states = [collector.accumulate(items[i:i + size]) for i in range(0, len(items), size)]
+    return collector.finisher(functools.reduce(collector.combiner, states, collector.supplier()))
+
+
+class TestCollectors(unittest.TestCase):
+
+    def assertCollects(self, collector, items, expected):
+        self.assertEqual(collector.collect(items), expected)
+        for size in (1, 2, 3):
+            self.assertEqual(collect_in_parts(collector, list(items), size), expected)
+
+    def test_to_list(self):
+        self.assertCollects(to_list(), [3, 1, 2], [3, 1, 2])
+
+    def test_to_set(self):
+        self.assertCollects(to_set(), [3, 1, 3], {1, 3})
+
+    def test_counting(self):
+        self.assertCollects(counting(), "abcde", 5)
+        self.assertCollects(counting(), [], 0)
+
+    def test_summing(self):
+        self.assertCollects(summing(), [1, 2, 3.5], 6.5)
+        self.assertCollects(summing(len), ["ab", "c"], 3)
+
+    def test_averaging(self):
+        self.assertCollects(averaging(), [1, 2, 3, 4], 2.5)
+        self.assertCollects(averaging(len), ["ab", "c", ""], 1)
+        self.assertCollects(averaging(), [], None)
+
+    def test_min_by_and_max_by(self):
+        self.assertCollects(min_by(), [3, 1, 2], Optional.of(1))
+        self.assertCollects(max_by(), [3, 1, 2], Optional.of(3))
+        self.assertCollects(min_by(len), ["bb", "a", "c"], Optional.of("a"))
+        self.assertCollects(max_by(len), ["a", "bb", "cc"], Optional.of("bb"))
+        self.assertCollects(max_by(), [], Optional.empty())
+
+    def test_joining(self):
+        self.assertCollects(joining(), ["a", 1, "b"], "a1b")
+        self.assertCollects(joining(", ", "[", "]"), [1, 2, 3], "[1, 2, 3]")
+        self.assertCollects(joining(", ", "[", "]"), [], "[]")
+
+    def test_top_k(self):
+        self.assertCollects(top_k(3), [5, 1, 9, 3, 7], [9, 7, 5])
+        self.assertCollects(top_k(2, key=len), ["a", "bb", "cc", "ddd", "e"], ["ddd", "bb"])
+        self.assertCollects(top_k(10), [2, 1], [2, 1])
+        self.assertCollects(top_k(0), [2, 1], [])
+
+    def test_top_k_does_not_compare_elements(self):
+        items = [{"n": 1}, {"n": 1}, {"n": 2}]
+        self.assertCollects(top_k(2, key=lambda x: x["n"]), items, [{"n": 2}, {"n": 1}])
+
+    def test_top_k_negative(self):
+        self.assertRaises(ValueError, top_k, -1)
+
+    def test_grouping_by(self):
+        self.assertCollects(grouping_by(len), ["a", "bb", "c"], {1: ["a", "c"], 2: ["bb"]})
+        self.assertCollects(grouping_by(lambda x: x % 2, counting()), range(5), {0: 3, 1: 2})
+        self.assertCollects(grouping_by(len, grouping_by(str.upper, counting())),
+                            ["a", "A", "bb"], {1: {"A": 2}, 2: {"BB": 1}})
+
+    def test_partitioning_by(self):
+        self.assertCollects(partitioning_by(lambda x: x > 2), [1, 3, 2, 4],
+                            {False: [1, 2], True: [3, 4]})
+        self.assertCollects(partitioning_by(lambda x: x > 2, counting()), [],
+                            {False: 0, True: 0})
+
+    def test_mapping_and_filtering(self):
+        self.assertCollects(mapping(str.upper, to_list()), ["a", "b"], ["A", "B"])
+        self.assertCollects(filtering(lambda x: x > 1, counting()), [1, 2, 3], 2)
+        self.assertCollects(grouping_by(len, mapping(str.upper, joining())), ["a", "b", "cc"],
+                            {1: "AB", 2: "CC"})
+
+    def test_collecting_and_then(self):
+        self.assertCollects(collecting_and_then(to_set(), len), [1, 2, 1], 2)
+
+    def test_all_of(self):
+        self.assertCollects(all_of(counting(), min_by(), to_set()), [2, 1, 2],
+                            (3, Optional.of(1), {1, 2}))
+
+    def test_all_of_with_error_handler(self):
+        handler = ErrorHandler()
+        handler._error_level(ErrorLevel.IGNORE)
+        collector = all_of(to_list(), summing(int), counting(), averaging(int))
+        self.assertEqual(collector.collect(["1", "a", "2"], handler),
+                         (["1", "a", "2"], 3, 3, 1.5))
+        nested = all_of(all_of(to_list(), summing(int)), all_of(averaging(int), to_set()))
+        self.assertEqual(nested.collect(["1", "a", "2"], handler),
+                         ((["1", "a", "2"], 3), (1.5, {"1", "a", "2"})))
+
+    def test_accumulate_with_error_handler(self):
+        handler = ErrorHandler()
+        handler._error_level(ErrorLevel.IGNORE)
+        self.assertEqual(summing(int).collect(["1", "a", "2"], handler), 3)
+        handler._error_level(ErrorLevel.RAISE)
+        self.assertRaises(ValueError, summing(int).collect, ["a"], handler)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+from pystreamapi import ErrorLevel, Stream
+from pystreamapi.hooks import Hook, register, unregister
+from pystreamapi._streams.__parallel_stream import ParallelStream
+from pystreamapi._streams.__sequential_stream import SequentialStream
+
+
+class RecordingHook(Hook):
+
+    def __init__(self):
+        self.events = []
+
+    def pipeline_started(self, stream, terminal):
+        self.events.append(("pipeline_started", terminal))
+
+    def pipeline_finished(self, stream, terminal, exception):
+        self.events.append(("pipeline_finished", terminal, type(exception).__name__
+                            if exception else None))
+
+    def stage_started(self, stream, stage):
+        self.events.append(("stage_started", stage))
+
+    def stage_finished(self, stream, stage, exception):
+        self.events.append(("stage_finished", stage))
+
+    def chunks_dispatched(self, stream, operation, chunks, elements):
+        self.events.append(("chunks_dispatched", operation, chunks, elements))
+
+    def error_handled(self, stream, exception, level):
+        self.events.append(("error_handled", type(exception).__name__, level))
+
+
+class TestHooks(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = register(RecordingHook())
+        self.addCleanup(unregister, self.hook)
+
+    def test_pipeline_and_stage_events(self):
+        SequentialStream([1, 2, 3]).filter(lambda x: x > 1).map(str).to_list()
+        self.assertListEqual(self.hook.events, [
+            ("pipeline_started", "to_list"),
+            ("stage_started", "filter"),
+            ("stage_finished", "filter"),
+            ("stage_started", "map"),
+            ("stage_finished", "map"),
+            ("stage_started", "to_list"),
+            ("stage_finished", "to_list"),
+            ("pipeline_finished", "to_list", None),
+        ])
+
+    def test_pipeline_finished_with_exception(self):
+        with self.assertRaises(ZeroDivisionError):
+            SequentialStream([0]).map(lambda x: 1 / x).to_list()
+        self.assertIn(("pipeline_finished", "to_list", "ZeroDivisionError"), self.hook.events)
+        self.assertIn(("error_handled", "ZeroDivisionError", ErrorLevel.RAISE), self.hook.events)
+
+    def test_error_handled_when_ignored(self):
+        result = Stream.of(["1", "a", "2"]).error_level(ErrorLevel.IGNORE).map(int).to_list()
+        self.assertListEqual(result, [1, 2])
+        self.assertIn(("error_handled", "ValueError", ErrorLevel.IGNORE), self.hook.events)
+
+    def test_chunks_dispatched(self):
+        ParallelStream(list(range(10))).filter(lambda x: x % 2).to_list()
+        dispatched = [event for event in self.hook.events if event[0] == "chunks_dispatched"]
+        self.assertEqual(len(dispatched), 1)
+        self.assertEqual(dispatched[0][1], "filter")
+        self.assertEqual(dispatched[0][3], 10)
+
+    def test_profiled_stream_emits_stages(self):
+        SequentialStream([1, 2]).profile().map(str).to_list()
+        self.assertIn(("stage_started", "map"), self.hook.events)
+        self.assertIn(("stage_finished", "to_list"), self.hook.events)
+
+    def test_failing_hook_does_not_break_stream(self):
+        class FailingHook(Hook):
+            def stage_started(self, stream, stage):
+                raise RuntimeError("broken hook")
+
+        failing = register(FailingHook())
+        self.addCleanup(unregister, failing)
+        with self.assertLogs(level="WARNING"):
+            self.assertListEqual(SequentialStream([1]).map(str).to_list(), ["1"])
+
+    def test_register_twice_and_unregister(self):
+        register(self.hook)
+        SequentialStream([1]).to_list()
+        self.assertEqual(self.hook.events.count(("pipeline_started", "to_list")), 1)
+        unregister(self.hook)
+        SequentialStream([1]).to_list()
+        self.assertEqual(self.hook.events.count(("pipeline_started", "to_list")), 1)
@@ -0,0 +1,67 @@
+import unittest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import StatusCode
+
+from pystreamapi import ErrorLevel
+from pystreamapi.hooks import OpenTelemetryHook, register, unregister
+from pystreamapi._streams.__parallel_stream import ParallelStream
+from pystreamapi._streams.__sequential_stream import SequentialStream
+
+
+class TestOpenTelemetryHook(unittest.TestCase):
+
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.reader = InMemoryMetricReader()
+        hook = OpenTelemetryHook(tracer_provider=tracer_provider,
+                                 meter_provider=MeterProvider(metric_readers=[self.reader]))
+        register(hook)
+        self.addCleanup(unregister, hook)
+
+    def metrics(self):
+        data = self.reader.get_metrics_data()
+        return {metric.name: sum(point.value for point in metric.data.data_points)
+                for resource in data.resource_metrics
+                for scope in resource.scope_metrics
+                for metric in scope.metrics}
+
+    def test_pipeline_span_with_stage_children(self):
+        SequentialStream([1, 2, 3]).filter(lambda x: x > 1).map(str).to_list()
+        spans = {span.name: span for span in self.exporter.get_finished_spans()}
+        self.assertSetEqual(set(spans), {"pystreamapi.to_list", "pystreamapi.stage.filter",
+                                         "pystreamapi.stage.map", "pystreamapi.stage.to_list"})
+        root = spans["pystreamapi.to_list"]
+        self.assertIsNone(root.parent)
+        for name in ("filter", "map", "to_list"):
+            self.assertEqual(spans[f"pystreamapi.stage.{name}"].parent.span_id,
+                             root.context.span_id)
+        self.assertEqual(root.attributes["pystreamapi.stream"], "SequentialStream")
+        self.assertEqual(self.metrics()["pystreamapi.pipelines"], 1)
+
+    def test_error_status_and_events(self):
+        with self.assertRaises(ZeroDivisionError):
+            SequentialStream([0]).map(lambda x: 1 / x).to_list()
+        root = next(span for span in self.exporter.get_finished_spans()
+                    if span.name == "pystreamapi.to_list")
+        self.assertEqual(root.status.status_code, StatusCode.ERROR)
+        self.assertEqual(self.metrics()["pystreamapi.errors"], 1)
+
+    def test_ignored_errors_are_counted(self):
+        SequentialStream(["1", "a", "b"]).error_level(ErrorLevel.IGNORE).map(int).to_list()
+        self.assertEqual(self.metrics()["pystreamapi.errors"], 2)
+        stage = next(span for span in self.exporter.get_finished_spans()
+                     if span.name == "pystreamapi.stage.to_list")
+        self.assertEqual(len([event for event in stage.events
+                              if event.name == "pystreamapi.error_handled"]), 2)
+
+    def test_chunks_are_counted(self):
+        ParallelStream(list(range(10))).filter(lambda x: x % 2).to_list()
+        self.assertEqual(self.metrics()["pystreamapi.chunk.elements"], 10)
+        self.assertGreaterEqual(self.metrics()["pystreamapi.chunks"], 1)
@@ -1,6 +1,7 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
-from pystreamapi._itertools.tools import reduce, dropwhile
+from pystreamapi._itertools.tools import reduce, dropwhile, batched, bounded_map
 
 
 class TestReduce(unittest.TestCase):
@@ -37,3 +38,47 @@ class TestDropWhile(unittest.TestCase):
         iterable = [1, 2, 3, 4, 5, 6, 7]
         result = list(dropwhile(lambda x: x < 5, iterable, handler=None))
         self.assertEqual(result, [5, 6, 7])
+
+
+class TestBatched(unittest.TestCase):
+    def test_batched_with_remainder(self):
+        self.assertListEqual(list(batched(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_batched_with_empty_iterable(self):
+        self.assertListEqual(list(batched([], 3)), [])
+
+    def test_batched_with_invalid_size(self):
+        with self.assertRaises(ValueError):
+            list(batched([1, 2], 0))
+
+
+class TestBoundedMap(unittest.TestCase):
+    def test_bounded_map_keeps_order(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = list(bounded_map(executor, lambda x: x * 2, range(20), max_in_flight=3))
+        self.assertListEqual(result, [x * 2 for x in range(20)])
+
+    def test_bounded_map_unordered(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = list(bounded_map(executor, lambda x: x * 2, range(20), max_in_flight=3,
+                                      ordered=False))
+        self.assertListEqual(sorted(result), [x * 2 for x in range(20)])
+
+    def test_bounded_map_consumes_lazily(self):
+        consumed = []
+
+        def source():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = bounded_map(executor, lambda x: x, source(), max_in_flight=2)
+            self.assertEqual(next(result), 0)
+            self.assertLessEqual(len(consumed), 2)
+            result.close()
+
+    def test_bounded_map_with_invalid_max_in_flight(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(ValueError):
+                list(bounded_map(executor, lambda x: x, [1], max_in_flight=0))
@@ -0,0 +1,115 @@
+import gc
+import os
+import tempfile
+import threading
+import unittest
+import warnings
+
+from pystreamapi._itertools.tee import SpillingTee
+
+
+class TestSpillingTee(unittest.TestCase):
+
+    def test_iterators_yield_all_elements(self):
+        first, second, third = SpillingTee(range(5), 3).iterators
+        self.assertListEqual(list(first), [0, 1, 2, 3, 4])
+        self.assertListEqual(list(second), [0, 1, 2, 3, 4])
+        self.assertListEqual(list(third), [0, 1, 2, 3, 4])
+
+    def test_source_read_once(self):
+        pulled = []
+
+        def source():
+            for i in range(4):
+                pulled.append(i)
+                yield i
+
+        first, second = SpillingTee(source()).iterators
+        self.assertListEqual(list(first), [0, 1, 2, 3])
+        self.assertListEqual(list(second), [0, 1, 2, 3])
+        self.assertListEqual(pulled, [0, 1, 2, 3])
+
+    def test_lazy(self):
+        pulled = []
+        first, _ = SpillingTee(map(pulled.append, range(100))).iterators
+        next(first)
+        self.assertListEqual(pulled, [0])
+
+    def test_interleaved(self):
+        first, second = SpillingTee(range(6), buffer_size=2).iterators
+        result = []
+        for a, b in zip(first, second):
+            result += [a, b]
+        self.assertListEqual(result, [0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5])
+
+    def test_spills_beyond_buffer_size(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            tee = SpillingTee(range(100), 2, buffer_size=10, spill_dir=spill_dir)
+            first, second = tee.iterators
+            self.assertListEqual(list(first), list(range(100)))
+            self.assertEqual(tee.spilled, 90)
+            self.assertListEqual(list(second), list(range(100)))
+            self.assertEqual(tee.spilled, 0)
+
+    def test_spill_while_reading_spilled(self):
+        tee = SpillingTee(range(30), 2, buffer_size=3)
+        first, second = tee.iterators
+        self.assertListEqual([next(first) for _ in range(10)], list(range(10)))
+        self.assertListEqual([next(second) for _ in range(5)], list(range(5)))
+        self.assertListEqual([next(first) for _ in range(10)], list(range(10, 20)))
+        self.assertListEqual(list(second), list(range(5, 30)))
+        self.assertListEqual(list(first), list(range(20, 30)))
+
+    def test_spill_file_location(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            tee = SpillingTee(range(10), 2, buffer_size=1, spill_dir=spill_dir)
+            first, second = tee.iterators
+            list(first)
+            self.assertEqual(tee.spilled, 9)
+            if os.name == "posix":
+                # Temporary files are unlinked immediately on POSIX
+                self.assertListEqual(os.listdir(spill_dir), [])
+            second.close()
+
+    def test_closed_iterator_releases_buffer(self):
+        tee = SpillingTee(range(10), 2, buffer_size=1)
+        first, second = tee.iterators
+        next(second)
+        second.close()
+        self.assertListEqual(list(first), list(range(10)))
+        self.assertEqual(tee.spilled, 0)
+
+    def test_spill_file_closed_when_collected(self):
+        tee = SpillingTee(range(10), 2, buffer_size=1)
+        first, _ = tee.iterators
+        list(first)
+        spill_file = tee._SpillingTee__spill_file  # pylint: disable=protected-access
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            del tee, first, _
+            gc.collect()
+        self.assertTrue(spill_file.closed)
+        self.assertListEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [])
+
+    def test_threads(self):
+        tee = SpillingTee(range(5000), 4, buffer_size=100)
+        results = [None] * 4
+
+        def consume(i):
+            results[i] = list(tee.iterators[i])
+
+        threads = [threading.Thread(target=consume, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for result in results:
+            self.assertListEqual(result, list(range(5000)))
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, SpillingTee, [], 0)
+        self.assertRaises(ValueError, SpillingTee, [], 2, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
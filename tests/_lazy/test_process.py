@@ -19,3 +19,36 @@ class TestProcess(unittest.TestCase):
         self.assertEqual(helper.value, 0)
         process.exec()
         self.assertEqual(helper.value, 0)
+
+    def test_name_defaults_to_work_name(self):
+        helper = TestHelper()
+        self.assertEqual(Process(helper.increment).name, "increment")
+        self.assertEqual(Process(helper.increment, name="add").name, "add")
+
+    def test_exec_wraps_callable_arguments(self):
+        calls = []
+
+        def wrap(function):
+            def wrapper(*args):
+                calls.append(args)
+                return function(*args)
+            return wrapper
+
+        result = []
+        process = Process(lambda args: result.append(args[0](2) + args[1]), (abs, 1))
+        process.exec(wrap)
+        self.assertListEqual(result, [3])
+        self.assertListEqual(calls, [(2,)])
+        process.exec()
+        self.assertListEqual(result, [3, 3])
+        self.assertListEqual(calls, [(2,)])
+        self.assertEqual(process.fingerprint(), (process.name, (abs, 1)))
+
+    def test_describe(self):
+        helper = TestHelper()
+        self.assertEqual(Process(helper.increment).describe(), "increment()")
+        self.assertEqual(Process(helper.increment, 1).describe(), "increment(1)")
+        self.assertEqual(Process(helper.increment, (abs, 4, True)).describe(),
+                         "increment(abs, 4, True)")
+        self.assertEqual(Process(helper.increment, "x" * 50).describe(),
+                         f"increment('{'x' * 36}...)")
@@ -0,0 +1,117 @@
+import pickle
+import time
+import unittest
+
+from pystreamapi import ErrorLevel, Stream
+from pystreamapi._lazy.profiler import PipelineStatistics, Profiler
+from pystreamapi._streams.__parallel_stream import ParallelStream
+from pystreamapi._streams.__sequential_stream import SequentialStream
+
+
+def slow_double(x):
+    time.sleep(0.002)
+    return x * 2
+
+
+class TestProfiler(unittest.TestCase):
+
+    def test_statistics_none_without_profile(self):
+        stream = Stream.of([1, 2, 3]).map(str)
+        stream.to_list()
+        self.assertIsNone(stream.statistics)
+
+    def test_result_unchanged(self):
+        stream = SequentialStream(range(10)).profile().filter(lambda x: x % 2).map(str)
+        self.assertListEqual(stream.to_list(), ["1", "3", "5", "7", "9"])
+
+    def test_stage_names_and_counts(self):
+        stream = SequentialStream(iter(range(100))).profile() \
+            .filter(lambda x: x % 2 == 0) \
+            .error_level(ErrorLevel.IGNORE) \
+            .map(str) \
+            .limit(5)
+        stream.to_list()
+        stages = stream.statistics.stages
+        self.assertListEqual([stage.name for stage in stages],
+                             ["source", "filter", "error_level", "map", "limit", "to_list"])
+        self.assertListEqual([stage.elements_in for stage in stages],
+                             [None, 9, 5, 5, 5, 5])
+        self.assertListEqual([stage.elements_out for stage in stages],
+                             [9, 5, 5, 5, 5, None])
+
+    def test_pipeline_is_not_changed(self):
+        stream = SequentialStream([1, 2]).profile().map(slow_double).filter(bool)
+        stream.to_list()
+        processes = stream._queue.get_queue()  # pylint: disable=protected-access
+        self.assertListEqual([process.fingerprint() for process in processes],
+                             [("map", slow_double), ("filter", bool)])
+
+    def test_materialized_stage(self):
+        stream = SequentialStream(iter([3, 1, 2])).profile().sorted()
+        stream.to_list()
+        sorted_stage = stream.statistics.stages[1]
+        self.assertEqual(sorted_stage.elements_out, 3)
+        self.assertEqual(sorted_stage.peak_size, 3)
+        self.assertIsNone(stream.statistics.stages[0].peak_size)
+
+    def test_time_is_attributed_to_slow_stage(self):
+        stream = SequentialStream(range(20)).profile().map(slow_double).filter(lambda x: x > 4)
+        stream.to_list()
+        statistics = stream.statistics
+        map_stage = statistics.stages[1]
+        self.assertIs(statistics.slowest(), map_stage)
+        self.assertGreaterEqual(map_stage.wall_time, 0.04)
+        self.assertEqual(map_stage.calls, 20)
+        self.assertGreaterEqual(map_stage.callable_time, 0.04)
+        self.assertLess(map_stage.callable_time, map_stage.wall_time + 1e-3)
+        self.assertLess(map_stage.cpu_time, map_stage.wall_time)
+        self.assertLess(statistics.stages[2].wall_time, map_stage.wall_time / 2)
+
+    def test_terminal_callables_are_timed(self):
+        stream = SequentialStream(range(5)).profile()
+        stream.for_each(lambda x: time.sleep(0.002))
+        terminal = stream.statistics.stages[-1]
+        self.assertEqual(terminal.name, "for_each")
+        self.assertEqual(terminal.calls, 5)
+        self.assertGreaterEqual(terminal.callable_time, 0.01)
+
+    def test_parallel_stream(self):
+        stream = ParallelStream(list(range(50))).profile().map(lambda x: x * 2).filter(
+            lambda x: x % 4 == 0)
+        self.assertEqual(len(stream.to_list()), 25)
+        self.assertListEqual([stage.elements_out for stage in stream.statistics.stages[:3]],
+                             [50, 50, 25])
+
+    def test_report_callback(self):
+        reports = []
+        result = Stream.of([1, 2, 3]).profile(reports.append).map(lambda x: x + 1).sum()
+        self.assertEqual(result, 9)
+        self.assertEqual(len(reports), 1)
+        self.assertIsInstance(reports[0], PipelineStatistics)
+
+    def test_render_and_to_dict(self):
+        stream = SequentialStream([1, 2]).profile().map(str)
+        stream.to_list()
+        rendered = str(stream.statistics)
+        self.assertIn("callable ms", rendered)
+        self.assertIn("to_list", rendered)
+        as_dict = stream.statistics.to_dict()
+        self.assertEqual(as_dict["stages"][1]["name"], "map")
+        self.assertEqual(as_dict["stages"][1]["elements_out"], 2)
+        self.assertAlmostEqual(as_dict["wall_time"], stream.statistics.wall_time)
+
+    def test_cache_statistics(self):
+        stream = SequentialStream([1, 2, 1, 1]).profile().map_cached(str).map(int)
+        stream.to_list()
+        stages = stream.statistics.stages
+        self.assertEqual((stages[1].cache_hits, stages[1].cache_misses), (2, 2))
+        self.assertEqual(stages[1].cache_hit_rate, 0.5)
+        self.assertIsNone(stages[2].cache_hits)
+        self.assertEqual(stream.statistics.to_dict()["stages"][1]["cache_hit_rate"], 0.5)
+        self.assertIn("map_cached: 50.0% cache hits (2 hits, 2 misses)",
+                      str(stream.statistics))
+
+    def test_profiler_can_be_pickled(self):
+        profiler = Profiler()
+        restored = pickle.loads(pickle.dumps(profiler))
+        self.assertListEqual(restored.statistics.stages, [])
@@ -1,3 +1,4 @@
+import tempfile
 from contextlib import contextmanager
 from unittest.mock import patch, mock_open
 
@@ -22,3 +23,10 @@ class LoaderTestBase:
               patch(PATH_EXISTS, return_value=exists),
               patch(PATH_ISFILE, return_value=is_file)):
             yield
+
+    @staticmethod
+    @contextmanager
+    def empty_directory():
+        """Context manager for a temporary directory without files, yielding its path."""
+        with tempfile.TemporaryDirectory() as directory:
+            yield directory
@@ -0,0 +1,152 @@
+import os
+import pickle
+import struct
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from pystreamapi.conditions import greater_than
+from pystreamapi.loaders import cached, csv, json, xml, yaml
+
+
+class TestCacheLoader(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.directory.cleanup)
+        self.cache_dir = os.path.join(self.directory.name, 'cache')
+        self.csv_path = self._write('data.csv', 'id,name,active\n1,a,true\n2,b,false\n')
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def _cached(self, loader, src, **options):
+        return list(cached(loader, src, cache_dir=self.cache_dir, **options))
+
+    def _cache_files(self):
+        return os.listdir(self.cache_dir) if os.path.exists(self.cache_dir) else []
+
+    def test_cached_returns_records_of_loader(self):
+        data = self._cached(csv, self.csv_path)
+        self.assertListEqual(data, list(csv(self.csv_path)))
+        self.assertEqual(data[0]._fields, ('id', 'name', 'active'))
+        self.assertEqual(len(self._cache_files()), 1)
+
+    def test_cached_reads_from_cache(self):
+        expected = self._cached(csv, self.csv_path)
+        with patch('pystreamapi.loaders.__csv.__csv_loader.LoaderUtils.open_file') as open_file:
+            data = self._cached(csv, self.csv_path)
+        open_file.assert_not_called()
+        self.assertListEqual(data, expected)
+        self.assertEqual(data[1].name, 'b')
+        self.assertIs(data[1].active, False)
+
+    def test_cached_reloads_changed_source(self):
+        self._cached(csv, self.csv_path)
+        self._write('data.csv', 'id,name,active\n3,c,true\n')
+        os.utime(self.csv_path, ns=(0, 0))
+        self.assertListEqual([row.id for row in self._cached(csv, self.csv_path)], [3])
+        self.assertEqual(len(self._cache_files()), 1)
+
+    def test_cached_with_different_options(self):
+        self._cached(csv, self.csv_path)
+        data = self._cached(csv, self.csv_path, cast_types=False)
+        self.assertEqual(data[0].id, '1')
+        self.assertEqual(len(self._cache_files()), 2)
+
+    def test_cached_with_callable_option(self):
+        with self.assertRaises(ValueError):
+            cached(csv, self.csv_path, cache_dir=self.cache_dir, where={'id': greater_than(1)})
+
+    def test_cached_with_value_condition(self):
+        self.assertListEqual(self._cached(csv, self.csv_path, where={'id': 2}, fields='name'),
+                             [('b',)])
+        self.assertListEqual(self._cached(csv, self.csv_path, where={'id': 2}, fields='name'),
+                             [('b',)])
+
+    def test_cached_with_read_from_src(self):
+        with self.assertRaises(ValueError):
+            cached(csv, 'a,b\n1,2', read_from_src=True)
+
+    def test_cached_with_invalid_path(self):
+        with self.assertRaises(FileNotFoundError):
+            cached(csv, os.path.join(self.directory.name, 'missing.csv'))
+
+    def test_cached_is_not_written_if_not_exhausted(self):
+        data = cached(csv, self.csv_path, cache_dir=self.cache_dir)
+        next(data)
+        data.close()
+        self.assertListEqual(self._cache_files(), [])
+
+    def test_cached_with_corrupt_cache_file(self):
+        self._cached(csv, self.csv_path)
+        cache_file = os.path.join(self.cache_dir, self._cache_files()[0])
+        with open(cache_file, 'wb') as file:
+            file.write(b'garbage')
+        self.assertListEqual([row.id for row in self._cached(csv, self.csv_path)], [1, 2])
+        self.assertListEqual([row.id for row in self._cached(csv, self.csv_path)], [1, 2])
+
+    def test_cached_with_foreign_cache_header(self):
+        self._cached(csv, self.csv_path)
+        cache_file = os.path.join(self.cache_dir, self._cache_files()[0])
+        for header in ([1, 2], 'header', None):
+            data = pickle.dumps(header)
+            with open(cache_file, 'wb') as file:
+                file.write(b'PYSTREAMAPI-CACHE' + struct.pack('<Q', len(data)) + data)
+            self.assertListEqual([row.id for row in self._cached(csv, self.csv_path)], [1, 2])
+            self.assertListEqual([row.id for row in self._cached(csv, self.csv_path)], [1, 2])
+
+    def test_cached_removes_unused_cache_files(self):
+        self._cached(csv, self.csv_path)
+        used = os.path.join(self.cache_dir, self._cache_files()[0])
+        unused = os.path.join(self.cache_dir, 'unused.cache')
+        with open(unused, 'wb'):
+            pass
+        old = time.time() - 31 * 24 * 60 * 60
+        os.utime(unused, (old, old))
+        os.utime(used, (old, old))
+        self._cached(csv, self.csv_path)
+        self.assertGreater(os.path.getmtime(used), old)
+        self.assertIn('unused.cache', self._cache_files())
+        self._cached(csv, self.csv_path, delimiter=',')
+        self.assertNotIn('unused.cache', self._cache_files())
+        self.assertIn(os.path.basename(used), self._cache_files())
+        self.assertEqual(len(self._cache_files()), 2)
+
+    def test_cached_with_many_rows(self):
+        content = 'id,value\n' + ''.join(f'{i},{i / 2}\n' for i in range(10000))
+        path = self._write('large.csv', content)
+        self._cached(csv, path)
+        data = self._cached(csv, path)
+        self.assertEqual(len(data), 10000)
+        self.assertEqual(data[9999], (9999, 4999.5))
+
+    def test_cached_with_nested_and_mixed_records(self):
+        path = self._write('data.json', '[{"a": {"b": [{"c": 1}]}}, {"x": 2}, 3, [4]]')
+        expected = self._cached(json, path)
+        data = self._cached(json, path)
+        self.assertListEqual(data, expected)
+        self.assertEqual(data[0].a.b[0].c, 1)
+        self.assertEqual(data[1].x, 2)
+        self.assertListEqual(data[2:], [3, [4]])
+
+    def test_cached_with_empty_records(self):
+        path = self._write('data.json', '[{}, {}]')
+        self._cached(json, path)
+        self.assertListEqual(self._cached(json, path), [(), ()])
+
+    def test_cached_with_xml(self):
+        path = self._write('data.xml', '<root><a><b>1</b><c>x</c></a><a><b>2</b></a></root>')
+        expected = self._cached(xml, path)
+        self.assertListEqual(self._cached(xml, path), expected)
+
+    def test_cached_with_glob(self):
+        self._write('a.yaml', '- x: 1\n')
+        self._write('b.yaml', '- x: 2\n')
+        pattern = os.path.join(self.directory.name, '*.yaml')
+        self._cached(yaml, pattern)
+        self.assertListEqual([item.x for item in self._cached(yaml, pattern)], [1, 2])
@@ -1,6 +1,7 @@
 # pylint: disable=not-context-manager
 from unittest import TestCase
 from _loaders.file_test import LoaderTestBase
+from pystreamapi.conditions import between, greater_than, starts_with
 from pystreamapi.loaders import csv
 
 
@@ -86,3 +87,58 @@ a,b"""
     def test_csv_loader_from_empty_string(self):
         """Test CSV loading from an empty string."""
         self.assertRaises(StopIteration, next, csv("", read_from_src=True))
+
+    def test_csv_loader_with_fields(self):
+        """Test that only the selected columns are loaded, in the selected order."""
+        data = list(csv(self.file_content, read_from_src=True, fields=['attr2', 'attr1']))
+        self.assertEqual(data[0]._fields, ('attr2', 'attr1'))
+        self.assertEqual(data[0].attr2, 2.0)
+        self.assertEqual(data[1].attr1, 'a')
+
+    def test_csv_loader_with_single_field(self):
+        """Test that a single field name can be passed as a string."""
+        with self.mock_file(self.file_content):
+            data = list(csv(self.file_path, fields='attr2'))
+        self.assertListEqual([row.attr2 for row in data], [2.0, 'b'])
+        self.assertEqual(data[0]._fields, ('attr2',))
+
+    def test_csv_loader_with_unknown_field(self):
+        """Test that selecting an unknown column raises a ValueError."""
+        with self.assertRaises(ValueError):
+            list(csv(self.file_content, read_from_src=True, fields=['attr3']))
+
+    def test_csv_loader_with_empty_fields(self):
+        """Test that an empty projection is rejected."""
+        with self.assertRaises(ValueError):
+            csv(self.file_content, read_from_src=True, fields=[])
+
+    def test_csv_loader_with_where_value(self):
+        """Test that rows are filtered by comparing a column for equality."""
+        data = list(csv(self.file_content, read_from_src=True, where={'attr1': 'a'}))
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0].attr2, 'b')
+
+    def test_csv_loader_with_where_condition(self):
+        """Test that rows are filtered with a condition on the cast cell value."""
+        content = "name,age\nAnna,31\nBen,17\nCarl,45"
+        with self.mock_file(content):
+            data = list(csv(self.file_path, where={'age': greater_than(30)}, fields=['name']))
+        self.assertListEqual([row.name for row in data], ['Anna', 'Carl'])
+
+    def test_csv_loader_with_where_multiple_conditions(self):
+        """Test that all conditions have to match."""
+        content = "name,age\nAnna,31\nAlex,17\nCarl,45"
+        data = list(csv(content, read_from_src=True,
+                        where={'name': starts_with('A'), 'age': between(18, 65)}))
+        self.assertListEqual([row.name for row in data], ['Anna'])
+
+    def test_csv_loader_with_where_without_casting(self):
+        """Test that conditions see the raw string if casting is disabled."""
+        data = list(csv(self.file_content, read_from_src=True, cast_types=False,
+                        where={'attr1': '1'}))
+        self.assertEqual(len(data), 1)
+
+    def test_csv_loader_with_where_unknown_field(self):
+        """Test that a condition on an unknown column raises a ValueError."""
+        with self.assertRaises(ValueError):
+            list(csv(self.file_content, read_from_src=True, where={'attr3': 1}))
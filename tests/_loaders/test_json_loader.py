@@ -2,6 +2,7 @@
 from unittest import TestCase
 
 from _loaders.file_test import LoaderTestBase
+from pystreamapi.conditions import greater_than
 from pystreamapi.loaders import json
 
 file_content = """
@@ -50,8 +51,8 @@ class TestJsonLoader(LoaderTestBase, TestCase):
             json('path/to/invalid.json')
 
     def test_json_loader_with_no_file(self):
-        with self.assertRaises(ValueError):
-            json('../')
+        with self.empty_directory() as directory, self.assertRaises(ValueError):
+            json(directory)
 
     def test_json_loader_from_string(self):
         self._check_extracted_data(json(file_content, read_from_src=True))
@@ -82,6 +83,54 @@ class TestJsonLoader(LoaderTestBase, TestCase):
         self.assertEqual(first.attr2, 2.0)
         self.assertRaises(StopIteration, next, data)
 
+    def test_json_loader_with_fields(self):
+        data = json(file_content, read_from_src=True, fields=['attr2'])
+        first = next(data)
+        self.assertEqual(first._fields, ('attr2',))
+        self.assertEqual(first.attr2, 2.0)
+        second = next(data)
+        self.assertEqual(second.attr2, 'b')
+        self.assertRaises(StopIteration, next, data)
+
+    def test_json_loader_with_fields_keeps_nested_values(self):
+        with self.mock_file(file_content):
+            data = list(json(file_path, fields=['attr1']))
+        self.assertEqual(data[0].attr1, 1)
+        self.assertEqual(data[1].attr1[0].attr1, 'a')
+
+    def test_json_loader_with_fields_missing_key(self):
+        data = list(json(single_object_content, read_from_src=True, fields=['attr2', 'attr3']))
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0].attr2, 2.0)
+        self.assertIsNone(data[0].attr3)
+
+    def test_json_loader_with_fields_skips_nested_subtrees(self):
+        content = '[{"skip": {"a": [1, {"b": [2, 3]}], "c": {}}, "keep": true}, 7]'
+        data = list(json(content, read_from_src=True, fields=['keep']))
+        self.assertTrue(data[0].keep)
+        self.assertEqual(data[1], 7)
+
+    def test_json_loader_with_fields_from_empty_string(self):
+        self.assertRaises(StopIteration, next, json("", read_from_src=True, fields=['a']))
+
+    def test_json_loader_with_where(self):
+        data = list(json(file_content, read_from_src=True, where={'attr2': 'b'}))
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0].attr1[0].attr1, 'a')
+
+    def test_json_loader_with_where_condition_and_fields(self):
+        content = '[{"name": "Anna", "age": 31, "tags": [1, 2]}, {"age": 17, "name": "Ben"}, ' \
+                  '{"name": "Carl", "tags": {"a": [3]}, "age": 45}, {"name": "Dan"}, 5]'
+        with self.mock_file(content):
+            data = list(json(file_path, fields='name', where={'age': greater_than(30)}))
+        self.assertListEqual(data, [('Anna',), ('Carl',)])
+
+    def test_json_loader_with_where_single_object(self):
+        self.assertEqual(len(list(json(single_object_content, read_from_src=True,
+                                       where={'attr1': 1}))), 1)
+        self.assertEqual(len(list(json(single_object_content, read_from_src=True,
+                                       where={'attr1': 2}))), 0)
+
     def _check_extracted_data(self, data):
         try:
             first = next(data)
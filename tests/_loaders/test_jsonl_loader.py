@@ -0,0 +1,138 @@
+# pylint: disable=not-context-manager
+from types import GeneratorType
+from unittest import TestCase
+
+from _loaders.file_test import LoaderTestBase
+from pystreamapi import ErrorLevel, Stream
+from pystreamapi.conditions import greater_than, starts_with
+from pystreamapi.loaders import jsonl
+
+file_content = """{"attr1": 1, "attr2": 2.0}
+
+{"attr1": [{"attr1": "a"}], "attr2": "b"}
+"""
+
+malformed_content = """{"attr1": 1, "attr2": 2.0}
+{"attr1":
+{"attr1": 3, "attr2": 4.0}
+"""
+
+file_path = 'path/to/data.jsonl'
+
+
+class TestJsonlLoader(LoaderTestBase, TestCase):
+
+    def test_jsonl_loader_from_file(self):
+        with self.mock_file(file_content):
+            self._check_extracted_data(jsonl(file_path))
+
+    def test_jsonl_loader_is_lazy(self):
+        with self.mock_file(file_content):
+            self.assertIsInstance(jsonl(file_path), GeneratorType)
+
+    def test_jsonl_loader_with_empty_file(self):
+        with self.mock_file(""):
+            self.assertRaises(StopIteration, next, jsonl(file_path))
+
+    def test_jsonl_loader_with_invalid_path(self):
+        with self.assertRaises(FileNotFoundError):
+            jsonl('path/to/invalid.jsonl')
+
+    def test_jsonl_loader_with_no_file(self):
+        with self.empty_directory() as directory, self.assertRaises(ValueError):
+            jsonl(directory)
+
+    def test_jsonl_loader_from_string(self):
+        self._check_extracted_data(jsonl(file_content, read_from_src=True))
+
+    def test_jsonl_loader_from_empty_string(self):
+        self.assertRaises(StopIteration, next, jsonl("", read_from_src=True))
+
+    def test_jsonl_loader_malformed_line_raises(self):
+        data = jsonl(malformed_content, read_from_src=True)
+        self.assertEqual(next(data).attr1, 1)
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            next(data)
+
+    def test_jsonl_loader_malformed_line_ignored(self):
+        data = jsonl(malformed_content, read_from_src=True, error_level=ErrorLevel.IGNORE)
+        self.assertListEqual([item.attr1 for item in data], [1, 3])
+
+    def test_jsonl_loader_malformed_line_warns(self):
+        with self.assertLogs(level='WARNING'):
+            data = list(jsonl(malformed_content, read_from_src=True,
+                              error_level=ErrorLevel.WARN))
+        self.assertEqual(len(data), 2)
+
+    def test_jsonl_loader_in_processes(self):
+        content = "\n".join(f'{{"id": {i}, "name": "item{i}"}}' for i in range(50))
+        data = list(jsonl(content, read_from_src=True, processes=2, batch_size=7))
+        self.assertListEqual([item.id for item in data], list(range(50)))
+        self.assertEqual(data[49].name, "item49")
+
+    def test_jsonl_loader_in_processes_malformed_line_ignored(self):
+        data = jsonl(malformed_content, read_from_src=True, processes=2, batch_size=1,
+                     error_level=ErrorLevel.IGNORE)
+        self.assertListEqual([item.attr1 for item in data], [1, 3])
+
+    def test_jsonl_loader_in_processes_malformed_line_raises(self):
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            list(jsonl(malformed_content, read_from_src=True, processes=2))
+
+    def test_jsonl_loader_invalid_number_of_processes(self):
+        with self.assertRaises(ValueError):
+            jsonl(file_content, read_from_src=True, processes=0)
+
+    def test_jsonl_loader_in_stream(self):
+        result = Stream.of(jsonl(file_content, read_from_src=True)) \
+            .map(lambda x: x.attr2) \
+            .to_list()
+        self.assertListEqual(result, [2.0, 'b'])
+
+    def test_jsonl_loader_with_fields(self):
+        data = list(jsonl(file_content, read_from_src=True, fields=['attr2', 'attr3']))
+        self.assertEqual(data[0]._fields, ('attr2', 'attr3'))
+        self.assertEqual(data[1].attr2, 'b')
+        self.assertIsNone(data[1].attr3)
+
+    def test_jsonl_loader_in_processes_with_fields(self):
+        content = "\n".join(f'{{"id": {i}, "name": "item{i}"}}' for i in range(10))
+        data = list(jsonl(content, read_from_src=True, processes=2, fields='name'))
+        self.assertEqual(data[3], ('item3',))
+
+    def test_jsonl_loader_with_where(self):
+        data = list(jsonl(file_content, read_from_src=True, where={'attr1': 1}))
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0].attr2, 2.0)
+
+    def test_jsonl_loader_with_where_condition_and_fields(self):
+        content = '{"level": "ERROR", "msg": "a"}\n{"level": "INFO", "msg": "b"}\n' \
+                  '{"msg": "c"}\n[1]\n{"level": "ERROR_X", "msg": "d"}'
+        data = list(jsonl(content, read_from_src=True, fields='msg',
+                          where={'level': starts_with('ERROR')}))
+        self.assertListEqual(data, [('a',), ('d',)])
+
+    def test_jsonl_loader_in_processes_with_where(self):
+        content = "\n".join(f'{{"id": {i}}}' for i in range(20))
+        data = list(jsonl(content, read_from_src=True, processes=2, batch_size=3,
+                          where={'id': greater_than(15)}))
+        self.assertListEqual([item.id for item in data], [16, 17, 18, 19])
+
+    def _check_extracted_data(self, data):
+        try:
+            first = next(data)
+        except StopIteration:
+            self.fail("Expected first row but iterator was empty")
+        self.assertEqual(first.attr1, 1)
+        self.assertIsInstance(first.attr1, int)
+        self.assertEqual(first.attr2, 2.0)
+        self.assertIsInstance(first.attr2, float)
+
+        try:
+            second = next(data)
+        except StopIteration:
+            self.fail("Expected second row but iterator was exhausted after first row")
+        self.assertEqual(second.attr1[0].attr1, 'a')
+        self.assertIsInstance(second.attr1, list)
+
+        self.assertRaises(StopIteration, next, data)
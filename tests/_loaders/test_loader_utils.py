@@ -0,0 +1,182 @@
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from pystreamapi import Stream
+from pystreamapi.conditions import greater_than
+from pystreamapi.loaders import csv, json, jsonl, toml, xml, yaml
+from pystreamapi.loaders.__loader_utils import LoaderUtils
+
+COMPRESSORS = {
+    'gzip': gzip.compress,
+    'bz2': bz2.compress,
+    'lzma': lzma.compress,
+}
+
+
+class TemporaryFilesTestBase(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.directory.cleanup)
+
+    def _write(self, name, data: bytes):
+        path = os.path.join(self.directory.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def _path(self, *parts):
+        return os.path.join(self.directory.name, *parts)
+
+
+class TestLoaderUtilsCompression(TemporaryFilesTestBase):
+
+    @parameterized.expand([
+        ('data.csv.gz', 'gzip'),
+        ('data.csv.GZ', 'gzip'),
+        ('data.xml.bz2', 'bz2'),
+        ('data.xz', 'lzma'),
+        ('data.jsonl.zst', 'zstd'),
+    ])
+    def test_detect_compression_from_extension(self, name, expected):
+        path = self._write(name, b'')
+        self.assertEqual(LoaderUtils.detect_compression(path), expected)
+
+    @parameterized.expand(COMPRESSORS.keys())
+    def test_detect_compression_from_magic_bytes(self, compression):
+        path = self._write('data.csv', COMPRESSORS[compression](b'a,b\n1,2\n'))
+        self.assertEqual(LoaderUtils.detect_compression(path), compression)
+
+    def test_detect_compression_of_plain_file(self):
+        path = self._write('data.csv', b'a,b\n1,2\n')
+        self.assertIsNone(LoaderUtils.detect_compression(path))
+
+    def test_detect_compression_of_zstd_magic_bytes(self):
+        path = self._write('data', b'\x28\xb5\x2f\xfd\x00\x00')
+        self.assertEqual(LoaderUtils.detect_compression(path), 'zstd')
+
+    @parameterized.expand(COMPRESSORS.keys())
+    def test_open_file_reads_concatenated_members(self, compression):
+        compress = COMPRESSORS[compression]
+        path = self._write('data.txt', compress('ä,1\n'.encode()) + compress(b'b,2\n'))
+        with LoaderUtils.open_file(path) as file:
+            self.assertListEqual(list(file), ['ä,1\n', 'b,2\n'])
+
+    def test_open_file_with_encoding(self):
+        path = self._write('data.txt.gz', gzip.compress('ä'.encode('latin-1')))
+        with LoaderUtils.open_file(path, encoding='latin-1') as file:
+            self.assertEqual(file.read(), 'ä')
+
+    def test_csv_loader_with_gzip_file(self):
+        path = self._write('data.csv.gz', gzip.compress(b'attr1,attr2\n1,2.0\na,b\n'))
+        self.assertListEqual([row.attr2 for row in csv(path)], [2.0, 'b'])
+
+    def test_jsonl_loader_with_bz2_file_without_extension(self):
+        path = self._write('data', bz2.compress(b'{"id": 1}\n') + bz2.compress(b'{"id": 2}\n'))
+        self.assertListEqual([item.id for item in jsonl(path)], [1, 2])
+
+    def test_xml_loader_with_xz_file(self):
+        path = self._write('data.xml.xz', lzma.compress(b'<a><b><c>1</c></b></a>'))
+        self.assertListEqual([item.c for item in xml(path)], [1])
+
+
+class TestLoaderUtilsMultipleFiles(TemporaryFilesTestBase):
+
+    def setUp(self):
+        super().setUp()
+        for day in (2, 1):
+            for part in (2, 1):
+                self._write(f'2026-01-0{day}/part-{part}.csv',
+                            f'day,part\n{day},{part}\n{day},{part}\n'.encode())
+        self._write('2026-01-01/notes.txt', b'not csv')
+
+    def test_resolve_paths_with_glob(self):
+        paths = LoaderUtils.resolve_paths(self._path('2026-*', 'part-*.csv'))
+        self.assertListEqual(paths, [
+            self._path('2026-01-01', 'part-1.csv'), self._path('2026-01-01', 'part-2.csv'),
+            self._path('2026-01-02', 'part-1.csv'), self._path('2026-01-02', 'part-2.csv'),
+        ])
+
+    def test_resolve_paths_with_recursive_glob(self):
+        self.assertEqual(len(LoaderUtils.resolve_paths(self._path('**', '*.csv'))), 4)
+
+    def test_resolve_paths_with_glob_without_matches(self):
+        with self.assertRaises(FileNotFoundError):
+            LoaderUtils.resolve_paths(self._path('2025-*', '*.csv'))
+
+    def test_resolve_paths_with_directory(self):
+        self._write('2026-01-01/.hidden.csv', b'')
+        self.assertListEqual(LoaderUtils.resolve_paths(self._path('2026-01-01')), [
+            self._path('2026-01-01', 'notes.txt'), self._path('2026-01-01', 'part-1.csv'),
+            self._path('2026-01-01', 'part-2.csv'),
+        ])
+
+    def test_resolve_paths_with_file(self):
+        path = self._path('2026-01-01', 'part-1.csv')
+        self.assertListEqual(LoaderUtils.resolve_paths(path), [path])
+
+    def test_resolve_paths_with_file_named_like_pattern(self):
+        path = self._write('data[1].csv', b'a\n1\n')
+        self.assertListEqual(LoaderUtils.resolve_paths(path), [path])
+        self.assertListEqual([row.a for row in csv(path)], [1])
+
+    def test_load_files_invalid_number_of_processes(self):
+        with self.assertRaises(ValueError):
+            LoaderUtils.load_files(list, ['a'], processes=0)
+
+    def test_csv_loader_with_glob(self):
+        data = csv(self._path('2026-*', 'part-*.csv'))
+        self.assertListEqual([(row.day, row.part) for row in data],
+                             [(1, 1), (1, 1), (1, 2), (1, 2), (2, 1), (2, 1), (2, 2), (2, 2)])
+
+    def test_csv_loader_with_glob_is_lazy(self):
+        data = csv(self._path('2026-*', 'part-*.csv'))
+        os.remove(self._path('2026-01-02', 'part-2.csv'))
+        self.assertEqual(next(data).day, 1)
+
+    def test_csv_loader_with_glob_in_processes(self):
+        data = list(csv(self._path('2026-*', 'part-*.csv'), processes=3,
+                        where={'part': greater_than(1)}))
+        self.assertListEqual([(row.day, row.part) for row in data],
+                             [(1, 2), (1, 2), (2, 2), (2, 2)])
+        self.assertEqual(data[0]._fields, ('day', 'part'))
+
+    def test_count_stream_of_glob(self):
+        pattern = self._path('2026-*', 'part-*.csv')
+        self.assertEqual(Stream.of(csv(pattern)).filter(lambda x: x.part > 1).count(), 4)
+        self.assertEqual(Stream.of(csv(pattern, processes=2)).count(), 8)
+
+    def test_jsonl_loader_with_directory_in_processes(self):
+        for i in range(5):
+            self._write(f'logs/{i}.jsonl', f'{{"id": {i}, "tags": [{{"a": {i}}}]}}\n'.encode())
+        data = list(jsonl(self._path('logs'), processes=2))
+        self.assertListEqual([item.id for item in data], list(range(5)))
+        self.assertEqual(data[4].tags[0].a, 4)
+
+    def test_json_loader_with_glob(self):
+        self._write('a.json', b'[{"x": 1}, {"x": 2}]')
+        self._write('b.json', b'{"x": 3}')
+        self.assertListEqual([item.x for item in json(self._path('*.json'))], [1, 2, 3])
+
+    def test_xml_loader_with_glob_in_processes(self):
+        self._write('a.xml', b'<root><item><x>1</x></item></root>')
+        self._write('b.xml', b'<root><item><x>2</x></item></root>')
+        data = list(xml(self._path('*.xml'), processes=2))
+        self.assertListEqual([item.x for item in data], [1, 2])
+
+    def test_yaml_loader_with_glob(self):
+        self._write('a.yaml', b'- x: 1\n- x: 2\n')
+        self._write('b.yaml', b'- x: 3\n')
+        self.assertListEqual([item.x for item in yaml(self._path('*.yaml'))], [1, 2, 3])
+
+    def test_toml_loader_with_glob(self):
+        self._write('a.toml', b'x = 1\n')
+        self._write('b.toml', b'x = 2\n')
+        self.assertListEqual([item.x for item in toml(self._path('*.toml'))], [1, 2])
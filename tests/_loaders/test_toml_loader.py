@@ -1,6 +1,7 @@
 # pylint: disable=not-context-manager
 from types import GeneratorType
 from unittest import TestCase
+from unittest.mock import patch
 
 import tomlkit.exceptions
 
@@ -36,6 +37,7 @@ car = "Audi"
 """
 
 file_path = 'path/to/data.toml'
+TOMLLIB = 'pystreamapi.loaders.__toml.__toml_loader.tomllib'
 
 
 class TestTomlLoader(LoaderTestBase, TestCase):
@@ -67,13 +69,26 @@ class TestTomlLoader(LoaderTestBase, TestCase):
             toml('path/to/invalid.toml')
 
     def test_toml_loader_with_no_file(self):
-        with self.assertRaises(ValueError):
-            toml('../')
+        with self.empty_directory() as directory, self.assertRaises(ValueError):
+            toml(directory)
 
     def test_toml_loader_with_malformed_toml(self):
-        with self.assertRaises(tomlkit.exceptions.ParseError):
+        with self.assertRaises(ValueError):
+            list(toml("invalid = = toml", read_from_src=True))
+
+    def test_toml_loader_with_tomlkit_fallback(self):
+        with patch(TOMLLIB, None):
+            self._check_extracted_data(toml(file_content, read_from_src=True))
+
+    def test_toml_loader_with_malformed_toml_and_tomlkit_fallback(self):
+        with patch(TOMLLIB, None), self.assertRaises(tomlkit.exceptions.ParseError):
             list(toml("invalid = = toml", read_from_src=True))
 
+    def test_toml_loader_without_tomllib_and_tomlkit(self):
+        with patch(TOMLLIB, None), patch.dict('sys.modules', {'tomlkit': None}), \
+                self.assertRaises(ImportError):
+            list(toml(file_content, read_from_src=True))
+
     def test_toml_loader_non_consistent_data(self):
         """Each [[array of tables]] entry may have different fields."""
         with self.mock_file(non_consistent_content):
@@ -1,9 +1,13 @@
 # pylint: disable=not-context-manager
 from unittest import TestCase
+from unittest.mock import patch
+from xml.etree import ElementTree
 from xml.etree.ElementTree import ParseError
 
 from _loaders.file_test import LoaderTestBase
+from pystreamapi.conditions import greater_than
 from pystreamapi.loaders import xml
+from pystreamapi.loaders.__xml.__xml_loader import _XmlElementParser
 
 file_content = """
 <employees>
@@ -117,8 +121,8 @@ class TestXmlLoader(LoaderTestBase, TestCase):
             xml('path/to/invalid.xml')
 
     def test_xml_loader_with_no_file(self):
-        with self.assertRaises(ValueError):
-            xml('../')
+        with self.empty_directory() as directory, self.assertRaises(ValueError):
+            xml(directory)
 
     def test_xml_loader_from_string(self):
         data = xml(file_content, read_from_src=True)
@@ -149,3 +153,121 @@ class TestXmlLoader(LoaderTestBase, TestCase):
     def test_xml_loader_from_empty_string(self):
         with self.assertRaises(ParseError):
             list(xml('', read_from_src=True))
+
+    def test_xml_loader_with_fields(self):
+        data = list(xml(file_content, read_from_src=True, fields=['name', 'salary']))
+        self.assertEqual(data[0]._fields, ('name', 'salary'))
+        self.assertEqual(data[0].name, 'John Doe')
+        self.assertEqual(data[0].salary, 80000)
+        self.assertEqual(data[1].name, 'Alice Smith')
+        self.assertIsNone(data[1].salary)
+        self.assertIsNone(data[2].name)
+
+    def test_xml_loader_with_fields_from_file(self):
+        with self.mock_file(file_content):
+            data = list(xml(file_path, fields='child'))
+        self.assertIsNone(data[0].child)
+        self.assertEqual(data[1].child.name, 'Frank')
+
+    def test_xml_loader_with_fields_no_children(self):
+        data = next(xml(file_content, read_from_src=True, retrieve_children=False,
+                        fields=['founder']))
+        self.assertEqual(data._fields, ('founder',))
+        self.assertListEqual(data.founder.cars.car, ['Bugatti', 'Mercedes'])
+
+    def test_xml_loader_with_where(self):
+        data = list(xml(file_content, read_from_src=True, where={'salary': greater_than(50000)}))
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0].name, 'John Doe')
+
+    def test_xml_loader_with_where_value_and_fields(self):
+        with self.mock_file(file_content):
+            data = list(xml(file_path, where={'name': 'Alice Smith'}, fields='child'))
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0].child.name, 'Frank')
+
+    def test_xml_loader_with_where_repeated_child(self):
+        data = list(xml(file_content, read_from_src=True, retrieve_children=False,
+                        where={'employee': lambda e: len(e) == 2}))
+        self.assertEqual(len(data), 1)
+        data = list(xml(file_content, read_from_src=True, retrieve_children=False,
+                        where={'employee': lambda e: len(e) == 3}))
+        self.assertEqual(len(data), 0)
+
+    def test_xml_loader_reuses_record_types(self):
+        content = "<feed>" + "<item><id>1</id><tag>a</tag></item>" * 3 + "</feed>"
+        data = list(xml(content, read_from_src=True))
+        self.assertEqual(len(data), 3)
+        self.assertIs(type(data[0]), type(data[2]))
+        self.assertEqual(data[2].tag, 'a')
+
+    def test_xml_loader_records_with_different_shapes(self):
+        content = """<feed>
+            <item><id>1</id><tag>a</tag></item>
+            <item><tag>b</tag><id>2</id><tag>c</tag></item>
+            <item><id>3</id></item>
+        </feed>"""
+        first, second, third = xml(content, read_from_src=True)
+        self.assertEqual(first, (1, 'a'))
+        self.assertEqual(second._fields, ('tag', 'id'))
+        self.assertEqual(second.tag, ['b', 'c'])
+        self.assertEqual(second.id, 2)
+        self.assertEqual(third.id, 3)
+
+    def test_xml_loader_layouts_are_bounded(self):
+        items = "".join(f"<item><id>{i}</id><f{i}>x</f{i}></item>" for i in range(20))
+        element = ElementTree.fromstring(f"<feed>{items}</feed>")
+        with patch('pystreamapi.loaders.__xml.__xml_loader._MAX_LAYOUTS', 4):
+            parser = _XmlElementParser(cast_types=True)
+        for _ in range(2):
+            records = [parser.parse(item) for item in element]
+            self.assertListEqual([record.id for record in records], list(range(20)))
+            self.assertEqual(records[7].f7, 'x')
+        # pylint: disable=protected-access
+        self.assertEqual(parser._XmlElementParser__layouts.cache_info().currsize, 4)
+
+    def test_xml_loader_with_record_path(self):
+        content = """<feed>
+            <title>Products</title>
+            <entries>
+                <entry><id>1</id></entry>
+                <other><id>9</id></other>
+                <entry><id>2</id></entry>
+            </entries>
+            <entries><entry><id>3</id></entry></entries>
+        </feed>"""
+        data = list(xml(content, read_from_src=True, record_path='/feed/entries/entry'))
+        self.assertListEqual([entry.id for entry in data], [1, 2, 3])
+
+    def test_xml_loader_with_record_path_from_file(self):
+        with self.mock_file(file_content):
+            data = list(xml(file_path, record_path='employees/*/child'))
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0].name, 'Frank')
+
+    def test_xml_loader_with_record_path_wildcard(self):
+        data = list(xml(file_content, read_from_src=True, record_path='/*/founder/cars/car'))
+        self.assertListEqual(data, ['Bugatti', 'Mercedes'])
+
+    def test_xml_loader_with_record_path_and_namespace(self):
+        content = '<a:feed xmlns:a="urn:a"><a:entry>1</a:entry><a:other>2</a:other></a:feed>'
+        data = list(xml(content, read_from_src=True, record_path='feed/entry'))
+        self.assertListEqual(data, [1])
+
+    def test_xml_loader_with_record_path_and_where(self):
+        data = list(xml(file_content, read_from_src=True, record_path='/employees/employee',
+                        where={'name': 'John Doe'}, fields='salary'))
+        self.assertListEqual(data, [(80000,)])
+
+    def test_xml_loader_with_record_path_is_lazy(self):
+        content = "<feed><entries><entry><id>1</id></entry><entry><id>2</broken>"
+        data = xml(content, read_from_src=True, record_path='/feed/entries/entry')
+        self.assertEqual(next(data).id, 1)
+        self.assertRaises(ParseError, next, data)
+
+    def test_xml_loader_with_record_path_without_matches(self):
+        self.assertListEqual(list(xml(file_content, read_from_src=True, record_path='a/b')), [])
+
+    def test_xml_loader_with_invalid_record_path(self):
+        with self.assertRaises(ValueError):
+            xml(file_content, read_from_src=True, record_path='/feed//entry')
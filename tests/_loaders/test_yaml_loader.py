@@ -37,8 +37,8 @@ class TestYamlLoader(LoaderTestBase, TestCase):
             yaml('path/to/invalid.yaml')
 
     def test_yaml_loader_with_no_file(self):
-        with self.assertRaises(ValueError):
-            yaml('../')
+        with self.empty_directory() as directory, self.assertRaises(ValueError):
+            yaml(directory)
 
     def test_yaml_loader_from_string(self):
         self._check_extracted_data(yaml(file_content, read_from_src=True))
@@ -67,6 +67,24 @@ class TestYamlLoader(LoaderTestBase, TestCase):
             self.assertEqual(len(list(yaml(file_path))), 1)
         self.assertEqual(len(list(yaml(content, read_from_src=True))), 1)
 
+    def test_yaml_loader_yields_sequence_items_before_parsing_the_rest(self):
+        """Test that items of a top-level sequence are yielded as soon as they are parsed."""
+        data = yaml("- attr1: 1\n- attr1: [2\n- attr1: 3", read_from_src=True)
+        self.assertEqual(next(data).attr1, 1)
+        with self.assertRaises(yaml_lib.YAMLError):
+            next(data)
+
+    def test_yaml_loader_resolves_aliases_between_items(self):
+        """Test that anchors defined in one sequence item can be used in later items."""
+        content = "- &first {attr1: 1}\n- *first\n- attr1: [*first]\n"
+        data = list(yaml(content, read_from_src=True))
+        self.assertEqual(data[1].attr1, 1)
+        self.assertEqual(data[2].attr1[0].attr1, 1)
+
+    def test_yaml_loader_mapping_document(self):
+        """Test that a mapping document is loaded as a whole."""
+        self.assertEqual(list(yaml("attr1: 1\nattr2: 2", read_from_src=True)), [1, 2])
+
     def _check_extracted_data(self, data):
         try:
             first = next(data)
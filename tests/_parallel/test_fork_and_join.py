@@ -1,8 +1,12 @@
 import os
 from unittest import TestCase
+from unittest.mock import patch
 from functools import reduce as seq_reduce
 
+from pystreamapi import collectors
 from pystreamapi._parallel.fork_and_join import Parallelizer
+from pystreamapi._streams.error.__error import ErrorHandler
+from pystreamapi._streams.error.__levels import ErrorLevel
 
 
 class TestForkAndJoin(TestCase):
@@ -80,3 +84,46 @@ class TestForkAndJoin(TestCase):
         self.parallelizer.set_source([None])
         result = self.parallelizer.filter(lambda x: x is not None)
         self.assertListEqual([], result)
+
+    @patch("pystreamapi._parallel.fork_and_join.os.cpu_count", return_value=9)
+    def test_collect_merges_parts_in_order(self, _):
+        merges = []
+        collector = collectors.to_list()
+        combiner = collector.combiner
+        collector.combiner = lambda x, y: merges.append((x[0], y[0])) or combiner(x, y)
+        self.parallelizer.set_source(list(range(70)))
+        self.assertListEqual(self.parallelizer.collect(collector), list(range(70)))
+        # 7 parts of 10 elements merged in a tree of 3 levels
+        self.assertEqual(len(merges), 6)
+        self.assertEqual(sorted(merges[:3]), [(0, 10), (20, 30), (40, 50)])
+
+    @patch("pystreamapi._parallel.fork_and_join.os.cpu_count", return_value=6)
+    def test_collect_grouping(self, _):
+        self.parallelizer.set_source(list(range(100)))
+        result = self.parallelizer.collect(collectors.grouping_by(lambda x: x % 3))
+        self.assertListEqual(list(result), [0, 1, 2])
+        self.assertListEqual(result[1], list(range(1, 100, 3)))
+
+    @patch("pystreamapi._parallel.parallelizer.FREE_THREADED", True)
+    @patch("pystreamapi._parallel.fork_and_join.os.cpu_count", return_value=9)
+    def test_collect_on_thread_pool(self, _):
+        self.parallelizer.set_source(list(range(1000)))
+        result = self.parallelizer.collect(collectors.grouping_by(lambda x: x % 10,
+                                                                  collectors.counting()))
+        self.assertDictEqual(result, {key: 100 for key in range(10)})
+
+    def test_collect_keeps_elements(self):
+        elements = [object() for _ in range(10)]
+        self.parallelizer.set_source(elements)
+        result = self.parallelizer.collect(collectors.to_list())
+        self.assertTrue(all(a is b for a, b in zip(result, elements)))
+
+    def test_collect_empty(self):
+        self.parallelizer.set_source([])
+        self.assertEqual(self.parallelizer.collect(collectors.counting()), 0)
+
+    def test_collect_error_handler(self):
+        handler = ErrorHandler()
+        handler._error_level(ErrorLevel.IGNORE)  # pylint: disable=protected-access
+        self.parallelizer.set_source(["1", "a", "2"], handler)
+        self.assertEqual(self.parallelizer.collect(collectors.summing(int)), 3)
@@ -0,0 +1,73 @@
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from pystreamapi import ErrorLevel
+from pystreamapi._parallel import parallelizer
+from pystreamapi._parallel.parallelizer import Parallel, delayed
+from pystreamapi._streams.__parallel_stream import ParallelStream
+from pystreamapi._streams.numeric.__parallel_numeric_stream import ParallelNumericStream
+
+
+class TestFreeThreadedBackend(TestCase):
+
+    def setUp(self):
+        patcher = patch.object(parallelizer, "FREE_THREADED", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_parallel_keeps_order(self):
+        result = Parallel(n_jobs=4)(delayed(lambda x: x * 2)(i) for i in range(100))
+        self.assertListEqual(result, [i * 2 for i in range(100)])
+
+    def test_parallel_runs_on_shared_threads(self):
+        threads = set()
+
+        def record(x):
+            threads.add(threading.current_thread().name)
+            return x
+
+        for _ in range(3):
+            Parallel(n_jobs=2)(delayed(record)(i) for i in range(50))
+        self.assertLessEqual(len(threads), 2)
+        self.assertTrue(all(name.startswith("pystreamapi-2") for name in threads))
+
+    def test_parallel_does_not_pickle(self):
+        lock = threading.Lock()
+        result = Parallel(n_jobs=2)(delayed(lambda x, y: (x, y is lock))(i, lock)
+                                    for i in range(4))
+        self.assertListEqual(result, [(0, True), (1, True), (2, True), (3, True)])
+
+    def test_parallel_does_not_use_joblib(self):
+        with patch.dict("sys.modules", {"joblib": None}):
+            result = Parallel(n_jobs=2, prefer="processes")(delayed(str)(i) for i in range(3))
+        self.assertListEqual(result, ["0", "1", "2"])
+
+    def test_nested_parallel_runs_inline(self):
+        def inner(x):
+            return sum(Parallel(n_jobs=2)(delayed(lambda y: y)(y) for y in range(x)))
+
+        result = Parallel(n_jobs=2)(delayed(inner)(i) for i in range(20))
+        self.assertListEqual(result, [sum(range(i)) for i in range(20)])
+
+    def test_parallel_propagates_exceptions(self):
+        with self.assertRaises(ZeroDivisionError):
+            Parallel(n_jobs=2)(delayed(lambda x: 1 / x)(i) for i in range(3))
+
+    def test_stream_operations(self):
+        result = ParallelStream(range(100)) \
+            .filter(lambda x: x % 2 == 0) \
+            .map(lambda x: x * 3) \
+            .reduce(lambda x, y: x + y)
+        self.assertEqual(result.get(), sum(x * 3 for x in range(0, 100, 2)))
+
+    def test_numeric_terminals(self):
+        self.assertEqual(ParallelNumericStream(list(range(101))).sum(), 5050)
+        self.assertEqual(ParallelNumericStream(list(range(101))).mean(), 50)
+
+    def test_error_level_ignore(self):
+        result = ParallelStream(["1", "a", "2"]) \
+            .error_level(ErrorLevel.IGNORE) \
+            .map(int) \
+            .to_list()
+        self.assertListEqual(result, [1, 2])
@@ -0,0 +1,204 @@
+import asyncio
+import unittest
+
+from pystreamapi import ErrorLevel, Stream
+from pystreamapi.__optional import Optional
+
+
+async def async_range(n):
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield i
+
+
+async def double(x):
+    await asyncio.sleep(0.001 * (5 - x % 5))
+    return x * 2
+
+
+class TestAsyncStream(unittest.IsolatedAsyncioTestCase):
+
+    async def test_to_list_from_sync_iterable(self):
+        self.assertListEqual(await Stream.async_of([1, 2, 3]).to_list(), [1, 2, 3])
+
+    async def test_to_list_from_async_iterable(self):
+        self.assertListEqual(await Stream.async_of(async_range(3)).to_list(), [0, 1, 2])
+
+    async def test_map_with_sync_and_async_mappers(self):
+        result = await Stream.async_of(async_range(5)).map(double).map(str).to_list()
+        self.assertListEqual(result, ['0', '2', '4', '6', '8'])
+
+    async def test_map_concurrent_ordered(self):
+        result = await Stream.async_of(range(20)).map(double, max_concurrency=5).to_list()
+        self.assertListEqual(result, [x * 2 for x in range(20)])
+
+    async def test_map_concurrent_unordered(self):
+        result = await Stream.async_of(range(20)) \
+            .map(double, max_concurrency=5, ordered=False) \
+            .to_list()
+        self.assertNotEqual(result, [x * 2 for x in range(20)])
+        self.assertListEqual(sorted(result), [x * 2 for x in range(20)])
+
+    async def test_map_concurrency_is_bounded(self):
+        running = 0
+        max_running = 0
+
+        async def track(x):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return x
+
+        await Stream.async_of(range(30)).map(track, max_concurrency=4).to_list()
+        self.assertEqual(max_running, 4)
+
+    async def test_map_runs_concurrently(self):
+        async def slow(x):
+            await asyncio.sleep(0.05)
+            return x
+
+        start = asyncio.get_running_loop().time()
+        await Stream.async_of(range(20)).map(slow, max_concurrency=20).to_list()
+        self.assertLess(asyncio.get_running_loop().time() - start, 0.5)
+
+    async def test_map_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            await Stream.async_of([1]).map(double, max_concurrency=0).to_list()
+
+    async def test_map_consumes_source_lazily(self):
+        consumed = []
+
+        async def source():
+            for i in range(1000):
+                consumed.append(i)
+                yield i
+
+        first = await Stream.async_of(source()).map(double, max_concurrency=3).find_first()
+        self.assertEqual(first, Optional.of(0))
+        self.assertLessEqual(len(consumed), 3)
+
+    async def test_filter(self):
+        async def is_even(x):
+            await asyncio.sleep(0)
+            return x % 2 == 0
+
+        result = await Stream.async_of(range(10)).filter(is_even, max_concurrency=3).to_list()
+        self.assertListEqual(result, [0, 2, 4, 6, 8])
+
+    async def test_filter_unordered(self):
+        result = await Stream.async_of(range(10)) \
+            .filter(lambda x: x > 4, max_concurrency=3, ordered=False) \
+            .to_set()
+        self.assertSetEqual(result, {5, 6, 7, 8, 9})
+
+    async def test_flat_map(self):
+        async def expand(x):
+            return Stream.async_of(async_range(x))
+
+        result = await Stream.async_of([1, 2, 3]).flat_map(expand).flat_map(lambda x: [x, x]) \
+            .to_list()
+        self.assertListEqual(result, [0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 2, 2])
+
+    async def test_peek_distinct_skip_limit(self):
+        seen = []
+
+        async def record(x):
+            seen.append(x)
+
+        result = await Stream.async_of([1, 1, 2, 3, 3, 4, 5]) \
+            .distinct() \
+            .peek(record) \
+            .skip(1) \
+            .limit(2) \
+            .to_tuple()
+        self.assertTupleEqual(result, (2, 3))
+        self.assertListEqual(seen, [1, 2, 3])
+
+    async def test_limit_zero(self):
+        self.assertListEqual(await Stream.async_of(range(3)).limit(0).to_list(), [])
+
+    async def test_for_each(self):
+        out = []
+
+        async def append(x):
+            await asyncio.sleep(0.001 * (3 - x))
+            out.append(x)
+
+        await Stream.async_of(range(4)).for_each(append, max_concurrency=4)
+        self.assertListEqual(sorted(out), [0, 1, 2, 3])
+
+    async def test_reduce(self):
+        async def add(x, y):
+            return x + y
+
+        self.assertEqual(await Stream.async_of(range(5)).reduce(add), Optional.of(10))
+        self.assertEqual(await Stream.async_of(range(5)).reduce(add, identity=0), 10)
+
+    async def test_reduce_empty(self):
+        self.assertEqual(await Stream.async_of([]).reduce(lambda x, y: x + y), Optional.empty())
+        self.assertEqual(await Stream.async_of([]).reduce(lambda x, y: x + y, identity=0), 0)
+
+    async def test_count(self):
+        self.assertEqual(await Stream.async_of(async_range(7)).filter(lambda x: x % 2).count(), 3)
+
+    async def test_find_first_empty(self):
+        self.assertEqual(await Stream.async_of([]).find_first(), Optional.empty())
+
+    async def test_async_for(self):
+        result = [x async for x in Stream.async_of(async_range(3)).map(double)]
+        self.assertListEqual(result, [0, 2, 4])
+
+    async def test_error_level_raise(self):
+        async def fail(x):
+            raise ValueError(x)
+
+        with self.assertRaises(ValueError):
+            await Stream.async_of([1, 2]).map(fail, max_concurrency=2).to_list()
+
+    async def test_error_cancels_and_awaits_pending_tasks(self):
+        async def fail_first(x):
+            if x == 0:
+                raise ValueError(x)
+            await asyncio.sleep(1)
+            return x
+
+        with self.assertRaises(ValueError):
+            await Stream.async_of(range(5)).map(fail_first, max_concurrency=5).to_list()
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        self.assertListEqual(pending, [])
+
+    async def test_error_level_is_named(self):
+        stream = Stream.async_of([1]).error_level(ErrorLevel.IGNORE)
+        processes = stream._queue.get_queue()  # pylint: disable=protected-access
+        self.assertEqual(processes[-1].name, "error_level")
+        await stream.to_list()
+        with self.assertRaises(RuntimeError):
+            stream.error_level(ErrorLevel.RAISE)
+
+    async def test_error_level_ignore(self):
+        async def invert(x):
+            return 1 / x
+
+        result = await Stream.async_of([1, 0, 2]) \
+            .error_level(ErrorLevel.IGNORE) \
+            .map(invert, max_concurrency=2) \
+            .to_list()
+        self.assertListEqual(result, [1.0, 0.5])
+
+    async def test_error_level_warn(self):
+        with self.assertLogs(level='WARNING'):
+            result = await Stream.async_of(['1', 'a']) \
+                .error_level(ErrorLevel.WARN) \
+                .filter(lambda x: int(x) > 0) \
+                .to_list()
+        self.assertListEqual(result, ['1'])
+
+    async def test_stream_closed_after_terminal(self):
+        stream = Stream.async_of([1])
+        await stream.to_list()
+        with self.assertRaises(RuntimeError):
+            await stream.to_list()
+        with self.assertRaises(RuntimeError):
+            stream.map(str)
@@ -1,7 +1,10 @@
 # pylint: disable=protected-access
 import itertools
+import threading
+import time
 import unittest
 
+from pystreamapi import ErrorLevel
 from pystreamapi.__optional import Optional
 from pystreamapi.__stream import Stream
 from pystreamapi._streams.__parallel_stream import ParallelStream
@@ -240,6 +243,11 @@ class TestBaseStream(unittest.TestCase):
         result = Stream.of([1, 2, "3", None]).count()
         self.assertEqual(result, 4)
 
+    def test_count_lazy_source(self):
+        result = Stream.of(itertools.count()).limit(5).filter(lambda x: x % 2 == 0).count()
+        self.assertEqual(result, 3)
+        self.assertEqual(Stream.of(iter([1, 2])).count(), 2)
+
     def test_any_match(self):
         result = Stream.of([1, 2, 3, 9]).any_match(lambda x: x > 3)
         self.assertTrue(result)
@@ -293,5 +301,70 @@ class TestBaseStream(unittest.TestCase):
         self.assertSetEqual(result, {1, 2, 3, 9})
 
 
+    def test_map_concurrent_runs_in_parallel(self):
+        def slow(x):
+            time.sleep(0.05)
+            return x
+
+        start = time.perf_counter()
+        Stream.of(range(20)).map_concurrent(slow, max_workers=20).to_list()
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_map_concurrent_is_bounded(self):
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def track(x):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.001)
+            with lock:
+                running -= 1
+            return x
+
+        Stream.of(range(40)).map_concurrent(track, max_workers=3).for_each(lambda x: None)
+        self.assertLessEqual(max_running, 3)
+
+    def test_map_concurrent_consumes_source_lazily(self):
+        consumed = []
+
+        def source():
+            for i in range(1000):
+                consumed.append(i)
+                yield i
+
+        result = iter(Stream.of(source()).map_concurrent(str, max_workers=2))
+        self.assertEqual(next(result), "0")
+        self.assertLessEqual(len(consumed), 4)
+
+    def test_map_concurrent_reuses_thread_pool(self):
+        threads = set()
+
+        def record(x):
+            threads.add(threading.current_thread().name)
+            return x
+
+        for _ in range(3):
+            Stream.of(range(20)).map_concurrent(record, max_workers=2).to_list()
+        self.assertLessEqual(len(threads), 2)
+
+    def test_map_concurrent_with_error_level(self):
+        result = Stream.of([1, 0, 2]) \
+            .error_level(ErrorLevel.IGNORE) \
+            .map_concurrent(lambda x: 1 / x, max_workers=2) \
+            .to_list()
+        self.assertListEqual(result, [1.0, 0.5])
+
+    def test_map_concurrent_raises(self):
+        with self.assertRaises(ZeroDivisionError):
+            Stream.of([1, 0]).map_concurrent(lambda x: 1 / x, max_workers=2).to_list()
+
+    def test_map_concurrent_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            Stream.of([1]).map_concurrent(str, max_workers=0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,61 @@
+import io
+import unittest
+
+from pystreamapi import Stream
+from pystreamapi._streams.__sequential_stream import SequentialStream
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+class TestExplain(unittest.TestCase):
+
+    @staticmethod
+    def explain(stream, analyze=False):
+        out = io.StringIO()
+        stream.explain(analyze=analyze, file=out)
+        return out.getvalue()
+
+    def test_explain_plan(self):
+        stream = SequentialStream(list(range(5000))).filter(is_even).map(str).limit(3)
+        self.assertEqual(self.explain(stream), (
+            "Implementation: ParallelStream (parallelism recommended: "
+            "filter on 5000 elements, more than 3000)\n"
+            "Source: list of 5000 elements\n"
+            "Stages:\n"
+            "  1. filter(is_even)\n"
+            "  2. map(str)\n"
+            "  3. limit(3)\n"
+        ))
+
+    def test_explain_does_not_run_or_close_stream(self):
+        consumed = []
+        stream = SequentialStream([1, 2, 3]).peek(consumed.append)
+        plan = self.explain(stream)
+        self.assertIn("Source: list of 3 elements", plan)
+        self.assertListEqual(consumed, [])
+        self.assertIsInstance(stream, SequentialStream)
+        self.assertListEqual(stream.to_list(), [1, 2, 3])
+
+    def test_explain_unknown_size(self):
+        plan = self.explain(Stream.of(iter([1])).map(str))
+        self.assertIn("the size of the source is unknown", plan)
+        self.assertIn("of unknown size", plan)
+
+    def test_explain_analyze(self):
+        stream = SequentialStream(iter(range(10))).filter(is_even).map(str)
+        plan = self.explain(stream, analyze=True).splitlines()
+        self.assertTrue(plan[0].startswith("Implementation: SequentialStream"))
+        self.assertIn("wall ms", plan[1])
+        rows = {line.split()[0]: line.split()[1:3] for line in plan[3:-1]}
+        self.assertListEqual(rows["source"], ["-", "10"])
+        self.assertListEqual(rows["filter"], ["10", "5"])
+        self.assertListEqual(rows["map"], ["5", "5"])
+        self.assertListEqual(rows["explain"], ["5", "-"])
+
+    def test_explain_analyze_closes_stream(self):
+        stream = SequentialStream([1, 2])
+        self.explain(stream, analyze=True)
+        with self.assertRaises(RuntimeError):
+            stream.to_list()
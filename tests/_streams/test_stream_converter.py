@@ -112,3 +112,31 @@ class TestStreamConverter(TestCase):
 
         sum_result = result.sum()
         self.assertEqual(sum_result, 55)
+
+    def test_explain_implementation_recommended(self):
+        stream = SequentialStream(list(range(5000))).filter(lambda x: x > 1)
+        name, reason = StreamConverter.explain_implementation(stream)
+        self.assertEqual(name, "ParallelStream")
+        self.assertEqual(reason,
+                         "parallelism recommended: filter on 5000 elements, more than 3000")
+        self.assertIsInstance(stream, SequentialStream)
+
+    def test_explain_implementation_numeric_recommended(self):
+        stream = SequentialNumericStream(list(range(5000))).filter(lambda x: x > 1)
+        self.assertEqual(StreamConverter.explain_implementation(stream)[0],
+                         "ParallelNumericStream")
+
+    @parameterized.expand([
+        ("no filter", SequentialStream(list(range(5000))).map(str),
+         "parallelism not recommended: the pipeline has no filter"),
+        ("small source", SequentialStream([1, 2]).filter(bool),
+         "parallelism not recommended: filter on 2 elements, not more than 3000"),
+        ("unsized source", SequentialStream(iter([1, 2])).filter(bool),
+         "parallelism not recommended: the size of the source is unknown"),
+        ("parallel source", ParallelStream([1, 2]), "created as a parallel stream"),
+        ("explicit", SequentialStream(list(range(5000))).sequential().filter(bool),
+         "chosen explicitly with parallel() or sequential()"),
+    ])
+    def test_explain_implementation_reasons(self, _, stream, reason):
+        self.assertEqual(StreamConverter.explain_implementation(stream),
+                         (type(stream).__name__, reason))
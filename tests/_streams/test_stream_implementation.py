@@ -1,8 +1,10 @@
 import itertools
 import unittest
+from collections import defaultdict
 
 from parameterized import parameterized_class
 
+from pystreamapi import ErrorLevel, collectors
 from pystreamapi.__optional import Optional
 from pystreamapi._streams.__base_stream import BaseStream
 from pystreamapi._streams.__parallel_stream import ParallelStream
@@ -44,6 +46,115 @@ class TestStreamImplementation(unittest.TestCase):
         result = self.stream(["1", "2", "3", "9"]).map(int).map(str).to_list()
         self.assertListEqual(result, ["1", "2", "3", "9"])
 
+    def test_map_cached(self):
+        calls = []
+
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        result = self.stream([1, 2, 1, 3, 2, 1] * 50).map_cached(square).to_list()
+        self.assertListEqual(result, [1, 4, 1, 9, 4, 1] * 50)
+        self.assertLess(len(calls), 20)
+
+    def test_map_cached_key(self):
+        result = self.stream(["a", "B", "b", "A"]).map_cached(str.upper, key=str.lower).to_list()
+        self.assertListEqual(result, ["A", "B", "B", "A"])
+
+    def test_collect(self):
+        result = self.stream(list(range(100))).collect(collectors.counting())
+        self.assertEqual(result, 100)
+
+    def test_collect_several(self):
+        result = self.stream(list(range(100))).filter(lambda x: x % 3 != 0).collect(
+            collectors.counting(),
+            collectors.min_by(),
+            collectors.max_by(),
+            collectors.grouping_by(lambda x: x % 3, collectors.counting()),
+            collectors.collecting_and_then(collectors.to_set(), len),
+            collectors.top_k(2),
+            collectors.joining(","))
+        self.assertEqual(result[:6], (66, Optional.of(1), Optional.of(98), {1: 33, 2: 33}, 66,
+                                      [98, 97]))
+        self.assertEqual(result[6], ",".join(str(x) for x in range(100) if x % 3 != 0))
+
+    def test_collect_generator(self):
+        result = self.stream(finite_generator()).collect(collectors.summing())
+        self.assertEqual(result, sum(range(200)))
+
+    def test_collect_empty(self):
+        self.assertEqual(self.stream([]).collect(collectors.to_list(), collectors.averaging()),
+                         ([], None))
+
+    def test_collect_ignores_errors(self):
+        result = self.stream(["1", "a", "3"]).error_level(ErrorLevel.IGNORE) \
+            .collect(collectors.summing(int))
+        self.assertEqual(result, 4)
+
+    def test_collect_several_handles_errors_per_collector(self):
+        result = self.stream(list(range(10))).error_level(ErrorLevel.IGNORE) \
+            .collect(collectors.to_list(), collectors.summing(lambda x: 1 / (x - 5)),
+                     collectors.counting())
+        self.assertEqual(result[0], list(range(10)))
+        self.assertAlmostEqual(result[1], sum(1 / (x - 5) for x in range(10) if x != 5))
+        self.assertEqual(result[2], 10)
+
+    def test_collect_without_collectors(self):
+        self.assertRaises(ValueError, self.stream([1]).collect)
+
+    def test_tee(self):
+        first, second, third = self.stream(finite_generator()).map(lambda x: x + 1).tee(3)
+        self.assertEqual(first.to_list(), list(range(1, 201)))
+        self.assertEqual(second.filter(lambda x: x > 100).to_list(), list(range(101, 201)))
+        self.assertEqual(third.map(str).to_tuple()[-1], "200")
+
+    def test_tee_count_sum_and_group_by(self):
+        counted, summed, grouped = self.stream(finite_generator()).tee(3, buffer_size=10)
+        self.assertEqual(counted.filter(lambda x: x >= 150).count(), 50)
+        self.assertEqual(summed.map_to_int().sum(), sum(range(200)))
+        self.assertEqual(dict(grouped.group_by(lambda x: x % 2).to_list())[0],
+                         list(range(0, 200, 2)))
+
+    def test_tee_spills(self):
+        first, second = self.stream(finite_generator()).tee(buffer_size=10)
+        self.assertEqual(first.to_list(), list(range(200)))
+        self.assertEqual(second.to_list(), list(range(200)))
+
+    def test_tee_keeps_numeric_streams(self):
+        first, second = self.stream([1, 2, 3]).map_to_int().tee()
+        self.assertIsInstance(first, NumericBaseStream)
+        self.assertEqual(first.sum(), 6)
+        self.assertIsInstance(second, SequentialNumericStream)
+
+    def test_tee_closes_stream(self):
+        stream = self.stream([1, 2])
+        stream.tee()
+        self.assertRaises(RuntimeError, stream.to_list)
+
+    def test_map_concurrent_keeps_order(self):
+        result = self.stream(range(50)).map_concurrent(lambda x: x * 2, max_workers=4).to_list()
+        self.assertListEqual(result, [x * 2 for x in range(50)])
+
+    def test_map_concurrent_unordered(self):
+        result = self.stream(range(50)) \
+            .map_concurrent(lambda x: x * 2, max_workers=4, ordered=False) \
+            .to_list()
+        self.assertListEqual(sorted(result), [x * 2 for x in range(50)])
+
+    def test_map_concurrent_then_filter(self):
+        result = self.stream(range(50)).map_concurrent(lambda x: x * 2, max_workers=4) \
+            .filter(lambda x: x % 3 == 0).to_list()
+        self.assertListEqual(result, [x * 2 for x in range(50) if x % 3 == 0])
+
+    def test_map_concurrent_then_collect(self):
+        result = self.stream(range(50)).map_concurrent(lambda x: x * 2, max_workers=4) \
+            .collect(collectors.summing())
+        self.assertEqual(result, sum(range(50)) * 2)
+
+    def test_map_concurrent_infinite_generator(self):
+        result = self.stream(throwing_generator()).map_concurrent(str, max_workers=2).limit(3)
+        self.assertListEqual(result.to_list(), ["0", "1", "2"])
+
     def test_map_to_int(self):
         result = self.stream(["1", "2", "3", "9"]).map_to_int().to_list()
         self.assertListEqual(result, [1, 2, 3, 9])
@@ -209,6 +320,21 @@ class TestStreamImplementation(unittest.TestCase):
             .to_dict(lambda p: p.x)
         self.assertDictEqual(result, {1: [pt1, pt2], 2: [pt3, pt4]})
 
+    def test_to_dict_keeps_order(self):
+        result = self.stream(list(range(1000))).to_dict(lambda x: x % 7)
+        self.assertListEqual(list(result), list(range(7)))
+        self.assertListEqual(result[3], list(range(3, 1000, 7)))
+
+    def test_to_dict_ignores_errors(self):
+        result = self.stream([1, 0, 2]).error_level(ErrorLevel.IGNORE).to_dict(lambda x: 1 // x)
+        self.assertDictEqual(result, {1: [1], 0: [2]})
+
+    def test_group_to_dict_is_defaultdict(self):
+        groups = self.stream([1, 2, 3])._group_to_dict(lambda x: x % 2)  # pylint: disable=protected-access
+        self.assertIs(type(groups), defaultdict)
+        self.assertIs(groups.default_factory, list)
+        self.assertDictEqual(groups, {1: [1, 3], 0: [2]})
+
     def test_to_dict_empty(self):
         result = self.stream([]).to_dict(lambda x: x)
         self.assertDictEqual(result, {})
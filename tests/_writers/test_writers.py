@@ -0,0 +1,160 @@
+import gzip
+import os
+import tempfile
+from collections import namedtuple
+from datetime import date
+from unittest import TestCase
+
+from pystreamapi import Stream
+from pystreamapi._streams.__parallel_stream import ParallelStream
+from pystreamapi.loaders import csv as load_csv, jsonl as load_jsonl, xml as load_xml
+from pystreamapi.writers import csv, jsonl, xml
+
+Row = namedtuple('Row', ['id', 'name', 'active'])
+ROWS = [Row(1, 'a', True), Row(2, 'b, "c"', False)]
+
+
+class WriterTestBase(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.directory.cleanup)
+
+    def _path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def _read(self, name):
+        with open(self._path(name), encoding='utf-8', newline='') as file:
+            return file.read()
+
+
+class TestCsvWriter(WriterTestBase):
+
+    def test_csv_writer(self):
+        self.assertEqual(csv(ROWS, self._path('data.csv')), 2)
+        self.assertEqual(self._read('data.csv'),
+                         'id,name,active\r\n1,a,True\r\n2,"b, ""c""",False\r\n')
+
+    def test_csv_writer_roundtrip(self):
+        csv(ROWS, self._path('data.csv'))
+        self.assertListEqual(list(load_csv(self._path('data.csv'))), ROWS)
+
+    def test_csv_writer_with_fields_and_delimiter(self):
+        csv([{'id': 1, 'name': 'a'}, ROWS[1]], self._path('data.csv'), delimiter=';',
+            fields=['name', 'missing'])
+        self.assertEqual(self._read('data.csv'), 'name;missing\r\na;\r\n"b, ""c""";\r\n')
+
+    def test_csv_writer_without_header(self):
+        csv(iter([[1, 2], (3, 4), 5]), self._path('data.csv'), header=False)
+        self.assertEqual(self._read('data.csv'), '1,2\r\n3,4\r\n5\r\n')
+
+    def test_csv_writer_empty(self):
+        self.assertEqual(csv([], self._path('data.csv')), 0)
+        self.assertEqual(self._read('data.csv'), '')
+
+    def test_csv_writer_with_gzip(self):
+        csv(ROWS, self._path('data.csv.gz'))
+        with gzip.open(self._path('data.csv.gz'), 'rt') as file:
+            self.assertTrue(file.read().startswith('id,name,active'))
+        self.assertListEqual(list(load_csv(self._path('data.csv.gz'))), ROWS)
+
+    def test_csv_writer_with_explicit_compression(self):
+        csv(ROWS, self._path('data.csv'), compression='bz2')
+        self.assertListEqual(list(load_csv(self._path('data.csv'))), ROWS)
+
+    def test_csv_writer_with_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            csv(ROWS, self._path('data.csv'), compression='rar')
+
+    def test_csv_writer_many_rows(self):
+        rows = ((i, str(i)) for i in range(2500))
+        self.assertEqual(csv(rows, self._path('data.csv'), fields=['a', 'b']), 2500)
+        self.assertEqual(len(list(load_csv(self._path('data.csv')))), 2500)
+
+
+class TestJsonlWriter(WriterTestBase):
+
+    def test_jsonl_writer(self):
+        rows = [ROWS[0], {'nested': [Row(3, 'ä', None)], 'day': date(2026, 1, 2)}, 4]
+        self.assertEqual(jsonl(rows, self._path('data.jsonl')), 3)
+        self.assertEqual(self._read('data.jsonl'),
+                         '{"id": 1, "name": "a", "active": true}\n'
+                         '{"nested": [{"id": 3, "name": "ä", "active": null}], '
+                         '"day": "2026-01-02"}\n'
+                         '4\n')
+
+    def test_jsonl_writer_roundtrip_with_xz(self):
+        jsonl(ROWS, self._path('data.jsonl.xz'))
+        self.assertListEqual([tuple(item) for item in load_jsonl(self._path('data.jsonl.xz'))],
+                             [tuple(row) for row in ROWS])
+
+    def test_jsonl_writer_empty(self):
+        self.assertEqual(jsonl(iter([]), self._path('data.jsonl')), 0)
+        self.assertEqual(self._read('data.jsonl'), '')
+
+
+class TestXmlWriter(WriterTestBase):
+
+    def test_xml_writer(self):
+        rows = [ROWS[1], {'tags': ['x', 'y'], 'empty': None, 'child': {'a': '<1>'}}]
+        self.assertEqual(xml(rows, self._path('data.xml'), root_tag='rows', row_tag='row'), 2)
+        self.assertEqual(self._read('data.xml'),
+                         '<?xml version="1.0" encoding="utf-8"?>\n<rows>\n'
+                         '<row><id>2</id><name>b, "c"</name><active>false</active></row>\n'
+                         '<row><tags>x</tags><tags>y</tags><empty/>'
+                         '<child><a>&lt;1&gt;</a></child></row>\n'
+                         '</rows>\n')
+
+    def test_xml_writer_roundtrip(self):
+        xml(ROWS, self._path('data.xml'))
+        self.assertListEqual([tuple(item) for item in load_xml(self._path('data.xml'))],
+                             [tuple(row) for row in ROWS])
+
+    def test_xml_writer_with_invalid_field_names(self):
+        for key in ('first name', '1st', '<id>', 1):
+            with self.assertRaises(ValueError):
+                xml([{key: 'value'}], self._path('data.xml'))
+
+    def test_xml_writer_with_invalid_tag(self):
+        with self.assertRaises(ValueError):
+            xml(ROWS, self._path('data.xml'), row_tag='a row')
+
+    def test_xml_writer_empty(self):
+        self.assertEqual(xml([], self._path('data.xml')), 0)
+        self.assertEqual(self._read('data.xml'),
+                         '<?xml version="1.0" encoding="utf-8"?>\n<root>\n</root>\n')
+
+
+class TestStreamWriters(WriterTestBase):
+
+    def test_to_csv(self):
+        count = Stream.of(load_csv(self._path_with(ROWS))) \
+            .filter(lambda row: row.active) \
+            .to_csv(self._path('out.csv'))
+        self.assertEqual(count, 1)
+        self.assertListEqual(list(load_csv(self._path('out.csv'))), ROWS[:1])
+
+    def test_to_csv_parallel(self):
+        ParallelStream(range(10)).map(lambda x: (x, x * x)).to_csv(
+            self._path('out.csv.gz'), fields=['x', 'square'])
+        data = list(load_csv(self._path('out.csv.gz')))
+        self.assertEqual(data[9], (9, 81))
+
+    def test_to_jsonl(self):
+        self.assertEqual(Stream.of(ROWS).to_jsonl(self._path('out.jsonl')), 2)
+        self.assertEqual(next(load_jsonl(self._path('out.jsonl'))).name, 'a')
+
+    def test_to_xml(self):
+        self.assertEqual(Stream.of(ROWS).map(Row._asdict).to_xml(self._path('out.xml')), 2)
+        self.assertEqual(list(load_xml(self._path('out.xml')))[1].id, 2)
+
+    def test_to_csv_closes_stream(self):
+        stream = Stream.of(ROWS)
+        stream.to_csv(self._path('out.csv'))
+        with self.assertRaises(RuntimeError):
+            stream.to_list()
+
+    def _path_with(self, rows):
+        path = self._path('in.csv')
+        csv(rows, path)
+        return path
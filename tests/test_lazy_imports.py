@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import pystreamapi
+import pystreamapi.loaders
+from pystreamapi._parallel.parallelizer import FREE_THREADED
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(pystreamapi.__file__)))
+BACKENDS = ['joblib', 'ijson', 'defusedxml', 'yaml', 'tomlkit', 'asyncio', 'opentelemetry']
+
+
+def run_in_fresh_interpreter(code, modules=None):
+    """Run code in a new interpreter and return the backends (or modules) that were imported"""
+    modules = modules or BACKENDS
+    script = f"import sys\n{code}\nprint(','.join(m for m in {modules!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True,
+                            text=True, cwd=PROJECT_ROOT).stdout
+    return [m for m in output.strip().split(',') if m]
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_import_does_not_load_backends(self):
+        self.assertListEqual(
+            run_in_fresh_interpreter("import pystreamapi, pystreamapi.loaders, pystreamapi.hooks"),
+            [])
+
+    def test_import_does_not_load_executors_and_pipeline(self):
+        self.assertListEqual(run_in_fresh_interpreter(
+            "import pystreamapi\n"
+            "from pystreamapi import Stream\n"
+            "Stream.of(range(10)).map(str).to_list()",
+            ['concurrent.futures', 'pystreamapi.__pipeline']), [])
+
+    def test_sequential_stream_does_not_load_joblib(self):
+        self.assertListEqual(run_in_fresh_interpreter(
+            "from pystreamapi import Stream\n"
+            "Stream.of(range(10)).filter(lambda x: x % 2).map(str).to_list()"), [])
+
+    @unittest.skipIf(FREE_THREADED, "Free-threaded builds run parallel streams on threads")
+    def test_parallel_stream_loads_joblib(self):
+        self.assertIn('joblib', run_in_fresh_interpreter(
+            "from pystreamapi import Stream\n"
+            "Stream.parallel_of([1, 2, 3]).map(str).to_list()"))
+
+    def test_loader_loads_only_its_backend(self):
+        self.assertListEqual(run_in_fresh_interpreter(
+            "from pystreamapi.loaders import json\n"
+            "list(json('[1]', read_from_src=True))"), ['ijson'])
+
+    def test_async_stream_loads_asyncio(self):
+        self.assertListEqual(run_in_fresh_interpreter(
+            "from pystreamapi import Stream\n"
+            "Stream.async_of([1, 2, 3])"), ['asyncio'])
+
+    def test_free_threaded_parallel_stream_does_not_load_joblib(self):
+        self.assertListEqual(run_in_fresh_interpreter(
+            "import pystreamapi._parallel.parallelizer as parallelizer\n"
+            "parallelizer.FREE_THREADED = True\n"
+            "from pystreamapi import Stream\n"
+            "Stream.parallel_of([1, 2, 3]).map(str).to_list()"), [])
+
+    def test_unknown_loader(self):
+        with self.assertRaises(AttributeError):
+            _ = pystreamapi.loaders.unknown
+
+    def test_loaders_dir(self):
+        self.assertIn('jsonl', dir(pystreamapi.loaders))
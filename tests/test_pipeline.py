@@ -0,0 +1,147 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pystreamapi import ErrorLevel, Pipeline, Stream
+from pystreamapi._streams.__sequential_stream import SequentialStream
+from pystreamapi._streams.numeric.__sequential_numeric_stream import SequentialNumericStream
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_apply_to_many_sources(self):
+        pipeline = Pipeline().filter(is_even).map(lambda x: x * 10)
+        self.assertEqual(pipeline.to_list([1, 2, 3, 4]), [20, 40])
+        self.assertEqual(pipeline.to_list(range(7)), [0, 20, 40, 60])
+        self.assertEqual(list(pipeline(iter([6]))), [60])
+
+    def test_operations_return_new_pipelines(self):
+        base = Pipeline().map(str)
+        limited = base.limit(1)
+        self.assertIsNot(base, limited)
+        self.assertEqual(base.to_list([1, 2]), ["1", "2"])
+        self.assertEqual(limited.to_list([1, 2]), ["1"])
+
+    def test_same_results_as_stream(self):
+        source = [3, "1", 4, 1, 5, 9, 2, 6, 5, 3, 5]
+        pipeline = (Pipeline().map_to_int().distinct().sorted(lambda a, b: b - a).skip(1)
+                    .limit(5).peek(lambda x: None).drop_while(lambda x: x > 6)
+                    .take_while(lambda x: x > 1).flat_map(lambda x: [x, -x]).reversed())
+        expected = (Stream.of(source).map_to_int().distinct().sorted(lambda a, b: b - a).skip(1)
+                    .limit(5).peek(lambda x: None).drop_while(lambda x: x > 6)
+                    .take_while(lambda x: x > 1).flat_map(lambda x: Stream.of([x, -x]))
+                    .reversed().to_list())
+        self.assertEqual(pipeline.to_list(source), expected)
+
+    def test_group_by(self):
+        pipeline = Pipeline().group_by(is_even)
+        self.assertEqual(dict(pipeline.apply(range(5))), {True: [0, 2, 4], False: [1, 3]})
+
+    def test_apply_is_lazy(self):
+        seen = []
+        iterator = Pipeline().peek(seen.append).sorted().apply([2, 1])
+        self.assertEqual(seen, [])
+        self.assertEqual(next(iterator), 1)
+        self.assertEqual(seen, [2, 1])
+
+    def test_error_level_applies_to_whole_pipeline(self):
+        pipeline = Pipeline().error_level(ErrorLevel.IGNORE).map(int).filter(lambda x: 10 / x)
+        self.assertEqual(pipeline.to_list(["1", "a", "0", "2"]), [1, 2])
+        source = ["a", "1"]
+        self.assertEqual(Pipeline().map(int).error_level(ErrorLevel.IGNORE).to_list(source),
+                         Stream.of(source).map(int).error_level(ErrorLevel.IGNORE).to_list())
+
+    def test_error_level_ignores_given_exceptions_only(self):
+        pipeline = Pipeline().error_level(ErrorLevel.IGNORE, ValueError).map(int)
+        self.assertEqual(pipeline.to_list(["1", "a"]), [1])
+        self.assertRaises(TypeError, pipeline.to_list, [None])
+
+    def test_last_error_level_applies(self):
+        pipeline = (Pipeline().error_level(ErrorLevel.IGNORE).map(int)
+                    .error_level(ErrorLevel.RAISE).map(lambda x: 1 / x))
+        self.assertRaises(ValueError, pipeline.to_list, ["a", "1"])
+        self.assertEqual(pipeline.error_level(ErrorLevel.IGNORE).to_list(["a", "0", "1"]), [1.0])
+
+    def test_skip_negative(self):
+        self.assertRaises(ValueError, Pipeline().skip, -1)
+
+    def test_adjacent_operations_are_merged(self):
+        pipeline = Pipeline().skip(1).skip(2).skip(0).limit(5).limit(3).distinct().distinct()
+        self.assertEqual(len(pipeline.compile()[0]), 3)
+        self.assertEqual(pipeline.to_list(range(10)), [3, 4, 5])
+
+    def test_compiled_once(self):
+        pipeline = Pipeline().map(str)
+        self.assertIs(pipeline.compile(), pipeline.compile())
+
+    def test_compiled_once_from_several_threads(self):
+        pipeline = Pipeline().map_cached(str)
+        barrier = threading.Barrier(8)
+
+        def compile_pipeline(_):
+            barrier.wait(timeout=5)
+            return pipeline.compile()
+
+        with ThreadPoolExecutor(8) as executor:
+            compiled = list(executor.map(compile_pipeline, range(8)))
+        for result in compiled:
+            self.assertIs(result, compiled[0])
+
+    def test_stream(self):
+        self.assertIsInstance(Pipeline().map(str).stream([1]), SequentialStream)
+        numeric = Pipeline().map_to_int().stream(["1", "2"])
+        self.assertIsInstance(numeric, SequentialNumericStream)
+        self.assertEqual(numeric.sum(), 3)
+        self.assertNotIsInstance(Pipeline().map_to_float().map_to_str().stream([1]),
+                                 SequentialNumericStream)
+
+    def test_stream_count(self):
+        clean = Pipeline().error_level(ErrorLevel.IGNORE).map(int).filter(is_even).limit(2)
+        self.assertEqual(clean.stream(["1", "2", "x", "4", "6"]).count(), 2)
+        self.assertEqual(clean.stream([]).count(), 0)
+
+    def test_map_cached_shares_cache_between_sources(self):
+        calls = []
+        pipeline = Pipeline().map_cached(lambda x: calls.append(x) or -x)
+        self.assertEqual(pipeline.to_list([1, 2, 1]), [-1, -2, -1])
+        self.assertEqual(pipeline.to_list([2, 3]), [-2, -3])
+        self.assertEqual(calls, [1, 2, 3])
+
+    def test_map_concurrent(self):
+        pipeline = Pipeline().map_concurrent(lambda x: x * 2, max_workers=3)
+        self.assertEqual(pipeline.to_list(range(20)), [x * 2 for x in range(20)])
+        unordered = Pipeline().map_concurrent(lambda x: x * 2, max_workers=3, ordered=False)
+        self.assertEqual(sorted(unordered.to_list(range(20))), [x * 2 for x in range(20)])
+
+    def test_map_concurrent_error_level(self):
+        pipeline = Pipeline().error_level(ErrorLevel.IGNORE).map_concurrent(int, max_workers=2)
+        self.assertEqual(pipeline.to_list(["1", "a", "3"]), [1, 3])
+
+    def test_map_concurrent_invalid_workers(self):
+        self.assertRaises(ValueError, Pipeline().map_concurrent, str, 0)
+
+    def test_apply_from_several_threads(self):
+        barrier = threading.Barrier(4)
+
+        def wait(x):
+            if x == 0:
+                barrier.wait(timeout=5)
+            return x
+
+        pipeline = Pipeline().map(wait).filter(is_even).map(lambda x: x + 1).distinct()
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(pipeline.to_list,
+                                        [range(n * 100) for n in range(1, 5)]))
+        for n, result in enumerate(results, 1):
+            self.assertEqual(result, list(range(1, n * 100, 2)))
+
+    def test_repr(self):
+        self.assertEqual(repr(Pipeline().map(str).limit(1)), "Pipeline(map -> limit)")
+
+
+if __name__ == '__main__':
+    unittest.main()